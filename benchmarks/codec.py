@@ -0,0 +1,55 @@
+"""
+Compares the JSON codec with the standard library on search and license pages.
+
+    python -m benchmarks.codec --records 500
+"""
+
+import argparse
+import json
+import random
+import timeit
+
+from shutterstock.utils import codec
+
+from .payloads import image_search, license_list
+
+
+def best(function, number):
+    """
+    :return: Best time of one call, in seconds, over five repeats.
+    """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=500, help="Results per page")
+    parser.add_argument("--number", type=int, default=20, help="Calls per repeat")
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"codec: {codec.NAME}")
+    for name, data in (
+        ("images search", image_search(args.records)),
+        ("license list", license_list(args.records)),
+    ):
+        body = json.dumps(data).encode("utf-8")
+        cases = (
+            ("loads", lambda: json.loads(body), lambda: codec.loads(body)),
+            (
+                "dumps",
+                lambda: json.dumps(data, separators=(",", ":")),
+                lambda: codec.dumps(data),
+            ),
+        )
+        for operation, baseline, candidate in cases:
+            stdlib = best(baseline, args.number)
+            accelerated = best(candidate, args.number)
+            print(
+                f"{name:14} {operation}  {len(body) / 2**20:5.2f} MB"
+                f"  json {stdlib * 1000:7.2f} ms  {codec.NAME} {accelerated * 1000:7.2f} ms"
+                f"  {stdlib / accelerated:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
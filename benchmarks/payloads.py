@@ -0,0 +1,75 @@
+"""
+Synthetic API responses shaped like real ones, for benchmarks.
+"""
+
+import random
+
+
+def image(index):
+    """
+    :param index: Position of the image in the results.
+    :return: A record shaped like an item of a full view image search.
+    """
+    preview = {"height": 450, "url": f"https://image.shutterstock.com/display_pic_with_logo/{index}.jpg", "width": 600}
+    return {
+        "id": str(1000000000 + index),
+        "aspect": round(random.uniform(0.5, 2.0), 4),
+        "assets": {
+            "preview": preview,
+            "small_thumb": {**preview, "height": 75, "width": 100},
+            "large_thumb": {**preview, "height": 112, "width": 150},
+            "huge_thumb": {**preview, "height": 260, "width": 347},
+            "preview_1000": {**preview, "height": 750, "width": 1000},
+            "preview_1500": {**preview, "height": 1125, "width": 1500},
+        },
+        "contributor": {"id": str(random.randrange(10**6))},
+        "description": "Sailing boats moored in a harbour at sunset, with reflections on calm water",
+        "image_type": "photo",
+        "has_model_release": random.random() < 0.3,
+        "media_type": "image",
+        "categories": [{"id": "18", "name": "Transportation"}, {"id": "13", "name": "Nature"}],
+        "keywords": ["boat", "harbour", "sunset", "sea", "sailing", "reflection", "travel", "water"],
+        "added_date": "2021-06-01",
+    }
+
+
+def image_search(records):
+    """
+    :param records: Number of results on the page.
+    :return: A full view image search response.
+    """
+    return {
+        "data": [image(index) for index in range(records)],
+        "page": 1,
+        "per_page": records,
+        "total_count": 250000,
+        "search_id": "bench",
+    }
+
+
+def license_list(records):
+    """
+    :param records: Number of licenses on the page.
+    :return: An image license list response.
+    """
+    return {
+        "data": [
+            {
+                "id": f"e123{index:08d}",
+                "user": {"username": "jdoe"},
+                "license": "standard",
+                "subscription_id": "s12345678",
+                "download_time": "2021-03-01T12:00:00.000Z",
+                "is_downloadable": random.random() < 0.9,
+                "image": {
+                    "id": str(1000000000 + index),
+                    "format": {"size": "huge"},
+                },
+                "metadata": {"customer_id": "", "geo_location": "", "number_viewed": "", "search_term": "boats"},
+            }
+            for index in range(records)
+        ],
+        "page": 1,
+        "per_page": records,
+        "total_count": 25000,
+    }
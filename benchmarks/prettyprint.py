@@ -0,0 +1,49 @@
+"""
+Compares the colorizing paths of pretty_print on large search pages.
+
+    python -m benchmarks.prettyprint --records 500 --pages 4
+"""
+
+import argparse
+import io
+import random
+import time
+
+from shutterstock.utils.prettyprint import colorize, highlight_with_pygments
+
+from .payloads import image_search
+
+
+def measure(function, data, pages):
+    """
+    :return: Tuple of (seconds, bytes written) for the best of three runs.
+    """
+    best = None
+    for _ in range(3):
+        stream = io.StringIO()
+        start = time.perf_counter()
+        for _ in range(pages):
+            function(data, stream)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(stream.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=500, help="Results per page")
+    parser.add_argument("--pages", type=int, default=4, help="Pages printed per run")
+    args = parser.parse_args()
+    random.seed(0)
+    data = image_search(args.records)
+    results = {
+        "builtin": measure(colorize, data, args.pages),
+        "pygments": measure(highlight_with_pygments, data, args.pages),
+    }
+    for name, (elapsed, size) in results.items():
+        print(f"{name:10} {elapsed * 1000:9.1f} ms  {size / elapsed / 2**20:7.1f} MB/s")
+    print(f"speedup    {results['pygments'][0] / results['builtin'][0]:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
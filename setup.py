@@ -54,8 +54,14 @@ class PublishCommand(Command):
 
 setup(
     name="shutterstock-cli",
-    packages=["shutterstock", "shutterstock.utils"],
-    entry_points={"console_scripts": ["shutterstock = shutterstock.cli:cli"]},
+    packages=["shutterstock", "shutterstock.endpoints", "shutterstock.utils"],
+    entry_points={
+        "console_scripts": [
+            "shutterstock = shutterstock.cli:cli",
+            "shutterstock-client = shutterstock.client:main",
+            "shutterstock-complete = shutterstock.complete:main",
+        ]
+    },
     version=version_ns["__version__"],
     keywords=["shutterstock", "api", "images", "videos", "audio"],
     description="A command-line utility that allows you to interact with the Shutterstock public API.",
@@ -69,6 +75,11 @@ setup(
         "click",
         "pygments",
     ],
+    extras_require={
+        "http2": ["httpx[http2]"],
+        "columnar": ["pyarrow"],
+        "fast": ["orjson"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Console",
@@ -1,62 +1,132 @@
 """
 Shutterstock CLI
 """
-import click
-
-
-from .images import images
-
-from .bulk_search import bulk_search
-
-from .videos import videos
-
-from .audio import audio
-
-from .sfx import sfx
+import importlib
 
-from .editorial import editorial
-
-from .cv import cv
-
-from .catalog import catalog
-
-from .contributors import contributors
-
-from .user import user
-
-from .test import test
+import click
 
+from .utils.settings import settings
+
+# Command groups, imported only when they are invoked: name -> (module:attribute,
+# short help shown by --help without importing the module).
+GROUPS = {
+    "ai-audio": ("shutterstock.ai_audio:ai_audio", "ai_audio group."),
+    "audio": ("shutterstock.audio:audio", "audio group."),
+    "bulk-search": ("shutterstock.bulk_search:bulk_search", "bulk_search group."),
+    "catalog": ("shutterstock.catalog:catalog", "catalog group."),
+    "contributors": ("shutterstock.contributors:contributors", "contributors group."),
+    "cv": ("shutterstock.cv:cv", "cv group."),
+    "editorial": ("shutterstock.editorial:editorial", "editorial group."),
+    "images": ("shutterstock.images:images", "images group."),
+    "sfx": ("shutterstock.sfx:sfx", "sfx group."),
+    "test": ("shutterstock.test:test", "test group."),
+    "user": ("shutterstock.user:user", "user group."),
+    "videos": ("shutterstock.videos:videos", "videos group."),
+}
+
+# Other commands, imported the same way.
+COMMANDS = {
+    "serve": (
+        "shutterstock.serve:serve",
+        "Run a daemon that answers shutterstock-client",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that lists its subcommands up front and imports the module of a
+    subcommand only when it is invoked, so a command pays only for its own group.
+    """
 
-@click.group()
-def cli():
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name][0].split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                rows.append((name, self.commands[name].get_short_help_str()))
+            else:
+                rows.append((name, self.lazy_subcommands[name][1]))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={**GROUPS, **COMMANDS})
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or store reference data in the local response cache",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Fetch reference data from the API and update the local response cache",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    help="Send requests over multiplexed HTTP/2 connections (requires httpx)",
+)
+@click.option(
+    "--output",
+    type=click.File("w", encoding="UTF-8"),
+    help="Write responses to a file instead of stdout",
+)
+@click.option(
+    "--pretty/--compact",
+    default=None,
+    help="Indent the JSON output; by default it is indented only in a terminal",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson", "csv", "parquet", "arrow"]),
+    default="json",
+    help=(
+        "Output format; ndjson writes each item of the data array of list and search"
+        " results on its own line, and csv, parquet and arrow write them as typed"
+        " table rows"
+    ),
+)
+@click.option(
+    "--select",
+    help=(
+        "Comma-separated fields to keep in each result, such as"
+        " id,assets.preview.url,description; sent as the fields parameter when the"
+        " endpoint supports it"
+    ),
+)
+def cli(
+    no_cache, refresh, http2, output, pretty, output_format, select
+):  # pylint: disable=too-many-arguments
     """
     For reference information about the endpoints that this CLI calls, see the API reference.
     http://api-reference.shutterstock.com/
     """
-
-
-cli.add_command(images)
-
-cli.add_command(bulk_search)
-
-cli.add_command(videos)
-
-cli.add_command(audio)
-
-cli.add_command(sfx)
-
-cli.add_command(editorial)
-
-cli.add_command(cv)
-
-cli.add_command(catalog)
-
-cli.add_command(contributors)
-
-cli.add_command(user)
-
-cli.add_command(test)
+    if no_cache:
+        settings.cache = False
+    if http2:
+        settings.http2 = True
+    settings.refresh = refresh
+    settings.output = output
+    settings.pretty = pretty
+    settings.format = output_format
+    settings.select = select
 
 
 if __name__ == "__main__":
-    cli()
+    cli()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,159 @@
+"""
+Thin client of the shutterstock serve daemon.
+
+Forwards its arguments, working directory and SHUTTERSTOCK_* environment
+variables to the daemon over a Unix domain socket, answers the daemon's reads
+of stdin, and writes back the output and exit code of the command. It imports
+neither click nor the network stack, so an invocation costs little more than
+starting the interpreter. When no daemon is listening, the command runs in
+this process instead.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+
+HEADER = struct.Struct(">cI")
+
+# Frame types. The client sends REQUEST once and STDIN in answer to READ; the
+# daemon sends STDOUT and STDERR while the command runs and EXIT at the end.
+REQUEST = b"R"
+READ = b"<"
+STDIN = b"I"
+STDOUT = b"O"
+STDERR = b"E"
+EXIT = b"X"
+
+
+def socket_path():
+    """
+    The socket can be set with the SHUTTERSTOCK_CLI_SOCKET environment variable.
+    :return: str
+    """
+    path = os.getenv("SHUTTERSTOCK_CLI_SOCKET")
+    if path:
+        return path
+    from .utils.paths import cache_dir  # pylint: disable=import-outside-toplevel
+
+    return os.path.join(cache_dir(), "serve.sock")
+
+
+def send_frame(conn, kind, payload=b""):
+    """
+    :param conn: socket.socket
+    :param kind: Frame type.
+    :param payload: bytes
+    :return: None
+    """
+    conn.sendall(HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_exactly(conn, size):
+    """
+    :param conn: socket.socket
+    :param size: Number of bytes to read.
+    :return: bytes, or None if the connection was closed first.
+    """
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_frame(conn):
+    """
+    :param conn: socket.socket
+    :return: Tuple of (type, payload), or (None, b"") if the connection was closed.
+    """
+    header = recv_exactly(conn, HEADER.size)
+    if header is None:
+        return None, b""
+    kind, size = HEADER.unpack(header)
+    payload = recv_exactly(conn, size) if size else b""
+    return (kind, payload) if payload is not None else (None, b"")
+
+
+def connect(path=None):
+    """
+    :param path: Socket path, defaults to socket_path().
+    :return: Connected socket.socket, or None if no daemon is listening.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path or socket_path())
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def run(
+    conn, argv, environ, stdin, stdout, stderr
+):  # pylint: disable=too-many-arguments
+    """
+    Runs a command on the daemon.
+    :param conn: Connected socket.socket
+    :param argv: Arguments of the command.
+    :param environ: Environment of the caller.
+    :param stdin: Binary file the daemon reads stdin from.
+    :param stdout: Binary file the output is written to.
+    :param stderr: Binary file errors are written to.
+    :return: Exit code of the command.
+    """
+    request = {
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "env": {
+            name: value
+            for name, value in environ.items()
+            if name.startswith("SHUTTERSTOCK_")
+        },
+        "tty": {"stdout": stdout.isatty(), "stderr": stderr.isatty()},
+    }
+    send_frame(conn, REQUEST, json.dumps(request).encode("utf-8"))
+    streams = {STDOUT: stdout, STDERR: stderr}
+    while True:
+        kind, payload = recv_frame(conn)
+        if kind in streams:
+            streams[kind].write(payload)
+            streams[kind].flush()
+        elif kind == READ:
+            size = int(payload)
+            send_frame(conn, STDIN, os.read(stdin.fileno(), size) if stdin else b"")
+        elif kind == EXIT:
+            return int(payload)
+        else:
+            stderr.write(b"Error: the shutterstock daemon closed the connection.\n")
+            return 1
+
+
+def main():
+    """
+    Entry point of shutterstock-client.
+    """
+    conn = connect()
+    if conn is None:
+        from .cli import cli  # pylint: disable=import-outside-toplevel
+
+        cli(prog_name="shutterstock")  # pylint: disable=no-value-for-parameter
+        return
+    with conn:
+        code = run(
+            conn,
+            sys.argv[1:],
+            os.environ,
+            sys.stdin.buffer if sys.stdin else None,
+            sys.stdout.buffer,
+            sys.stderr.buffer,
+        )
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Shell completion.
+
+Completes commands, options and option values from an index stored in the CLI
+cache directory, without importing click or the commands. The index is rebuilt
+when the package changes, and the names of categories, genres, moods and
+instruments are refreshed from the response cache when reference data is
+cached again.
+
+    eval "$(shutterstock-complete bash)"
+"""
+
+import json
+import os
+import shlex
+import sys
+
+from .utils.paths import REFERENCE_INDEX, cache_dir
+
+PACKAGE = os.path.dirname(os.path.abspath(__file__))
+
+# Options whose values are names from cached reference data:
+# (group, command, option) -> endpoint.
+CHOICES = {
+    ("images", "search-images", "--category"): "/v2/images/categories",
+    ("bulk-search", "bulk-search-images", "--category"): "/v2/images/categories",
+    ("videos", "search-videos", "--category"): "/v2/videos/categories",
+    ("audio", "search-tracks", "--genre"): "/v2/audio/genres",
+    ("audio", "search-tracks", "--moods"): "/v2/audio/moods",
+    ("audio", "search-tracks", "--instruments"): "/v2/audio/instruments",
+    (
+        "editorial",
+        "search-editorial-images",
+        "--category",
+    ): "/v2/editorial/images/categories",
+    (
+        "editorial",
+        "search-editorial-videos",
+        "--category",
+    ): "/v2/editorial/videos/categories",
+}
+
+SCRIPTS = {
+    "bash": """\
+_shutterstock_completion() {
+    local IFS=$'\\n'
+    COMPREPLY=($(COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD shutterstock-complete))
+}
+complete -o default -F _shutterstock_completion shutterstock shutterstock-client
+""",
+    "zsh": """\
+autoload -U +X bashcompinit && bashcompinit
+_shutterstock_completion() {
+    local IFS=$'\\n'
+    COMPREPLY=($(COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD shutterstock-complete))
+}
+complete -o default -F _shutterstock_completion shutterstock shutterstock-client
+""",
+}
+
+
+def index_path():
+    """
+    :return: str
+    """
+    return os.path.join(cache_dir(), "completion.json")
+
+
+def package_stamp():
+    """
+    :return: The latest modification time of the modules of the package, in ns.
+    """
+    stamp = 0
+    for name in ("", "endpoints", "utils"):
+        directory = os.path.join(PACKAGE, name)
+        for entry in os.scandir(directory):
+            if entry.name.endswith(".py"):
+                stamp = max(stamp, entry.stat().st_mtime_ns)
+    return stamp
+
+
+def responses_stamp():
+    """
+    :return: Modification time of the index of reference data in the response
+        cache, in ns.
+    """
+    try:
+        path = os.path.join(cache_dir("responses"), REFERENCE_INDEX)
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def describe(command):
+    """
+    :param command: click.Command or click.Group
+    :return: Dict of the options of a command and, for groups, their commands.
+    """
+    import click  # pylint: disable=import-outside-toplevel
+
+    node = {"options": {}}
+    for param in command.params:
+        if not isinstance(param, click.Option):
+            continue
+        choices = list(getattr(param.type, "choices", None) or [])
+        for name in param.opts + param.secondary_opts:
+            node["options"][name] = {"flag": param.is_flag, "choices": choices}
+    node["options"]["--help"] = {"flag": True, "choices": []}
+    if isinstance(command, click.Group):
+        ctx = click.Context(command)
+        node["commands"] = {
+            name: describe(command.get_command(ctx, name))
+            for name in command.list_commands(ctx)
+        }
+    return node
+
+
+def cached_names():
+    """
+    Reads the names of reference data from the response cache.
+    :return: Dict of endpoint -> list of names.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .utils import codec
+    from .utils.cache import ResponseCache
+
+    cache = ResponseCache(cache_dir("responses"))
+    names = {}
+    for url, key in cache.references().items():
+        if url not in CHOICES.values():
+            continue
+        entry = cache.get(key)
+        try:
+            data = codec.loads(entry["body"]).get("data", [])
+        except (TypeError, ValueError, AttributeError):
+            continue
+        names[url] = sorted(
+            {
+                item if isinstance(item, str) else item.get("name")
+                for item in data
+                if isinstance(item, str) or item.get("name")
+            }
+        )
+    return names
+
+
+def build_index():
+    """
+    Describes every command of the CLI. This imports click and the commands, so
+    it is done only when the package changes.
+    :return: Dict
+    """
+    from .cli import cli  # pylint: disable=import-outside-toplevel
+
+    return {"package": package_stamp(), "tree": describe(cli)}
+
+
+def refresh_choices(index):
+    """
+    :param index: Completion index.
+    :return: The index, with the names read from the response cache.
+    """
+    names = cached_names()
+    index["responses"] = responses_stamp()
+    index["choices"] = {
+        " ".join(key): names.get(endpoint, []) for key, endpoint in CHOICES.items()
+    }
+    return index
+
+
+def store(index):
+    """
+    Writes the index atomically.
+    :param index: Completion index.
+    :return: None
+    """
+    path = index_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="UTF-8") as index_file:
+        json.dump(index, index_file)
+    os.replace(tmp_path, path)
+
+
+def load_index():
+    """
+    Reads the index, rebuilding or refreshing it when it is out of date.
+    :return: Dict
+    """
+    try:
+        with open(index_path(), encoding="UTF-8") as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        index = {}
+    changed = False
+    if index.get("package") != package_stamp():
+        index = build_index()
+        changed = True
+    if changed or index.get("responses") != responses_stamp():
+        index = refresh_choices(index)
+        changed = True
+    if changed:
+        store(index)
+    return index
+
+
+def complete(index, words, incomplete):
+    """
+    :param index: Completion index.
+    :param words: Words before the one being completed, without the program name.
+    :param incomplete: Word being completed.
+    :return: List of candidates.
+    """
+    node = index["tree"]
+    path = []
+    pending = None
+    for word in words:
+        if pending is not None:
+            pending = None
+        elif word.startswith("-"):
+            name = word.split("=", 1)[0]
+            option = node["options"].get(name)
+            if option and not option["flag"] and "=" not in word:
+                pending = name
+        elif word in node.get("commands", {}):
+            node = node["commands"][word]
+            path.append(word)
+    if pending is not None:
+        choices = node["options"][pending]["choices"] or index.get("choices", {}).get(
+            " ".join(path + [pending]), []
+        )
+        candidates = choices
+    elif incomplete.startswith("-"):
+        candidates = node["options"]
+    else:
+        candidates = node.get("commands", {})
+    return [candidate for candidate in candidates if candidate.startswith(incomplete)]
+
+
+def main():
+    """
+    Entry point of shutterstock-complete. With a shell name, prints the script
+    that enables completion; called by that script, prints the candidates.
+    """
+    if "COMP_WORDS" not in os.environ:
+        shell = sys.argv[1] if len(sys.argv) > 1 else "bash"
+        if shell not in SCRIPTS:
+            sys.exit(f"Usage: shutterstock-complete [{'|'.join(SCRIPTS)}]")
+        sys.stdout.write(SCRIPTS[shell])
+        return
+    try:
+        words = shlex.split(os.environ["COMP_WORDS"])
+    except ValueError:
+        words = os.environ["COMP_WORDS"].split()
+    cword = int(os.environ.get("COMP_CWORD", len(words)))
+    incomplete = words[cword] if cword < len(words) else ""
+    for candidate in complete(load_index(), words[1:cword], incomplete):
+        print(candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Endpoint table.
+
+Every command of the CLI is one entry of ENDPOINTS, grouped by command group,
+with the entries of each group in a module of their own. Options hold only
+constants, which the compiler folds into the bytecode cache, so loading the
+table costs little more than reading it; the registry in utils/registry.py
+turns an entry into a click command when that command is invoked.
+"""
+
+from . import (
+    ai_audio,
+    audio,
+    bulk_search,
+    catalog,
+    contributors,
+    cv,
+    editorial,
+    images,
+    sfx,
+    test,
+    user,
+    videos,
+)
+from .endpoint import Endpoint
+
+ENDPOINTS = {
+    "images": images.ENDPOINTS,
+    "bulk-search": bulk_search.ENDPOINTS,
+    "videos": videos.ENDPOINTS,
+    "audio": audio.ENDPOINTS,
+    "sfx": sfx.ENDPOINTS,
+    "editorial": editorial.ENDPOINTS,
+    "cv": cv.ENDPOINTS,
+    "catalog": catalog.ENDPOINTS,
+    "contributors": contributors.ENDPOINTS,
+    "user": user.ENDPOINTS,
+    "test": test.ENDPOINTS,
+    "ai-audio": ai_audio.ENDPOINTS,
+}
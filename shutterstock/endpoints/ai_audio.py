@@ -0,0 +1,150 @@
+"""
+Endpoints of the ai-audio command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "create-audio-renders",
+        "POST",
+        "/v2/ai/audio/renders",
+        "Create rendered audio",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "fetch-renders",
+        "GET",
+        "/v2/ai/audio/renders",
+        "Get details about audio renders",
+        options=(
+            ("--id", "str", True, "One or more render IDs"),
+        ),
+    ),
+    Endpoint(
+        "list-custom-instruments",
+        "GET",
+        "/v2/ai/audio/instruments",
+        "List computer audio instruments",
+        options=(
+            ("--id", "str", True, "Show instruments with the specified ID"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--page", "int", False, "Page number"),
+            (
+                "--name",
+                "str",
+                False,
+                "Show instruments with the specified name (case-sensitive)",
+            ),
+            (
+                "--tag",
+                "str",
+                False,
+                (
+                    "Show instruments with the specified tag, such as Percussion or"
+                    " Strings (case-sensitive)"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-custom-descriptors",
+        "GET",
+        "/v2/ai/audio/descriptors",
+        "List computer audio descriptors",
+        options=(
+            (
+                "--render-speed-over",
+                "float",
+                False,
+                (
+                    "Show descriptors with an average render speed that is greater"
+                    " than or equal to the specified value"
+                ),
+            ),
+            (
+                "--band-id",
+                "str",
+                False,
+                (
+                    "Show descriptors that contain the specified band"
+                    " (case-sentsitive)"
+                ),
+            ),
+            (
+                "--band-name",
+                "str",
+                False,
+                "Show descriptors with the specified band name (case-sensitive)",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--id",
+                "str",
+                True,
+                "Show descriptors with the specified IDs (case-sensitive)",
+            ),
+            (
+                "--instrument-name",
+                "str",
+                False,
+                (
+                    "Show descriptors with the specified instrument name"
+                    " (case-sensitive)"
+                ),
+            ),
+            (
+                "--instrument-id",
+                "str",
+                False,
+                (
+                    "Show descriptors with the specified instrument ID"
+                    " (case-sensitive)"
+                ),
+            ),
+            (
+                "--tempo",
+                "float",
+                False,
+                (
+                    "Show descriptors whose tempo range includes the specified"
+                    " tempo in beats per minute"
+                ),
+            ),
+            (
+                "--tempo-to",
+                "float",
+                False,
+                (
+                    "Show descriptors with a tempo that is less than or equal to"
+                    " the specified number"
+                ),
+            ),
+            (
+                "--tempo-from",
+                "float",
+                False,
+                (
+                    "Show descriptors that have a tempo range that includes the"
+                    " specified tempo in beats per minute"
+                ),
+            ),
+            (
+                "--name",
+                "str",
+                False,
+                "Show descriptors with the specified name (case-sensitive)",
+            ),
+            (
+                "--tag",
+                "str",
+                False,
+                (
+                    "Show descriptors with the specified tag, such as Cinematic or"
+                    " Roomy (case-sensitive)"
+                ),
+            ),
+        ),
+    ),
+)
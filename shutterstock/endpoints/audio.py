@@ -0,0 +1,348 @@
+"""
+Endpoints of the audio command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-tracks",
+        "GET",
+        "/v2/audio/search",
+        "Search for tracks",
+        options=(
+            (
+                "--artists",
+                "str",
+                True,
+                "Show tracks with one of the specified artist names or IDs",
+            ),
+            (
+                "--bpm",
+                "int",
+                False,
+                (
+                    "(Deprecated; use bpm_from and bpm_to instead) Show tracks with"
+                    " the specified beats per minute"
+                ),
+            ),
+            (
+                "--bpm-from",
+                "int",
+                False,
+                "Show tracks with the specified beats per minute or faster",
+            ),
+            (
+                "--bpm-to",
+                "int",
+                False,
+                "Show tracks with the specified beats per minute or slower",
+            ),
+            (
+                "--duration",
+                "int",
+                False,
+                "Show tracks with the specified duration in seconds",
+            ),
+            (
+                "--duration-from",
+                "int",
+                False,
+                "Show tracks with the specified duration or longer in seconds",
+            ),
+            (
+                "--duration-to",
+                "int",
+                False,
+                "Show tracks with the specified duration or shorter in seconds",
+            ),
+            (
+                "--genre",
+                "str",
+                True,
+                (
+                    "Show tracks with each of the specified genres; to get the list"
+                    " of genres, use `GET /v2/audio/genres`"
+                ),
+            ),
+            ("--is-instrumental", "str", False, "Show instrumental music only"),
+            (
+                "--instruments",
+                "str",
+                True,
+                (
+                    "Show tracks with each of the specified instruments; to get the"
+                    " list of instruments, use `GET /v2/audio/instruments`"
+                ),
+            ),
+            (
+                "--moods",
+                "str",
+                True,
+                (
+                    "Show tracks with each of the specified moods; to get the list"
+                    " of moods, use `GET /v2/audio/moods`"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--query", "str", False, "One or more search terms separated by spaces"),
+            ("--sort", "str", False, "Sort by"),
+            ("--sort-order", "str", False, "Sort order"),
+            (
+                "--vocal-description",
+                "str",
+                False,
+                "Show tracks with the specified vocal description (male, female)",
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--fields",
+                "str",
+                False,
+                (
+                    "Fields to display in the response; see the documentation for"
+                    " the fields parameter in the overview section"
+                ),
+            ),
+            ("--library", "str", False, "Which library to search"),
+            ("--language", "str", False, "Which language to search in"),
+        ),
+        flags=("pages",),
+    ),
+    Endpoint(
+        "list-genres",
+        "GET",
+        "/v2/audio/genres",
+        "List audio genres",
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Which language the genres will be returned",
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-instruments",
+        "GET",
+        "/v2/audio/instruments",
+        "List audio instruments",
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Which language the instruments will be returned in",
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-moods",
+        "GET",
+        "/v2/audio/moods",
+        "List audio moods",
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Which language the moods will be returned in",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-track-list",
+        "GET",
+        "/v2/audio",
+        "List audio tracks",
+        options=(
+            ("--id", "str", True, "One or more audio IDs"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-track",
+        "GET",
+        "/v2/audio/{id}",
+        "Get details about audio tracks",
+        arguments=("id",),
+        options=(
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "license-track",
+        "POST",
+        "/v2/audio/licenses",
+        "License audio tracks",
+        arguments=("data",),
+        options=(
+            ("--license", "str", False, "License type"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that led to licensing this track",
+            ),
+        ),
+        flags=("idempotency",),
+    ),
+    Endpoint(
+        "get-track-license-list",
+        "GET",
+        "/v2/audio/licenses",
+        "List audio licenses",
+        options=(
+            ("--audio-id", "str", False, "Show licenses for the specified track ID"),
+            ("--license", "str", False, "Restrict results by license."),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "download-tracks",
+        "POST",
+        "/v2/audio/licenses/{id}/downloads",
+        "Download audio tracks",
+        arguments=("id",),
+    ),
+    Endpoint(
+        "create-track-collection",
+        "POST",
+        "/v2/audio/collections",
+        "Create audio collections",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "get-track-collection-list",
+        "GET",
+        "/v2/audio/collections",
+        "List audio collections",
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-track-collection",
+        "GET",
+        "/v2/audio/collections/{id}",
+        "Get the details of audio collections",
+        arguments=("id",),
+        options=(
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+            ("--share-code", "str", False, "Code to retrieve a shared collection"),
+        ),
+    ),
+    Endpoint(
+        "rename-track-collection",
+        "POST",
+        "/v2/audio/collections/{id}",
+        "Rename audio collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "delete-track-collection",
+        "DELETE",
+        "/v2/audio/collections/{id}",
+        "Delete audio collections",
+        arguments=("id",),
+    ),
+    Endpoint(
+        "add-track-collection-items",
+        "POST",
+        "/v2/audio/collections/{id}/items",
+        "Add audio tracks to collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "get-track-collection-items",
+        "GET",
+        "/v2/audio/collections/{id}/items",
+        "Get the contents of audio collections",
+        arguments=("id",),
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--share-code",
+                "str",
+                False,
+                "Code to retrieve the contents of a shared collection",
+            ),
+            ("--sort", "str", False, "Sort order"),
+        ),
+    ),
+    Endpoint(
+        "delete-track-collection-items",
+        "DELETE",
+        "/v2/audio/collections/{id}/items",
+        "Remove audio tracks from collections",
+        arguments=("id",),
+        options=(
+            (
+                "--item-id",
+                "str",
+                True,
+                "One or more item IDs to remove from the collection",
+            ),
+        ),
+    ),
+)
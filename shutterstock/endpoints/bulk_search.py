@@ -0,0 +1,234 @@
+"""
+Endpoints of the bulk-search command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "bulk-search-images",
+        "POST",
+        "/v2/bulk_search/images",
+        "Run multiple image searches",
+        arguments=("data",),
+        options=(
+            ("--added-date", "str", False, "Show images added on the specified date"),
+            (
+                "--added-date-start",
+                "str",
+                False,
+                "Show images added on or after the specified date",
+            ),
+            (
+                "--aspect-ratio-min",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio or higher, using a"
+                    " positive decimal of the width divided by the height, such as"
+                    " 1.7778 for a 16:9 image"
+                ),
+            ),
+            (
+                "--aspect-ratio-max",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio or lower, using a"
+                    " positive decimal of the width divided by the height, such as"
+                    " 1.7778 for a 16:9 image"
+                ),
+            ),
+            (
+                "--aspect-ratio",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio, using a positive"
+                    " decimal of the width divided by the height, such as 1.7778"
+                    " for a 16:9 image"
+                ),
+            ),
+            (
+                "--added-date-end",
+                "str",
+                False,
+                "Show images added before the specified date",
+            ),
+            (
+                "--category",
+                "str",
+                False,
+                (
+                    "Show images with the specified Shutterstock-defined category;"
+                    " specify a category name or ID"
+                ),
+            ),
+            (
+                "--color",
+                "str",
+                False,
+                (
+                    "Specify either a hexadecimal color in the format '4F21EA' or"
+                    " 'grayscale'; the API returns images that use similar colors"
+                ),
+            ),
+            (
+                "--contributor",
+                "str",
+                True,
+                (
+                    "Show images with the specified contributor names or IDs,"
+                    " allows multiple"
+                ),
+            ),
+            (
+                "--contributor-country",
+                "str",
+                False,
+                (
+                    "Show images from contributors in one or more specified"
+                    " countries, or start with NOT to exclude a country from the"
+                    " search"
+                ),
+            ),
+            (
+                "--fields",
+                "str",
+                False,
+                (
+                    "Fields to display in the response; see the documentation for"
+                    " the fields parameter in the overview section"
+                ),
+            ),
+            (
+                "--height",
+                "int",
+                False,
+                (
+                    "(Deprecated; use height_from and height_to instead) Show"
+                    " images with the specified height"
+                ),
+            ),
+            (
+                "--height-from",
+                "int",
+                False,
+                "Show images with the specified height or larger, in pixels",
+            ),
+            (
+                "--height-to",
+                "int",
+                False,
+                "Show images with the specified height or smaller, in pixels",
+            ),
+            ("--image-type", "str", True, "Show images of the specified type"),
+            (
+                "--keyword-safe-search",
+                "str",
+                False,
+                "Hide results with potentially unsafe keywords",
+            ),
+            (
+                "--language",
+                "str",
+                False,
+                (
+                    "Set query and result language (uses Accept-Language header if"
+                    " not set)"
+                ),
+            ),
+            ("--license", "str", True, "Show only images with the specified license"),
+            (
+                "--model",
+                "str",
+                True,
+                "Show image results with the specified model IDs",
+            ),
+            (
+                "--orientation",
+                "str",
+                False,
+                "Show image results with horizontal or vertical orientation",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--people-model-released",
+                "str",
+                False,
+                "Show images of people with a signed model release",
+            ),
+            (
+                "--people-age",
+                "str",
+                False,
+                "Show images that feature people of the specified age category",
+            ),
+            (
+                "--people-ethnicity",
+                "str",
+                True,
+                (
+                    "Show images with people of the specified ethnicities, or start"
+                    " with NOT to show images without those ethnicities"
+                ),
+            ),
+            (
+                "--people-gender",
+                "str",
+                False,
+                "Show images with people of the specified gender",
+            ),
+            (
+                "--people-number",
+                "int",
+                False,
+                "Show images with the specified number of people",
+            ),
+            (
+                "--region",
+                "str",
+                False,
+                (
+                    "Raise or lower search result rankings based on the result's"
+                    " relevance to a specified region; you can provide a country"
+                    " code or an IP address from which the API infers a country"
+                ),
+            ),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--spellcheck-query",
+                "str",
+                False,
+                (
+                    "Spellcheck the search query and return results on suggested"
+                    " spellings"
+                ),
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--width",
+                "int",
+                False,
+                (
+                    "(Deprecated; use width_from and width_to instead) Show images"
+                    " with the specified width"
+                ),
+            ),
+            (
+                "--width-from",
+                "int",
+                False,
+                "Show images with the specified width or larger, in pixels",
+            ),
+            (
+                "--width-to",
+                "int",
+                False,
+                "Show images with the specified width or smaller, in pixels",
+            ),
+        ),
+    ),
+)
@@ -0,0 +1,77 @@
+"""
+Endpoints of the catalog command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-catalog",
+        "GET",
+        "/v2/catalog/search",
+        "Search catalogs for assets",
+        options=(
+            ("--sort", "str", False, "Sort by"),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--query", "str", False, "One or more search terms separated by spaces"),
+            ("--collection-id", "str", True, "Filter by collection id"),
+            ("--asset-type", "str", True, "Filter by asset type"),
+        ),
+    ),
+    Endpoint(
+        "get-collections",
+        "GET",
+        "/v2/catalog/collections",
+        "List catalog collections",
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--shared",
+                "str",
+                False,
+                (
+                    "Set to true to omit collections that you own and return only"
+                    " collections  that are shared with you"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "create-collection",
+        "POST",
+        "/v2/catalog/collections",
+        "Create catalog collections",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "update-collection",
+        "PATCH",
+        "/v2/catalog/collections/{collection_id}",
+        "Update collection metadata",
+        arguments=("collection-id", "data"),
+    ),
+    Endpoint(
+        "delete-collection",
+        "DELETE",
+        "/v2/catalog/collections/{collection_id}",
+        "Delete catalog collections",
+        arguments=("collection-id",),
+    ),
+    Endpoint(
+        "add-to-collection",
+        "POST",
+        "/v2/catalog/collections/{collection_id}/items",
+        "Add items to catalog collections",
+        arguments=("collection-id", "data"),
+    ),
+    Endpoint(
+        "delete-from-collection",
+        "DELETE",
+        "/v2/catalog/collections/{collection_id}/items",
+        "Remove items from catalog collection",
+        arguments=("collection-id", "data"),
+    ),
+)
@@ -0,0 +1,53 @@
+"""
+Endpoints of the contributors command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "get-contributor-list",
+        "GET",
+        "/v2/contributors",
+        "Get details about multiple contributors",
+        options=(
+            ("--id", "str", True, "One or more contributor IDs"),
+        ),
+    ),
+    Endpoint(
+        "get-contributor",
+        "GET",
+        "/v2/contributors/{contributor_id}",
+        "Get details about a single contributor",
+        arguments=("contributor-id",),
+    ),
+    Endpoint(
+        "get-contributor-collections-list",
+        "GET",
+        "/v2/contributors/{contributor_id}/collections",
+        "List contributors' collections",
+        arguments=("contributor-id",),
+        options=(
+            ("--sort", "str", False, "Sort order"),
+        ),
+    ),
+    Endpoint(
+        "get-contributor-collections",
+        "GET",
+        "/v2/contributors/{contributor_id}/collections/{id}",
+        "Get details about contributors' collections",
+        arguments=("contributor-id", "id"),
+    ),
+    Endpoint(
+        "get-contributor-collection-items",
+        "GET",
+        "/v2/contributors/{contributor_id}/collections/{id}/items",
+        "Get the items in contributors' collections",
+        arguments=("contributor-id", "id"),
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+        ),
+    ),
+)
@@ -0,0 +1,79 @@
+"""
+Endpoints of the cv command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "upload-image",
+        "POST",
+        "/v2/cv/images",
+        "Upload images",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "get-similar-images",
+        "GET",
+        "/v2/cv/similar/images",
+        "List similar images",
+        options=(
+            (
+                "--asset-id",
+                "str",
+                False,
+                "The asset ID or upload ID to find similar images for",
+            ),
+            ("--license", "str", True, "Show only images with the specified license"),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+        ),
+    ),
+    Endpoint(
+        "get-similar-videos",
+        "GET",
+        "/v2/cv/similar/videos",
+        "List similar videos",
+        options=(
+            (
+                "--asset-id",
+                "str",
+                False,
+                "The asset ID or upload ID to find similar videos for",
+            ),
+            ("--license", "str", True, "Show only videos with the specified license"),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+        ),
+    ),
+    Endpoint(
+        "get-keywords",
+        "GET",
+        "/v2/cv/keywords",
+        "List suggested keywords",
+        options=(
+            (
+                "--asset-id",
+                "str",
+                False,
+                "The asset ID or upload ID to suggest keywords for",
+            ),
+        ),
+    ),
+)
@@ -0,0 +1,500 @@
+"""
+Endpoints of the editorial command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-editorial-images",
+        "GET",
+        "/v2/editorial/images/search",
+        "Search editorial images",
+        options=(
+            ("--query", "str", False, "One or more search terms separated by spaces"),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--category",
+                "str",
+                False,
+                (
+                    "Show editorial content with each of the specified editorial"
+                    " categories; specify category names in a comma-separated list"
+                ),
+            ),
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Show only editorial content that is available for distribution"
+                    " in a certain country"
+                ),
+            ),
+            (
+                "--supplier-code",
+                "str",
+                True,
+                "Show only editorial content from certain suppliers",
+            ),
+            (
+                "--date-start",
+                "str",
+                False,
+                "Show only editorial content generated on or after a specific date",
+            ),
+            (
+                "--date-end",
+                "str",
+                False,
+                (
+                    "Show only editorial content generated on or before a specific"
+                    " date"
+                ),
+            ),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--cursor",
+                "str",
+                False,
+                (
+                    "The cursor of the page with which to start fetching results;"
+                    " this cursor is returned from previous requests"
+                ),
+            ),
+        ),
+        flags=("cursor",),
+    ),
+    Endpoint(
+        "list-editorial-image-categories",
+        "GET",
+        "/v2/editorial/images/categories",
+        "List editorial categories",
+    ),
+    Endpoint(
+        "get-updated-editorial-images",
+        "GET",
+        "/v2/editorial/images/updated",
+        "List updated content",
+        options=(
+            (
+                "--type",
+                "str",
+                False,
+                (
+                    "Specify `addition` to return only images that were added or"
+                    " `edit` to return only images that were edited or deleted"
+                ),
+            ),
+            (
+                "--date-updated-start",
+                "str",
+                False,
+                (
+                    "Show images images added, edited, or deleted after the"
+                    " specified date. Acceptable range is 1970-01-01T00:00:01 to"
+                    " 2038-01-19T00:00:00."
+                ),
+            ),
+            (
+                "--date-updated-end",
+                "str",
+                False,
+                (
+                    "Show images images added, edited, or deleted before the"
+                    " specified date. Acceptable range is 1970-01-01T00:00:01 to"
+                    " 2038-01-19T00:00:00."
+                ),
+            ),
+            (
+                "--date-taken-start",
+                "str",
+                False,
+                (
+                    "Show images that were taken on or after the specified date;"
+                    " use this parameter if you want recently created images from"
+                    " the collection instead of updated older assets"
+                ),
+            ),
+            (
+                "--date-taken-end",
+                "str",
+                False,
+                "Show images that were taken before the specified date",
+            ),
+            (
+                "--cursor",
+                "str",
+                False,
+                (
+                    "The cursor of the page with which to start fetching results;"
+                    " this cursor is returned from previous requests"
+                ),
+            ),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--supplier-code",
+                "str",
+                True,
+                "Show only editorial content from certain suppliers",
+            ),
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Show only editorial content that is available for distribution"
+                    " in a certain country"
+                ),
+            ),
+            ("--per-page", "int", False, "Number of results per page"),
+        ),
+        flags=("cursor", "checkpoint"),
+    ),
+    Endpoint(
+        "get-editorial-image",
+        "GET",
+        "/v2/editorial/images/{id}",
+        "Get editorial content details",
+        arguments=("id",),
+        options=(
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Returns only if the content is available for distribution in a"
+                    " certain country"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-editorial-images",
+        "GET",
+        "/v2/editorial/images",
+        "list editorial image details",
+        options=(
+            ("--id", "str", True, "ID of the editorial image to list details for"),
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Show only editorial image content that is available for"
+                    " distribution in a certain country"
+                ),
+            ),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-editorial-image-license-list",
+        "GET",
+        "/v2/editorial/images/licenses",
+        "List editorial image licenses",
+        options=(
+            (
+                "--image-id",
+                "str",
+                False,
+                "Show licenses for the specified editorial image ID",
+            ),
+            (
+                "--license",
+                "str",
+                False,
+                (
+                    "Show editorial images that are available with the specified"
+                    " license name"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "license-editorial-images",
+        "POST",
+        "/v2/editorial/images/licenses",
+        "License editorial content",
+        arguments=("data",),
+        flags=("idempotency",),
+    ),
+    Endpoint(
+        "get-editorial-image-livefeed-list",
+        "GET",
+        "/v2/editorial/images/livefeeds",
+        "Get editorial livefeed list",
+        options=(
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Returns only livefeeds that are available for distribution in"
+                    " a certain country"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+        ),
+    ),
+    Endpoint(
+        "get-editorial-image-livefeed",
+        "GET",
+        "/v2/editorial/images/livefeeds/{id}",
+        "Get editorial livefeed",
+        arguments=("id",),
+        options=(
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Returns only if the livefeed is available for distribution in"
+                    " a certain country"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-editorial-image-livefeed-items",
+        "GET",
+        "/v2/editorial/images/livefeeds/{id}/items",
+        "Get editorial livefeed items",
+        arguments=("id",),
+        options=(
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Returns only if the livefeed items are available for"
+                    " distribution in a certain country"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "search-editorial-videos",
+        "GET",
+        "/v2/editorial/videos/search",
+        "Search editorial video content",
+        options=(
+            ("--query", "str", False, "One or more search terms separated by spaces"),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--category",
+                "str",
+                False,
+                (
+                    "Show editorial content with each of the specified editorial"
+                    " categories; specify category names in a comma-separated list"
+                ),
+            ),
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Show only editorial video content that is available for"
+                    " distribution in a certain country"
+                ),
+            ),
+            (
+                "--supplier-code",
+                "str",
+                True,
+                "Show only editorial video content from certain suppliers",
+            ),
+            (
+                "--date-start",
+                "str",
+                False,
+                (
+                    "Show only editorial video content generated on or after a"
+                    " specific date"
+                ),
+            ),
+            (
+                "--date-end",
+                "str",
+                False,
+                (
+                    "Show only editorial video content generated on or before a"
+                    " specific date"
+                ),
+            ),
+            (
+                "--resolution",
+                "str",
+                False,
+                "Show only editorial video content with specific resolution",
+            ),
+            (
+                "--fps",
+                "float",
+                False,
+                (
+                    "Show only editorial video content generated with specific"
+                    " frames per second"
+                ),
+            ),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--cursor",
+                "str",
+                False,
+                (
+                    "The cursor of the page with which to start fetching results;"
+                    " this cursor is returned from previous requests"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-editorial-video-categories",
+        "GET",
+        "/v2/editorial/videos/categories",
+        "List editorial video categories",
+    ),
+    Endpoint(
+        "get-editorial-video",
+        "GET",
+        "/v2/editorial/videos/{id}",
+        "Get editorial video content details",
+        arguments=("id",),
+        options=(
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Returns only if the content is available for distribution in a"
+                    " certain country"
+                ),
+            ),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-editorial-videos",
+        "GET",
+        "/v2/editorial/videos",
+        "List editorial videos details by ID list",
+        options=(
+            ("--id", "str", True, "ID of the editorial video to list details for"),
+            (
+                "--country",
+                "str",
+                False,
+                (
+                    "Show only editorial video content that is available for"
+                    " distribution in a certain country"
+                ),
+            ),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-editorial-video-license-list",
+        "GET",
+        "/v2/editorial/videos/licenses",
+        "List editorial video licenses",
+        options=(
+            (
+                "--video-id",
+                "str",
+                False,
+                "Show licenses for the specified editorial video ID",
+            ),
+            (
+                "--license",
+                "str",
+                False,
+                (
+                    "Show editorial videos that are available with the specified"
+                    " license name"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "license-editorial-video",
+        "POST",
+        "/v2/editorial/videos/licenses",
+        "License editorial video content",
+        arguments=("data",),
+        flags=("idempotency",),
+    ),
+)
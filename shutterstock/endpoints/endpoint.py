@@ -0,0 +1,34 @@
+"""
+Endpoint entry of the endpoint table.
+"""
+
+from typing import NamedTuple
+
+
+class Endpoint(NamedTuple):
+    """
+    An API endpoint and the command that calls it.
+
+    name: Name of the command.
+    method: HTTP method.
+    path: Path of the endpoint, with arguments in braces, such as /v2/images/{id}.
+    help: Help text of the command.
+    arguments: Positional arguments. An argument named "data" is a JSON file
+        that is sent as the request body.
+    options: Tuples of (option, type name, multiple, help), sent as request
+        parameters.
+    flags: "idempotency" adds an --idempotency-key option to requests that
+        license media; "pages" and "cursor" add --all-pages and --max-results
+        options to searches that are paged by number or by cursor; "checkpoint"
+        adds a --checkpoint option to cursor feeds that can be resumed;
+        "shards" adds a --shards option to feeds filtered by --start-date and
+        --end-date.
+    """
+
+    name: str
+    method: str
+    path: str
+    help: str
+    arguments: tuple = ()
+    options: tuple = ()
+    flags: tuple = ()
@@ -0,0 +1,587 @@
+"""
+Endpoints of the images command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-images",
+        "GET",
+        "/v2/images/search",
+        "Search for images",
+        options=(
+            (
+                "--library",
+                "str",
+                True,
+                "Search within different Shutterstock owned libraries",
+            ),
+            ("--added-date", "str", False, "Show images added on the specified date"),
+            (
+                "--added-date-start",
+                "str",
+                False,
+                "Show images added on or after the specified date",
+            ),
+            (
+                "--aspect-ratio-min",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio or higher, using a"
+                    " positive decimal of the width divided by the height, such as"
+                    " 1.7778 for a 16:9 image"
+                ),
+            ),
+            (
+                "--aspect-ratio-max",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio or lower, using a"
+                    " positive decimal of the width divided by the height, such as"
+                    " 1.7778 for a 16:9 image"
+                ),
+            ),
+            (
+                "--aspect-ratio",
+                "float",
+                False,
+                (
+                    "Show images with the specified aspect ratio, using a positive"
+                    " decimal of the width divided by the height, such as 1.7778"
+                    " for a 16:9 image"
+                ),
+            ),
+            (
+                "--added-date-end",
+                "str",
+                False,
+                "Show images added before the specified date",
+            ),
+            (
+                "--category",
+                "str",
+                False,
+                (
+                    "Show images with the specified Shutterstock-defined category;"
+                    " specify a category name or ID"
+                ),
+            ),
+            (
+                "--color",
+                "str",
+                False,
+                (
+                    "Specify either a hexadecimal color in the format '4F21EA' or"
+                    " 'grayscale'; the API returns images that use similar colors"
+                ),
+            ),
+            (
+                "--contributor",
+                "str",
+                True,
+                (
+                    "Show images with the specified contributor names or IDs,"
+                    " allows multiple"
+                ),
+            ),
+            (
+                "--contributor-country",
+                "str",
+                False,
+                (
+                    "Show images from contributors in one or more specified"
+                    " countries, or start with NOT to exclude a country from the"
+                    " search"
+                ),
+            ),
+            (
+                "--fields",
+                "str",
+                False,
+                (
+                    "Fields to display in the response; see the documentation for"
+                    " the fields parameter in the overview section"
+                ),
+            ),
+            (
+                "--height",
+                "int",
+                False,
+                (
+                    "(Deprecated; use height_from and height_to instead) Show"
+                    " images with the specified height"
+                ),
+            ),
+            (
+                "--height-from",
+                "int",
+                False,
+                "Show images with the specified height or larger, in pixels",
+            ),
+            (
+                "--height-to",
+                "int",
+                False,
+                "Show images with the specified height or smaller, in pixels",
+            ),
+            ("--image-type", "str", True, "Show images of the specified type"),
+            (
+                "--keyword-safe-search",
+                "str",
+                False,
+                "Hide results with potentially unsafe keywords",
+            ),
+            (
+                "--language",
+                "str",
+                False,
+                (
+                    "Set query and result language (uses Accept-Language header if"
+                    " not set)"
+                ),
+            ),
+            ("--license", "str", True, "Show only images with the specified license"),
+            (
+                "--model",
+                "str",
+                True,
+                "Show image results with the specified model IDs",
+            ),
+            (
+                "--orientation",
+                "str",
+                False,
+                "Show image results with horizontal or vertical orientation",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--people-model-released",
+                "str",
+                False,
+                "Show images of people with a signed model release",
+            ),
+            (
+                "--people-age",
+                "str",
+                False,
+                "Show images that feature people of the specified age category",
+            ),
+            (
+                "--people-ethnicity",
+                "str",
+                True,
+                (
+                    "Show images with people of the specified ethnicities, or start"
+                    " with NOT to show images without those ethnicities"
+                ),
+            ),
+            (
+                "--people-gender",
+                "str",
+                False,
+                "Show images with people of the specified gender",
+            ),
+            (
+                "--people-number",
+                "int",
+                False,
+                "Show images with the specified number of people",
+            ),
+            (
+                "--query",
+                "str",
+                False,
+                (
+                    "One or more search terms separated by spaces; you can use NOT"
+                    " to filter out images that match a term"
+                ),
+            ),
+            (
+                "--region",
+                "str",
+                False,
+                (
+                    "Raise or lower search result rankings based on the result's"
+                    " relevance to a specified region; you can provide a country"
+                    " code or an IP address from which the API infers a country"
+                ),
+            ),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            ("--sort", "str", False, "Sort by"),
+            (
+                "--spellcheck-query",
+                "str",
+                False,
+                (
+                    "Spellcheck the search query and return results on suggested"
+                    " spellings"
+                ),
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--width",
+                "int",
+                False,
+                (
+                    "(Deprecated; use width_from and width_to instead) Show images"
+                    " with the specified width"
+                ),
+            ),
+            (
+                "--width-from",
+                "int",
+                False,
+                "Show images with the specified width or larger, in pixels",
+            ),
+            (
+                "--width-to",
+                "int",
+                False,
+                "Show images with the specified width or smaller, in pixels",
+            ),
+        ),
+        flags=("pages",),
+    ),
+    Endpoint(
+        "get-image-suggestions",
+        "GET",
+        "/v2/images/search/suggestions",
+        "Get suggestions for a search term",
+        options=(
+            (
+                "--query",
+                "str",
+                False,
+                "Search term for which you want keyword suggestions",
+            ),
+            ("--limit", "int", False, "Limit the number of suggestions"),
+        ),
+    ),
+    Endpoint(
+        "get-image-keyword-suggestions",
+        "POST",
+        "/v2/images/search/suggestions",
+        "Get keywords from text",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "get-image-list",
+        "GET",
+        "/v2/images",
+        "List images",
+        options=(
+            ("--id", "str", True, "One or more image IDs"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-image",
+        "GET",
+        "/v2/images/{id}",
+        "Get details about images",
+        arguments=("id",),
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-image-categories",
+        "GET",
+        "/v2/images/categories",
+        "List image categories",
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+        ),
+    ),
+    Endpoint(
+        "list-similar-images",
+        "GET",
+        "/v2/images/{id}/similar",
+        "List similar images",
+        arguments=("id",),
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+        ),
+    ),
+    Endpoint(
+        "license-images",
+        "POST",
+        "/v2/images/licenses",
+        "License images",
+        arguments=("data",),
+        options=(
+            (
+                "--subscription-id",
+                "str",
+                False,
+                "Subscription ID to use to license the image",
+            ),
+            ("--format", "str", False, "(Deprecated) Image format"),
+            ("--size", "str", False, "Image size"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "Search ID that was provided in the results of an image search",
+            ),
+        ),
+        flags=("idempotency",),
+    ),
+    Endpoint(
+        "get-image-license-list",
+        "GET",
+        "/v2/images/licenses",
+        "List image licenses",
+        options=(
+            ("--image-id", "str", False, "Show licenses for the specified image ID"),
+            (
+                "--license",
+                "str",
+                False,
+                (
+                    "Show images that are available with the specified license,"
+                    " such as `standard` or `enhanced`"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "download-image",
+        "POST",
+        "/v2/images/licenses/{id}/downloads",
+        "Download images",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "get-image-recommendations",
+        "GET",
+        "/v2/images/recommendations",
+        "List recommended images",
+        options=(
+            ("--id", "str", True, "Image IDs"),
+            (
+                "--max-items",
+                "int",
+                False,
+                "Maximum number of results returned in the response",
+            ),
+            ("--safe", "str", False, "Restrict results to safe images"),
+        ),
+    ),
+    Endpoint(
+        "create-image-collection",
+        "POST",
+        "/v2/images/collections",
+        "Create image collections",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "get-image-collection-list",
+        "GET",
+        "/v2/images/collections",
+        "List image collections",
+        options=(
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+        ),
+    ),
+    Endpoint(
+        "get-image-collection",
+        "GET",
+        "/v2/images/collections/{id}",
+        "Get the details of image collections",
+        arguments=("id",),
+        options=(
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+            ("--share-code", "str", False, "Code to retrieve a shared collection"),
+        ),
+    ),
+    Endpoint(
+        "rename-image-collection",
+        "POST",
+        "/v2/images/collections/{id}",
+        "Rename image collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "delete-image-collection",
+        "DELETE",
+        "/v2/images/collections/{id}",
+        "Delete image collections",
+        arguments=("id",),
+    ),
+    Endpoint(
+        "add-image-collection-items",
+        "POST",
+        "/v2/images/collections/{id}/items",
+        "Add images to collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "get-image-collection-items",
+        "GET",
+        "/v2/images/collections/{id}/items",
+        "Get the contents of image collections",
+        arguments=("id",),
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--share-code",
+                "str",
+                False,
+                "Code to retrieve the contents of a shared collection",
+            ),
+            ("--sort", "str", False, "Sort order"),
+        ),
+    ),
+    Endpoint(
+        "delete-image-collection-items",
+        "DELETE",
+        "/v2/images/collections/{id}/items",
+        "Remove images from collections",
+        arguments=("id",),
+        options=(
+            (
+                "--item-id",
+                "str",
+                True,
+                "One or more image IDs to remove from the collection",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-updated-images",
+        "GET",
+        "/v2/images/updated",
+        "List updated images",
+        options=(
+            (
+                "--type",
+                "str",
+                True,
+                (
+                    "Show images that were added, deleted, or edited; by default,"
+                    " the endpoint returns images that were updated in any of these"
+                    " ways"
+                ),
+            ),
+            (
+                "--start-date",
+                "str",
+                False,
+                (
+                    "Show images updated on or after the specified date. The API"
+                    " will default to UTC (00:00:00) if no specific time is"
+                    " provided, ensuring consistency."
+                ),
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                (
+                    "Show images updated before the specified date. The API will"
+                    " default to UTC (00:00:00) if no specific time is provided,"
+                    " ensuring consistency. Please note that the end date must be"
+                    " at least 5 minutes after the start date."
+                ),
+            ),
+            (
+                "--interval",
+                "str",
+                False,
+                (
+                    "Show images updated in the specified time period, where the"
+                    " time period is an interval (like SQL INTERVAL) such as 1 DAY,"
+                    " 6 HOUR, or 30 MINUTE; the default is 1 HOUR, which shows"
+                    " images that were updated in the hour preceding the request"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+        ),
+        flags=("pages", "shards"),
+    ),
+)
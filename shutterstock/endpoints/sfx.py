@@ -0,0 +1,187 @@
+"""
+Endpoints of the sfx command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-sfx",
+        "GET",
+        "/v2/sfx/search",
+        "Search for sound effects",
+        options=(
+            (
+                "--added-date",
+                "str",
+                False,
+                "Show sound effects added on the specified date",
+            ),
+            (
+                "--added-date-start",
+                "str",
+                False,
+                "Show sound effects added on or after the specified date",
+            ),
+            (
+                "--added-date-end",
+                "str",
+                False,
+                "Show sound effects added before the specified date",
+            ),
+            (
+                "--duration",
+                "int",
+                False,
+                "Show sound effects with the specified duration in seconds",
+            ),
+            (
+                "--duration-from",
+                "int",
+                False,
+                (
+                    "Show sound effects with the specified duration or longer in"
+                    " seconds"
+                ),
+            ),
+            (
+                "--duration-to",
+                "int",
+                False,
+                (
+                    "Show sound effects with the specified duration or shorter in"
+                    " seconds"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--query", "str", False, "One or more search terms separated by spaces"),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            ("--sort", "str", False, "Sort by"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--language",
+                "str",
+                False,
+                (
+                    "Set query and result language (uses Accept-Language header if"
+                    " not set)"
+                ),
+            ),
+        ),
+        flags=("pages",),
+    ),
+    Endpoint(
+        "get-sfx-details",
+        "GET",
+        "/v2/sfx/{id}",
+        "Get details about sound effects",
+        arguments=("id",),
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            ("--library", "str", False, "Which library to fetch from"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-sfx-list-details",
+        "GET",
+        "/v2/sfx",
+        "List details about sound effects",
+        options=(
+            ("--id", "str", True, "One or more sound effect IDs"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--library", "str", False, "Which library to fetch from"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-sfx-license-list",
+        "GET",
+        "/v2/sfx/licenses",
+        "List sound effects licenses",
+        options=(
+            (
+                "--sfx-id",
+                "str",
+                False,
+                "Show licenses for the specified sound effects ID",
+            ),
+            (
+                "--license",
+                "str",
+                False,
+                (
+                    "Show sound effects that are available with the specified"
+                    " license, such as `standard` or `enhanced`"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort order"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            ("--license-id", "str", False, "Filter by the license ID"),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "licenses-sfx",
+        "POST",
+        "/v2/sfx/licenses",
+        "License sound effects",
+        arguments=("data",),
+        flags=("idempotency",),
+    ),
+    Endpoint(
+        "download-sfx",
+        "POST",
+        "/v2/sfx/licenses/{id}/downloads",
+        "Download sound effects",
+        arguments=("id",),
+    ),
+)
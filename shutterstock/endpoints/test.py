@@ -0,0 +1,27 @@
+"""
+Endpoints of the test command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "echo",
+        "GET",
+        "/v2/test",
+        "Echo text",
+        options=(
+            ("--text", "str", False, "Text to echo"),
+        ),
+    ),
+    Endpoint(
+        "validate",
+        "GET",
+        "/v2/test/validate",
+        "Validate input",
+        options=(
+            ("--id", "int", False, "Integer ID"),
+            ("--tag", "str", True, "List of tags"),
+        ),
+    ),
+)
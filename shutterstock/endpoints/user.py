@@ -0,0 +1,26 @@
+"""
+Endpoints of the user command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "get-user",
+        "GET",
+        "/v2/user",
+        "Get user details",
+    ),
+    Endpoint(
+        "get-access-token",
+        "GET",
+        "/v2/user/access_token",
+        "Get access token details",
+    ),
+    Endpoint(
+        "get-user-subscription-list",
+        "GET",
+        "/v2/user/subscriptions",
+        "List user subscriptions",
+    ),
+)
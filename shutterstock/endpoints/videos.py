@@ -0,0 +1,463 @@
+"""
+Endpoints of the videos command group.
+"""
+
+from .endpoint import Endpoint
+
+ENDPOINTS = (
+    Endpoint(
+        "search-videos",
+        "GET",
+        "/v2/videos/search",
+        "Search for videos",
+        options=(
+            ("--added-date", "str", False, "Show videos added on the specified date"),
+            (
+                "--added-date-start",
+                "str",
+                False,
+                "Show videos added on or after the specified date",
+            ),
+            (
+                "--added-date-end",
+                "str",
+                False,
+                "Show videos added before the specified date",
+            ),
+            (
+                "--aspect-ratio",
+                "str",
+                False,
+                "Show videos with the specified aspect ratio",
+            ),
+            (
+                "--category",
+                "str",
+                False,
+                (
+                    "Show videos with the specified Shutterstock-defined category;"
+                    " specify a category name or ID"
+                ),
+            ),
+            (
+                "--contributor",
+                "str",
+                True,
+                "Show videos with the specified artist names or IDs",
+            ),
+            (
+                "--contributor-country",
+                "str",
+                True,
+                "Show videos from contributors in one or more specified countries",
+            ),
+            (
+                "--duration-from",
+                "int",
+                False,
+                "Show videos with the specified duration or longer in seconds",
+            ),
+            (
+                "--duration-to",
+                "int",
+                False,
+                "Show videos with the specified duration or shorter in seconds",
+            ),
+            (
+                "--fps-from",
+                "float",
+                False,
+                "Show videos with the specified frames per second or more",
+            ),
+            (
+                "--fps-to",
+                "float",
+                False,
+                "Show videos with the specified frames per second or fewer",
+            ),
+            (
+                "--keyword-safe-search",
+                "str",
+                False,
+                "Hide results with potentially unsafe keywords",
+            ),
+            (
+                "--language",
+                "str",
+                False,
+                (
+                    "Set query and result language (uses Accept-Language header if"
+                    " not set)"
+                ),
+            ),
+            (
+                "--license",
+                "str",
+                True,
+                "Show only videos with the specified license or licenses",
+            ),
+            ("--model", "str", True, "Show videos with each of the specified models"),
+            (
+                "--orientation",
+                "str",
+                False,
+                "Search for videos in a specific orientation",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--people-age",
+                "str",
+                False,
+                "Show videos that feature people of the specified age range",
+            ),
+            (
+                "--people-ethnicity",
+                "str",
+                True,
+                "Show videos with people of the specified ethnicities",
+            ),
+            (
+                "--people-gender",
+                "str",
+                False,
+                "Show videos with people with the specified gender",
+            ),
+            (
+                "--people-number",
+                "int",
+                False,
+                "Show videos with the specified number of people",
+            ),
+            (
+                "--people-model-released",
+                "str",
+                False,
+                "Show only videos of people with a signed model release",
+            ),
+            (
+                "--query",
+                "str",
+                False,
+                (
+                    "One or more search terms separated by spaces; you can use NOT"
+                    " to filter out videos that match a term"
+                ),
+            ),
+            (
+                "--resolution",
+                "str",
+                False,
+                "Show videos with the specified resolution",
+            ),
+            ("--safe", "str", False, "Enable or disable safe search"),
+            ("--sort", "str", False, "Sort by one of these categories"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+        ),
+        flags=("pages",),
+    ),
+    Endpoint(
+        "get-video-suggestions",
+        "GET",
+        "/v2/videos/search/suggestions",
+        "Get suggestions for a search term",
+        options=(
+            (
+                "--query",
+                "str",
+                False,
+                "Search term for which you want keyword suggestions",
+            ),
+            ("--limit", "int", False, "Limit the number of the suggestions"),
+        ),
+    ),
+    Endpoint(
+        "get-video-list",
+        "GET",
+        "/v2/videos",
+        "List videos",
+        options=(
+            ("--id", "str", True, "One or more video IDs"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-video",
+        "GET",
+        "/v2/videos/{id}",
+        "Get details about videos",
+        arguments=("id",),
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The ID of the search that is related to this request",
+            ),
+        ),
+    ),
+    Endpoint(
+        "license-videos",
+        "POST",
+        "/v2/videos/licenses",
+        "License videos",
+        arguments=("data",),
+        options=(
+            (
+                "--subscription-id",
+                "str",
+                False,
+                "The subscription ID to use for licensing",
+            ),
+            ("--size", "str", False, "The size of the video to license"),
+            (
+                "--search-id",
+                "str",
+                False,
+                "The Search ID that led to this licensing event",
+            ),
+        ),
+        flags=("idempotency",),
+    ),
+    Endpoint(
+        "get-video-license-list",
+        "GET",
+        "/v2/videos/licenses",
+        "List video licenses",
+        options=(
+            ("--video-id", "str", False, "Show licenses for the specified video ID"),
+            (
+                "--license",
+                "str",
+                False,
+                (
+                    "Show videos that are available with the specified license,"
+                    " such as `standard` or `enhanced`"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort by oldest or newest videos first"),
+            ("--username", "str", False, "Filter licenses by username of licensee"),
+            (
+                "--start-date",
+                "str",
+                False,
+                "Show licenses created on or after the specified date",
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                "Show licenses created before the specified date",
+            ),
+            (
+                "--download-availability",
+                "str",
+                False,
+                "Filter licenses by download availability",
+            ),
+            (
+                "--team-history",
+                "str",
+                False,
+                "Set to true to see license history for all members of your team.",
+            ),
+        ),
+    ),
+    Endpoint(
+        "download-videos",
+        "POST",
+        "/v2/videos/licenses/{id}/downloads",
+        "Download videos",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "create-video-collection",
+        "POST",
+        "/v2/videos/collections",
+        "Create video collections",
+        arguments=("data",),
+    ),
+    Endpoint(
+        "get-video-collection-list",
+        "GET",
+        "/v2/videos/collections",
+        "List video collections",
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+        ),
+    ),
+    Endpoint(
+        "get-video-collection",
+        "GET",
+        "/v2/videos/collections/{id}",
+        "Get the details of video collections",
+        arguments=("id",),
+        options=(
+            (
+                "--embed",
+                "str",
+                True,
+                (
+                    "Which sharing information to include in the response, such as"
+                    " a URL to the collection"
+                ),
+            ),
+            ("--share-code", "str", False, "Code to retrieve a shared collection"),
+        ),
+    ),
+    Endpoint(
+        "rename-video-collection",
+        "POST",
+        "/v2/videos/collections/{id}",
+        "Rename video collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "delete-video-collection",
+        "DELETE",
+        "/v2/videos/collections/{id}",
+        "Delete video collections",
+        arguments=("id",),
+    ),
+    Endpoint(
+        "list-video-categories",
+        "GET",
+        "/v2/videos/categories",
+        "List video categories",
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+        ),
+    ),
+    Endpoint(
+        "add-video-collection-items",
+        "POST",
+        "/v2/videos/collections/{id}/items",
+        "Add videos to collections",
+        arguments=("id", "data"),
+    ),
+    Endpoint(
+        "get-video-collection-items",
+        "GET",
+        "/v2/videos/collections/{id}/items",
+        "Get the contents of video collections",
+        arguments=("id",),
+        options=(
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            (
+                "--share-code",
+                "str",
+                False,
+                "Code to retrieve the contents of a shared collection",
+            ),
+            ("--sort", "str", False, "Sort order"),
+        ),
+    ),
+    Endpoint(
+        "delete-video-collection-items",
+        "DELETE",
+        "/v2/videos/collections/{id}/items",
+        "Remove videos from collections",
+        arguments=("id",),
+        options=(
+            (
+                "--item-id",
+                "str",
+                True,
+                "One or more video IDs to remove from the collection",
+            ),
+        ),
+    ),
+    Endpoint(
+        "find-similar-videos",
+        "GET",
+        "/v2/videos/{id}/similar",
+        "List similar videos",
+        arguments=("id",),
+        options=(
+            (
+                "--language",
+                "str",
+                False,
+                "Language for the keywords and categories in the response",
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--view", "str", False, "Amount of detail to render in the response"),
+        ),
+    ),
+    Endpoint(
+        "get-updated-videos",
+        "GET",
+        "/v2/videos/updated",
+        "List updated videos",
+        options=(
+            (
+                "--start-date",
+                "str",
+                False,
+                (
+                    "Show videos updated on or after the specified date. The API"
+                    " will default to UTC (00:00:00) if no specific time is"
+                    " provided, ensuring consistency."
+                ),
+            ),
+            (
+                "--end-date",
+                "str",
+                False,
+                (
+                    "Show videos updated before the specified date. The API will"
+                    " default to UTC (00:00:00) if no specific time is provided,"
+                    " ensuring consistency. Please note that the end date must be"
+                    " at least 5 minutes after the start date."
+                ),
+            ),
+            (
+                "--interval",
+                "str",
+                False,
+                (
+                    "Show videos updated in the specified time period, where the"
+                    " time period is an interval (like SQL INTERVAL) such as 1 DAY,"
+                    " 6 HOUR, or 30 MINUTE; the default is 1 HOUR, which shows"
+                    " videos that were updated in the hour preceding the request"
+                ),
+            ),
+            ("--page", "int", False, "Page number"),
+            ("--per-page", "int", False, "Number of results per page"),
+            ("--sort", "str", False, "Sort by oldest or newest videos first"),
+        ),
+        flags=("pages", "shards"),
+    ),
+)
@@ -0,0 +1,335 @@
+"""
+serve command.
+
+Runs a daemon that keeps the interpreter, the imported commands, the pooled
+HTTP sessions and the caches warm, and runs the commands that shutterstock-client
+forwards to it over a Unix domain socket. The daemon forks workers once the
+commands are imported; each worker runs one command at a time and keeps its own
+sessions, so a long command or a slow client only holds up its own worker.
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+
+import click
+
+from .client import (
+    EXIT,
+    READ,
+    REQUEST,
+    STDERR,
+    STDIN,
+    STDOUT,
+    connect,
+    recv_frame,
+    send_frame,
+    socket_path,
+)
+from .utils.settings import settings
+from .utils.stats import report
+from .utils.stats import reset as reset_stats
+
+DEFAULT_WORKERS = 4
+
+# Seconds a client may go without reading the output of its command before the
+# command is abandoned.
+DEFAULT_SEND_TIMEOUT = 60.0
+
+
+class RemoteOutput(io.RawIOBase):
+    """
+    Writable stream that sends what is written to the client.
+    """
+
+    def __init__(self, conn, kind, tty):
+        super().__init__()
+        self.conn = conn
+        self.kind = kind
+        self.tty = tty
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        send_frame(self.conn, self.kind, bytes(b))
+        return len(b)
+
+    def isatty(self):
+        return self.tty
+
+
+class RemoteInput(io.RawIOBase):
+    """
+    Readable stream that reads the stdin of the client when the command reads it.
+    """
+
+    def __init__(self, conn):
+        super().__init__()
+        self.conn = conn
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        send_frame(self.conn, READ, str(len(b)).encode("ascii"))
+        # The send timeout must not cut off a client whose stdin is slow.
+        timeout = self.conn.gettimeout()
+        self.conn.settimeout(None)
+        try:
+            kind, payload = recv_frame(self.conn)
+        finally:
+            self.conn.settimeout(timeout)
+        if kind != STDIN:
+            raise EOFError("The client closed the connection")
+        b[: len(payload)] = payload
+        return len(payload)
+
+
+def text_stream(raw, tty):
+    """
+    :param raw: RemoteOutput or RemoteInput
+    :param tty: Whether the stream of the client is a terminal.
+    :return: io.TextIOWrapper
+    """
+    buffered = io.BufferedReader(raw) if raw.readable() else io.BufferedWriter(raw)
+    return io.TextIOWrapper(buffered, encoding="UTF-8", line_buffering=tty)
+
+
+def run_command(argv):
+    """
+    Runs the CLI as if it had been started with these arguments.
+    :param argv: Arguments of the command.
+    :return: Exit code.
+    """
+    from .cli import cli  # pylint: disable=import-outside-toplevel
+
+    try:
+        cli.main(args=argv, prog_name="shutterstock", standalone_mode=True)
+    except SystemExit as error:
+        if error.code is None or isinstance(error.code, int):
+            return error.code or 0
+        print(error.code, file=sys.stderr)
+        return 1
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def parse_request(payload):
+    """
+    :param payload: Payload of a REQUEST frame.
+    :return: Dict with the argv, cwd, env and tty of the command.
+    """
+    try:
+        request = json.loads(payload)
+        argv, cwd, env, tty = (request[key] for key in ("argv", "cwd", "env", "tty"))
+        valid = (
+            all(isinstance(arg, str) for arg in argv)
+            and isinstance(cwd, str)
+            and all(
+                isinstance(name, str) and isinstance(value, str)
+                for name, value in env.items()
+            )
+            and isinstance(tty["stdout"], bool)
+            and isinstance(tty["stderr"], bool)
+        )
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        raise ValueError("invalid request") from error
+    if not valid:
+        raise ValueError("invalid request")
+    return request
+
+
+def handle(conn):
+    """
+    Runs one command for a client, with the client's arguments, working
+    directory, SHUTTERSTOCK_* environment variables and standard streams.
+    Settings that are read once, such as the pool size and the retry policy,
+    keep the values of the daemon's environment. Statistics are counted per
+    command, and reported to the client when it sets SHUTTERSTOCK_CLI_STATS.
+    :param conn: Connected socket.socket
+    :return: None
+    """
+    conn.settimeout(
+        float(
+            os.getenv("SHUTTERSTOCK_CLI_SEND_TIMEOUT", str(DEFAULT_SEND_TIMEOUT))
+        )
+    )
+    kind, payload = recv_frame(conn)
+    if kind != REQUEST:
+        return
+    try:
+        request = parse_request(payload)
+    except ValueError as error:
+        send_frame(conn, STDERR, f"shutterstock serve: {error}\n".encode("utf-8"))
+        send_frame(conn, EXIT, b"2")
+        return
+    tty = request["tty"]
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    saved_environ = {
+        name: value
+        for name, value in os.environ.items()
+        if name.startswith("SHUTTERSTOCK_")
+    }
+    saved_cwd = os.getcwd()
+    sys.stdin = text_stream(RemoteInput(conn), False)
+    sys.stdout = text_stream(RemoteOutput(conn, STDOUT, tty["stdout"]), tty["stdout"])
+    sys.stderr = text_stream(RemoteOutput(conn, STDERR, tty["stderr"]), tty["stderr"])
+    for name in saved_environ:
+        del os.environ[name]
+    os.environ.update(request["env"])
+    try:
+        os.chdir(request["cwd"])
+        settings.reset()
+        reset_stats()
+        code = run_command(request["argv"])
+        if os.getenv("SHUTTERSTOCK_CLI_STATS") == "true":
+            report()
+        reset_stats()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        for name in request["env"]:
+            os.environ.pop(name, None)
+        os.environ.update(saved_environ)
+        os.chdir(saved_cwd)
+        settings.reset()
+    send_frame(conn, EXIT, str(code).encode("ascii"))
+
+
+def listen(path):
+    """
+    :param path: Socket path.
+    :return: Listening socket.socket, readable and writable only by this user.
+    """
+    if os.path.exists(path):
+        conn = connect(path)
+        if conn is not None:
+            conn.close()
+            raise click.ClickException(f"A daemon is already listening on {path}")
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+    server.listen(64)
+    return server
+
+
+def serve_forever(server):
+    """
+    Answers clients one at a time until the socket is closed.
+    A client that stops reading its output for SHUTTERSTOCK_CLI_SEND_TIMEOUT
+    seconds has its command abandoned.
+    :param server: Listening socket.socket
+    :return: None
+    """
+    while True:
+        try:
+            conn, _ = server.accept()
+        except OSError:
+            return
+        with conn:
+            try:
+                handle(conn)
+            except OSError:
+                # The client went away; its command is abandoned.
+                pass
+
+
+def work(server):
+    """
+    Runs a worker process, which answers clients until the socket is closed.
+    The daemon stops its workers when it is interrupted or terminated.
+    :param server: Listening socket.socket
+    :return: Never returns.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    code = 0
+    try:
+        serve_forever(server)
+    except BaseException:  # pylint: disable=broad-except
+        code = 1
+    finally:
+        os._exit(code)  # pylint: disable=protected-access
+
+
+def run_workers(server, count):
+    """
+    Forks workers that share the listening socket, and replaces those that exit,
+    until interrupted or terminated, then stops them.
+    :param server: Listening socket.socket
+    :param count: Number of workers, that is of commands run at the same time.
+    :return: None
+    """
+    # Commands are imported before forking, so that every worker starts warm.
+    from .cli import cli  # pylint: disable=import-outside-toplevel,unused-import
+
+    workers = set()
+    try:
+        while True:
+            while len(workers) < count:
+                pid = os.fork()
+                if pid == 0:
+                    work(server)
+                workers.add(pid)
+            pid, _ = os.wait()
+            workers.discard(pid)
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "path",
+    help=(
+        "Unix socket to listen on; defaults to SHUTTERSTOCK_CLI_SOCKET or serve.sock"
+        " in the CLI cache directory"
+    ),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: int(
+        os.getenv("SHUTTERSTOCK_CLI_SERVE_WORKERS", str(DEFAULT_WORKERS))
+    ),
+    show_default=str(DEFAULT_WORKERS),
+    help=(
+        "Number of commands run at the same time; defaults to"
+        " SHUTTERSTOCK_CLI_SERVE_WORKERS"
+    ),
+)
+def serve(path, workers):
+    """
+    Run a daemon that answers shutterstock-client
+    """
+    path = path or socket_path()
+    server = listen(path)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    click.echo(f"Listening on {path}", err=True)
+    try:
+        if workers > 1 and hasattr(os, "fork"):
+            run_workers(server, workers)
+        else:
+            serve_forever(server)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(path)
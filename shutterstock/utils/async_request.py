@@ -0,0 +1,136 @@
+"""
+Asyncio HTTP functions.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .request import (
+    max_in_flight,
+    parse_response,
+    request,
+    request_key,
+    reserve_connections,
+)
+from .request_helper import RequestHelper
+from .singleflight import SingleFlight
+
+
+class AsyncClient:
+    """
+    Asyncio counterpart of the HTTP functions, for fan-out workloads such as
+    fetching many images or search pages from one process.
+
+    Requests run on the shared pooled session in a worker pool, and at most
+    `limit` of them are in flight at once; the pool of the session grows to
+    keep a connection open for each of them. Identical GET requests made while
+    one is in flight share its decoded response, which callers must not modify.
+
+        async with AsyncClient(limit=100) as client:
+            images = await client.gather(
+                client.get(f"/v2/images/{image_id}", params={}) for image_id in ids
+            )
+    """
+
+    def __init__(self, limit=None):
+        self.limit = limit or max_in_flight()
+        reserve_connections(self.limit)
+        self._executor = ThreadPoolExecutor(max_workers=self.limit)
+        self._semaphore = None
+        self._flights = SingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker pool.
+        :return: None
+        """
+        self._executor.shutdown(wait=False)
+
+    async def request(self, method, url, params, json_data=None):
+        """
+        Sends a request once a slot is free.
+        :param method: HTTP method.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON, or the raw content if the body is not JSON.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        call = functools.partial(self._call, method, url, params, json_data)
+        if method == "GET":
+            key = request_key(RequestHelper(), method, url, params)
+            call = functools.partial(self._flights.do, key, call)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, call)
+
+    @staticmethod
+    def _call(method, url, params, json_data):
+        return parse_response(request(method, url, params, json_data))
+
+    async def get(self, url, params, json_data=None):
+        """
+        Get resource.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON.
+        """
+        return await self.request("GET", url, params, json_data)
+
+    async def post(self, url, params, json_data):
+        """
+        Post resource.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON.
+        """
+        return await self.request("POST", url, params, json_data)
+
+    async def delete(self, url, params, json_data):
+        """
+        Delete resource.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON.
+        """
+        return await self.request("DELETE", url, params, json_data)
+
+    async def put(self, url, params, json_data):
+        """
+        Put resource.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON.
+        """
+        return await self.request("PUT", url, params, json_data)
+
+    async def patch(self, url, params, json_data):
+        """
+        PATCH resource.
+        :param url: URL of the endpoint.
+        :param params: Request parameters.
+        :param json_data: Request body.
+        :return: Decoded JSON.
+        """
+        return await self.request("PATCH", url, params, json_data)
+
+    @staticmethod
+    async def gather(coroutines):
+        """
+        Runs requests concurrently.
+        :param coroutines: Iterable of request coroutines.
+        :return: List of decoded responses, in the order they were given.
+        """
+        return await asyncio.gather(*coroutines)
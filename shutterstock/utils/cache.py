@@ -0,0 +1,308 @@
+"""
+Response cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+
+from . import codec
+from .paths import REFERENCE_INDEX, cache_dir
+
+DAY = 24 * 60 * 60
+
+# Reference data that rarely changes, by endpoint, with the number of seconds
+# a cached response stays fresh.
+TTLS = {
+    "/v2/images/categories": 7 * DAY,
+    "/v2/videos/categories": 7 * DAY,
+    "/v2/audio/genres": 7 * DAY,
+    "/v2/audio/moods": 7 * DAY,
+    "/v2/audio/instruments": 7 * DAY,
+    "/v2/editorial/images/categories": 7 * DAY,
+    "/v2/editorial/videos/categories": 7 * DAY,
+    "/v2/ai/audio/descriptors": DAY,
+    "/v2/ai/audio/instruments": DAY,
+}
+
+# Resources that can change at any time. They are cached, but every request is
+# revalidated with If-None-Match / If-Modified-Since, and a 304 reuses the body.
+REVALIDATED = re.compile(
+    r"^/v2/(?:images|videos|audio)/\d+$"
+    r"|^/v2/(?:images|videos|audio)/collections/[^/]+(?:/items)?$"
+    r"|^/v2/contributors/[^/]+/collections/[^/]+(?:/items)?$"
+)
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Eviction trims the cache to this fraction of its limit, and the running total
+# of the size of the entries is kept in USAGE_FILE, so storing a response only
+# scans the directory once the cache has grown past its limit again. Concurrent
+# writers can make the total drift, and every eviction counts it afresh.
+EVICT_TO = 0.9
+USAGE_FILE = "usage.total"
+
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def canonical_params(params):
+    """
+    Drops unset parameters and sorts the rest, so equivalent requests get the same key.
+    :param params: Request parameters.
+    :return: List of [name, values] pairs.
+    """
+    canonical = []
+    for name, value in sorted((params or {}).items()):
+        if value is None or value == ():
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        canonical.append([name, [str(v) for v in values]])
+    return canonical
+
+
+class ResponseCache:
+    """
+    Responses stored as one JSON file each, evicted least recently used first
+    once the directory grows beyond `max_bytes`. The modification time of an
+    entry is when it was stored or last revalidated, and its access time when it
+    was last used.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(method, url, params, identity):
+        """
+        :param method: HTTP method.
+        :param url: Full URL, including the base endpoint.
+        :param params: Request parameters.
+        :param identity: Credential identity, see RequestHelper.identity.
+        :return: str
+        """
+        canonical = json.dumps([method, url, canonical_params(params), identity])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """
+        Reads an entry and marks it as recently used.
+        :param key: Cache key.
+        :return: Dict or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="UTF-8") as entry_file:
+                entry = codec.load(entry_file)
+                stored = os.fstat(entry_file.fileno()).st_mtime
+            os.utime(path, (time.time(), stored))
+        except (OSError, ValueError):
+            return None
+        entry["stored"] = stored
+        return entry
+
+    def set(self, key, url, res):
+        """
+        Stores a response.
+        :param key: Cache key.
+        :param url: URL of the endpoint.
+        :param res: requests.Response
+        :return: None
+        """
+        self.store(
+            key,
+            {
+                "url": url,
+                "status": res.status_code,
+                "headers": {
+                    h: res.headers[h] for h in CACHED_HEADERS if h in res.headers
+                },
+                "body": res.content.decode("utf-8"),
+            },
+        )
+        if url in TTLS:
+            self.add_reference(url, key)
+
+    def references(self):
+        """
+        :return: Dict of reference data endpoint -> key of its latest response.
+        """
+        try:
+            with open(
+                os.path.join(self.directory, REFERENCE_INDEX), encoding="UTF-8"
+            ) as index_file:
+                return codec.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def add_reference(self, url, key):
+        """
+        Records the key of the latest response of a reference data endpoint.
+        :param url: URL of the endpoint.
+        :param key: Cache key.
+        :return: None
+        """
+        path = os.path.join(self.directory, REFERENCE_INDEX)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as index_file:
+            index_file.write(codec.dumps({**self.references(), url: key}))
+        os.replace(tmp_path, path)
+
+    def revalidated(self, key, entry, res):
+        """
+        Marks an entry as fresh after the API answered 304 Not Modified. The entry
+        is only rewritten if the response carries new validators, otherwise its
+        modification time is refreshed.
+        :param key: Cache key.
+        :param entry: Cache entry.
+        :param res: The 304 response, which may carry new validators.
+        :return: None
+        """
+        entry["stored"] = time.time()
+        validators = {
+            h: res.headers[h] for h in ("ETag", "Last-Modified") if h in res.headers
+        }
+        if any(entry["headers"].get(h) != v for h, v in validators.items()):
+            entry["headers"].update(validators)
+            self.store(key, {k: v for k, v in entry.items() if k != "stored"})
+            return
+        try:
+            os.utime(self._path(key), (entry["stored"], entry["stored"]))
+        except OSError:
+            pass
+
+    def store(self, key, entry):
+        """
+        Writes an entry atomically, and evicts entries once the running total kept
+        in the usage file exceeds max_bytes.
+        :param key: Cache key.
+        :param entry: Cache entry.
+        :return: None
+        """
+        path = self._path(key)
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as entry_file:
+            entry_file.write(codec.dumps(entry))
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+        total = self.usage()
+        if total is None or total + size - previous > self.max_bytes:
+            self.evict()
+        else:
+            self.write_usage(total + size - previous)
+
+    def usage(self):
+        """
+        :return: int, the running total of the size of the entries, or None if
+            it has not been counted yet.
+        """
+        try:
+            with open(
+                os.path.join(self.directory, USAGE_FILE), encoding="UTF-8"
+            ) as usage_file:
+                return int(usage_file.read())
+        except (OSError, ValueError):
+            return None
+
+    def write_usage(self, total):
+        """
+        :param total: Size of the entries, in bytes.
+        :return: None
+        """
+        path = os.path.join(self.directory, USAGE_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as usage_file:
+            usage_file.write(str(total))
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """
+        Deletes the least recently used entries until the cache fits in
+        EVICT_TO of max_bytes, so that the directory is not scanned again until
+        that margin has been written, and records the size of what is left.
+        :return: None
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self.write_usage(total)
+
+
+def is_fresh(entry, ttl):
+    """
+    :param entry: Cache entry.
+    :param ttl: Seconds the entry stays fresh.
+    :return: bool
+    """
+    return time.time() - entry["stored"] < ttl
+
+
+def has_validator(res):
+    """
+    :param res: requests.Response
+    :return: Whether the response can be revalidated, that is whether it has an
+        ETag or a Last-Modified header.
+    """
+    return "ETag" in res.headers or "Last-Modified" in res.headers
+
+
+def conditional_headers(entry):
+    """
+    :param entry: Cache entry.
+    :return: Dict of headers that ask the API to answer 304 if the entry is still valid.
+    """
+    headers = {}
+    if "ETag" in entry["headers"]:
+        headers["If-None-Match"] = entry["headers"]["ETag"]
+    if "Last-Modified" in entry["headers"]:
+        headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+    return headers
+
+
+def to_response(entry):
+    """
+    Rebuilds a response from a cache entry.
+    :param entry: Cache entry.
+    :return: requests.Response
+    """
+    import requests  # pylint: disable=import-outside-toplevel
+
+    res = requests.Response()
+    res.status_code = entry["status"]
+    res.headers.update(entry["headers"])
+    res._content = entry["body"].encode("utf-8")  # pylint: disable=protected-access
+    res._content_consumed = True  # pylint: disable=protected-access
+    res.url = entry["url"]
+    return res
+
+
+def get_cache():
+    """
+    Returns the response cache under the CLI cache directory. Its size can be set
+    with the SHUTTERSTOCK_CLI_CACHE_MAX_BYTES environment variable.
+    :return: ResponseCache
+    """
+    max_bytes = int(
+        os.getenv("SHUTTERSTOCK_CLI_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))
+    )
+    return ResponseCache(cache_dir("responses"), max_bytes)
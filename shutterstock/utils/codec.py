@@ -0,0 +1,75 @@
+"""
+JSON codec.
+
+Uses orjson when it is installed and the standard library otherwise. orjson
+raises a subclass of json.JSONDecodeError, so callers catch the same error with
+either codec.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+NAME = "orjson" if orjson else "json"
+
+
+def loads(data):
+    """
+    Decodes a JSON document.
+    :param data: bytes or str
+    :return: Decoded JSON.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(file):
+    """
+    Decodes a JSON file, such as the data argument of a command.
+    :param file: File opened for reading.
+    :return: Decoded JSON.
+    """
+    return loads(file.read())
+
+
+def dumps(data, indent=None, sort_keys=False):
+    """
+    Encodes a JSON document. Compact documents are encoded by orjson when it is
+    installed; indented ones always use the standard library, because orjson
+    only indents by two spaces. Either way, text is written as UTF-8 rather
+    than escaped.
+    :param data: Decoded JSON.
+    :param indent: Number of spaces per level, or None for compact JSON.
+    :param sort_keys: Whether to sort the keys of objects.
+    :return: str
+    """
+    if orjson and indent is None:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else 0
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            # Values orjson rejects, such as integers wider than 64 bits or
+            # keys that are not strings, are left to the standard library.
+            pass
+    separators = None if indent else (",", ":")
+    return json.dumps(
+        data,
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=separators,
+        ensure_ascii=False,
+    )
+
+
+def decode(res):
+    """
+    Decodes the body of a response.
+    :param res: requests.Response
+    :return: Decoded JSON.
+    """
+    return loads(res.content)
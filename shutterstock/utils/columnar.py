@@ -0,0 +1,329 @@
+"""
+Columnar export.
+"""
+
+import csv
+import re
+
+import click
+
+from . import codec
+from .select import parse_paths
+
+BATCH_SIZE = 10000
+
+# Columns exported for each kind of result, as (dotted path, type).
+SCHEMAS = {
+    "images": [
+        ("id", "string"),
+        ("description", "string"),
+        ("image_type", "string"),
+        ("media_type", "string"),
+        ("aspect", "float"),
+        ("is_editorial", "bool"),
+        ("is_illustration", "bool"),
+        ("has_model_release", "bool"),
+        ("has_property_release", "bool"),
+        ("added_date", "string"),
+        ("contributor.id", "string"),
+        ("assets.preview.url", "string"),
+        ("assets.preview.width", "int"),
+        ("assets.preview.height", "int"),
+        ("keywords", "string"),
+    ],
+    "videos": [
+        ("id", "string"),
+        ("description", "string"),
+        ("media_type", "string"),
+        ("aspect", "float"),
+        ("aspect_ratio", "string"),
+        ("duration", "float"),
+        ("is_editorial", "bool"),
+        ("has_model_release", "bool"),
+        ("has_property_release", "bool"),
+        ("added_date", "string"),
+        ("contributor.id", "string"),
+        ("assets.preview_mp4.url", "string"),
+        ("assets.thumb_jpg.url", "string"),
+        ("keywords", "string"),
+    ],
+    "audio": [
+        ("id", "string"),
+        ("title", "string"),
+        ("description", "string"),
+        ("media_type", "string"),
+        ("duration", "int"),
+        ("bpm", "int"),
+        ("is_instrumental", "bool"),
+        ("vocal_description", "string"),
+        ("genres", "string"),
+        ("moods", "string"),
+        ("instruments", "string"),
+        ("artists", "string"),
+        ("added_date", "string"),
+        ("contributor.id", "string"),
+        ("assets.preview_mp3.url", "string"),
+        ("keywords", "string"),
+    ],
+    "sfx": [
+        ("id", "string"),
+        ("title", "string"),
+        ("description", "string"),
+        ("media_type", "string"),
+        ("duration", "float"),
+        ("added_date", "string"),
+        ("contributor.id", "string"),
+        ("assets.preview_mp3.url", "string"),
+        ("keywords", "string"),
+    ],
+    "editorial": [
+        ("id", "string"),
+        ("title", "string"),
+        ("caption", "string"),
+        ("description", "string"),
+        ("byline", "string"),
+        ("date_taken", "string"),
+        ("supplier_code", "string"),
+        ("aspect", "float"),
+        ("categories", "string"),
+        ("keywords", "string"),
+        ("assets.thumb_220.url", "string"),
+        ("assets.preview_1000.url", "string"),
+    ],
+    "licenses": [
+        ("id", "string"),
+        ("license", "string"),
+        ("download_time", "string"),
+        ("is_downloadable", "bool"),
+        ("subscription_id", "string"),
+        ("user.username", "string"),
+        ("image.id", "string"),
+        ("image.format.size", "string"),
+        ("video.id", "string"),
+        ("video.format.size", "string"),
+        ("audio.id", "string"),
+        ("editorial.id", "string"),
+        ("sfx.id", "string"),
+    ],
+    "updated": [
+        ("id", "string"),
+        ("updated_time", "string"),
+        ("updates", "string"),
+    ],
+    "collections": [
+        ("id", "string"),
+        ("name", "string"),
+        ("total_item_count", "int"),
+        ("items_updated_time", "string"),
+        ("created_time", "string"),
+        ("updated_time", "string"),
+        ("share_code", "string"),
+        ("share_url", "string"),
+        ("cover_item.id", "string"),
+    ],
+    "collection_items": [
+        ("id", "string"),
+        ("added_time", "string"),
+        ("media_type", "string"),
+    ],
+}
+
+# Schema of each endpoint, as (path pattern, schema name); the first pattern
+# that matches the whole path wins. Endpoints that map to None, or that match
+# no pattern, take their columns from the keys of their first record.
+ROUTES = [
+    (
+        r"/v2/(images|videos|audio|sfx|editorial/images|editorial/videos)/licenses",
+        "licenses",
+    ),
+    (r"/v2/(images|videos)/updated", "updated"),
+    (r"/v2/(images|videos|audio)/collections(/[^/]+)?", "collections"),
+    (r"/v2/contributors/[^/]+/collections(/[^/]+)?", "collections"),
+    (r"/v2/(images|videos|audio)/collections/[^/]+/items", "collection_items"),
+    (r"/v2/contributors/[^/]+/collections/[^/]+/items", "collection_items"),
+    (r"/v2/(images|videos|editorial/images|editorial/videos)/categories", None),
+    (r"/v2/(images|videos)/search/suggestions", None),
+    (r"/v2/audio/(genres|instruments|moods)", None),
+    (r"/v2/editorial/images/(updated|livefeeds.*)", None),
+    (r"/v2/(images|bulk_search/images|cv/similar/images)", "images"),
+    (r"/v2/images/(search|recommendations|[^/]+|[^/]+/similar)", "images"),
+    (r"/v2/(videos|cv/similar/videos)", "videos"),
+    (r"/v2/videos/(search|[^/]+|[^/]+/similar)", "videos"),
+    (r"/v2/audio(/search|/[^/]+)?", "audio"),
+    (r"/v2/sfx(/search|/[^/]+)?", "sfx"),
+    (r"/v2/editorial/(images|videos)(/search|/[^/]+)?", "editorial"),
+]
+ROUTES = [(re.compile(pattern), name) for pattern, name in ROUTES]
+
+CONVERTERS = {
+    "string": lambda value: value
+    if isinstance(value, str)
+    else codec.dumps(value),
+    "int": int,
+    "float": float,
+    "bool": bool,
+}
+
+
+def schema_for(url, first_record=None, selection=None):
+    """
+    :param url: URL of the endpoint.
+    :param first_record: First record, whose keys are used when the endpoint
+        has no known schema.
+    :param selection: Fields chosen with --select, which replace the columns of
+        the schema and keep its types.
+    :return: List of (dotted path, type) columns.
+    """
+    schema = None
+    for pattern, name in ROUTES:
+        if pattern.fullmatch(url):
+            schema = SCHEMAS.get(name)
+            break
+    if selection:
+        types = dict(schema or [])
+        return [
+            (".".join(path), types.get(".".join(path), "string"))
+            for path in parse_paths(selection)
+        ]
+    if schema:
+        return schema
+    if isinstance(first_record, dict):
+        return [(key, "string") for key in first_record]
+    return [("value", "string")]
+
+
+def row(record, columns):
+    """
+    Flattens a record into the values of its columns.
+    :param record: Decoded record.
+    :param columns: List of (dotted path, type) columns.
+    :return: List of values, None where a field is missing.
+    """
+    values = []
+    for path, kind in columns:
+        value = record
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        values.append(None if value is None else CONVERTERS[kind](value))
+    return values
+
+
+def batches(items, size=None):
+    """
+    :param items: Iterable of records.
+    :param size: Number of records per batch, defaults to BATCH_SIZE.
+    :return: Iterator over lists of records.
+    """
+    size = size or BATCH_SIZE
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_csv(items, url, stream, selection=None):
+    """
+    Writes records as CSV, one batch at a time.
+    :param items: Iterable of records.
+    :param url: URL of the endpoint, used to pick the columns.
+    :param stream: Text file to write to.
+    :param selection: Fields chosen with --select.
+    :return: None
+    """
+    writer = csv.writer(stream)
+    columns = None
+    for batch in batches(items):
+        if columns is None:
+            columns = schema_for(url, batch[0], selection)
+            writer.writerow([path for path, _ in columns])
+        writer.writerows(row(record, columns) for record in batch)
+
+
+def load_pyarrow(output_format):
+    """
+    Imports pyarrow, which is optional and slow to import, when it is first used.
+    :param output_format: Format that needs pyarrow, for the error message.
+    :return: The pyarrow module.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise click.ClickException(
+            f"The {output_format} format requires pyarrow. Install it with"
+            " pip install 'shutterstock-cli[columnar]'"
+        ) from None
+    return pyarrow
+
+
+def arrow_schema(pyarrow, columns):
+    """
+    :param pyarrow: The pyarrow module.
+    :param columns: List of (dotted path, type) columns.
+    :return: pyarrow.Schema
+    """
+    types = {
+        "string": pyarrow.string(),
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+    }
+    return pyarrow.schema([(path, types[kind]) for path, kind in columns])
+
+
+def write_arrow(items, url, stream, output_format, selection=None):
+    """
+    Writes records as Parquet row groups or Arrow IPC record batches, one batch
+    at a time, so exports of any size use the memory of a single batch.
+    :param items: Iterable of records.
+    :param url: URL of the endpoint, used to pick the columns.
+    :param stream: Binary file to write to.
+    :param output_format: "parquet" or "arrow".
+    :param selection: Fields chosen with --select.
+    :return: None
+    """
+    pyarrow = load_pyarrow(output_format)
+    writer = None
+    try:
+        for batch in batches(items):
+            if writer is None:
+                columns = schema_for(url, batch[0], selection)
+                schema = arrow_schema(pyarrow, columns)
+                if output_format == "parquet":
+                    writer = pyarrow.parquet.ParquetWriter(stream, schema)
+                else:
+                    writer = pyarrow.ipc.new_stream(stream, schema)
+            rows = [row(record, columns) for record in batch]
+            arrays = [
+                pyarrow.array([values[i] for values in rows], type=field.type)
+                for i, field in enumerate(schema)
+            ]
+            table = pyarrow.Table.from_arrays(arrays, schema=schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_table(items, url, stream, output_format, selection=None):
+    """
+    Writes records in a columnar format.
+    :param items: Iterable of records.
+    :param url: URL of the endpoint, used to pick the columns.
+    :param stream: Text file to write to; binary formats use its buffer.
+    :param output_format: "csv", "parquet" or "arrow".
+    :param selection: Fields chosen with --select.
+    :return: None
+    """
+    if output_format == "csv":
+        write_csv(items, url, stream, selection)
+        return
+    stream.flush()
+    stream = getattr(stream, "buffer", stream)
+    write_arrow(items, url, stream, output_format, selection)
@@ -0,0 +1,117 @@
+"""
+Hedged requests.
+"""
+
+import collections
+import functools
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .stats import increment
+
+DEFAULT_DELAY = 1.0
+
+
+class Hedger:
+    """
+    Sends a second copy of an idempotent request when the first one takes longer
+    than the observed latency quantile, and returns whichever answers first.
+    Until `min_samples` latencies have been observed, `delay` is used instead.
+    """
+
+    def __init__(self, delay=DEFAULT_DELAY, quantile=0.95, window=200, min_samples=20):
+        self.default_delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._samples = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+
+    def delay(self):
+        """
+        :return: Seconds to wait for the first request before hedging it.
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.default_delay
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * self.quantile))]
+
+    def _record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+
+    def _timed(self, attempt):
+        start = time.monotonic()
+        result = attempt()
+        return result, time.monotonic() - start
+
+    def call(self, attempt):
+        """
+        :param attempt: Function that sends the request and returns the response.
+        :return: The first response to arrive.
+        """
+        increment("hedge.requests")
+        primary = self._executor.submit(self._timed, attempt)
+        done, _ = wait([primary], timeout=self.delay())
+        if done:
+            result, latency = primary.result()
+            self._record(latency)
+            return result
+
+        increment("hedge.fired")
+        hedge_start = time.monotonic()
+        hedge = self._executor.submit(self._timed, attempt)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result, latency = future.result()
+                except Exception as exception:  # pylint: disable=broad-except
+                    error = exception
+                    continue
+                if future is hedge:
+                    increment("hedge.won")
+                    primary.add_done_callback(
+                        functools.partial(self._saved, hedge_start + latency)
+                    )
+                loser = primary if future is hedge else hedge
+                loser.add_done_callback(self._close)
+                self._record(latency)
+                return result
+        raise error
+
+    @staticmethod
+    def _close(loser):
+        """
+        Closes the response that lost the race, so a streamed body does not hold
+        its pooled connection until it is garbage collected.
+        """
+        if loser.exception() is None:
+            result, _ = loser.result()
+            if hasattr(result, "close"):
+                result.close()
+
+    @staticmethod
+    def _saved(hedge_finished, primary):
+        if primary.exception() is None:
+            saved = time.monotonic() - hedge_finished
+            increment("hedge.saved_ms", int(saved * 1000))
+
+
+@functools.lru_cache(maxsize=None)
+def get_hedger():
+    """
+    Returns the hedger shared by every command, or None when hedging is disabled.
+    Hedging is enabled by setting SHUTTERSTOCK_CLI_HEDGE to true, and the delay used
+    before enough latencies are known can be set with SHUTTERSTOCK_CLI_HEDGE_DELAY.
+    :return: Hedger or None
+    """
+    if os.getenv("SHUTTERSTOCK_CLI_HEDGE") != "true":
+        return None
+    delay = os.getenv("SHUTTERSTOCK_CLI_HEDGE_DELAY", str(DEFAULT_DELAY))
+    return Hedger(delay=float(delay))
@@ -0,0 +1,93 @@
+"""
+HTTP/2 transport.
+
+httpx is optional and, like the rest of the network stack, imported only when
+the first request is sent.
+"""
+
+import functools
+
+import click
+
+
+def load_httpx():
+    """
+    :return: The httpx module.
+    """
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise click.ClickException(
+            "HTTP/2 support requires httpx. Install it with"
+            " pip install 'shutterstock-cli[http2]'"
+        ) from None
+    return httpx
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(pool_size, prior_knowledge=False):
+    """
+    Returns the HTTP/2 client shared by every command. HTTPS endpoints negotiate
+    HTTP/2 with ALPN; plain HTTP endpoints, such as a local stand-in server, are
+    spoken to in HTTP/2 directly when `prior_knowledge` is set.
+    :param pool_size: Maximum number of connections kept open.
+    :param prior_knowledge: Whether to skip HTTP/1.1 entirely.
+    :return: httpx.Client
+    """
+    # pylint: disable=import-outside-toplevel
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    httpx = load_httpx()
+    return httpx.Client(
+        http1=not prior_knowledge,
+        http2=True,
+        headers={"Accept-Encoding": ACCEPT_ENCODING},
+        limits=httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        ),
+    )
+
+
+def request(
+    method, url, params, json_data, headers, auth, timeout, pool_size, stream=False
+):  # pylint: disable=too-many-arguments
+    """
+    Sends a request over a multiplexed HTTP/2 connection. Transport errors are
+    raised as their requests counterparts, so retries treat both backends alike.
+    :param method: HTTP method.
+    :param url: Full URL of the endpoint.
+    :param params: Request parameters.
+    :param json_data: Request body.
+    :param headers: Request headers.
+    :param auth: HTTPBasicAuth or None.
+    :param timeout: Tuple of connect and read timeouts.
+    :param pool_size: Maximum number of connections kept open.
+    :param stream: Whether to return before the body is read.
+    :return: httpx.Response
+    """
+    import requests  # pylint: disable=import-outside-toplevel
+
+    httpx = load_httpx()
+    client = get_client(pool_size, prior_knowledge=url.startswith("http://"))
+    try:
+        req = client.build_request(
+            method,
+            url,
+            params={
+                name: list(value) if isinstance(value, tuple) else value
+                for name, value in (params or {}).items()
+                if value is not None and value != ()
+            },
+            json=json_data,
+            headers=headers,
+            timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+        )
+        return client.send(
+            req,
+            auth=(auth.username, auth.password) if auth else None,
+            stream=stream,
+        )
+    except httpx.TimeoutException as error:
+        raise requests.Timeout(error) from error
+    except httpx.TransportError as error:
+        raise requests.ConnectionError(error) from error
@@ -0,0 +1,103 @@
+"""
+Journal of idempotency keys.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+
+import click
+
+from .paths import cache_dir
+
+
+class KeyJournal:
+    """
+    Idempotency keys that were sent, stored as one file each, so that a request
+    sent again with a key that already got a response is refused instead of
+    reaching the API a second time. A key is reserved before its request is
+    sent, so concurrent commands cannot use it twice either.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, identity, key):
+        digest = hashlib.sha256(f"{identity}:{key}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def reserve(self, identity, key, url):
+        """
+        Reserves a key for a request.
+        :param identity: Credential identity, see RequestHelper.identity.
+        :param key: Idempotency key.
+        :param url: URL of the endpoint.
+        :return: None
+        :raises click.ClickException: If the key was already used.
+        """
+        path = self._path(identity, key)
+        try:
+            descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            raise click.ClickException(used_message(key, path)) from None
+        with os.fdopen(descriptor, "w", encoding="UTF-8") as entry_file:
+            json.dump({"url": url, "sent": time.time()}, entry_file)
+
+    def record(self, identity, key, url, status_code):
+        """
+        Records the status of the response to a key's request.
+        :param identity: Credential identity.
+        :param key: Idempotency key.
+        :param url: URL of the endpoint.
+        :param status_code: HTTP status of the response.
+        :return: None
+        """
+        path = self._path(identity, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as entry_file:
+            json.dump(
+                {"url": url, "sent": time.time(), "status": status_code}, entry_file
+            )
+        os.replace(tmp_path, path)
+
+    def release(self, identity, key):
+        """
+        Frees a key whose request was refused by the API, so it can be sent again.
+        :param identity: Credential identity.
+        :param key: Idempotency key.
+        :return: None
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(identity, key))
+
+
+def used_message(key, path):
+    """
+    :param key: Idempotency key.
+    :param path: Journal entry of the key.
+    :return: str, why a request with this key is refused.
+    """
+    try:
+        with open(path, encoding="UTF-8") as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        entry = {}
+    if "status" in entry:
+        outcome = f"got a {entry['status']} response"
+    else:
+        outcome = "got no response, or its command was interrupted"
+    return (
+        f"A request with idempotency key {key} was already sent to"
+        f" {entry.get('url', 'the API')} and {outcome}. Pass a new key to send"
+        f" another request, or delete {path} if it did not go through."
+    )
+
+
+def get_journal():
+    """
+    Returns the journal under the CLI cache directory.
+    :return: KeyJournal
+    """
+    return KeyJournal(cache_dir("idempotency"))
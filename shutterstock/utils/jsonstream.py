@@ -0,0 +1,149 @@
+"""
+Incremental JSON parsing.
+"""
+
+import codecs
+import json
+import re
+
+SPECIAL = re.compile(r'[\[\]{}",:\\]')
+
+SEPARATORS = re.compile(r"[\s,]*")
+
+WHITESPACE = re.compile(r"\s*")
+
+ENVELOPE, DATA, DONE = range(3)
+
+
+class DataArrayParser:
+    """
+    Parses a response body as it arrives and returns the items of its top-level
+    data array one at a time. Only the current item is kept in memory, so the
+    memory used depends on the size of a record rather than of the page.
+
+    The envelope is scanned character by character until the data array starts,
+    then each item is decoded by the C decoder once all of its bytes have arrived.
+    Responses without a data array are returned whole when the body ends.
+
+    The other fields of the envelope are kept in envelope, for those before the
+    data array, once it starts, and in trailer, for those after it, once the
+    body ends. envelope stays None for responses without a data array.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._text = ""
+        self._pos = 0
+        self._skip = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string = None
+        self._data_key = False
+        self._state = ENVELOPE
+        self._tail = ""
+        self.envelope = None
+        self.trailer = {}
+
+    def feed(self, data):
+        """
+        :param data: Next bytes of the body.
+        :return: List of the items completed by these bytes.
+        """
+        self._text += self._decoder.decode(data)
+        if self._state == ENVELOPE:
+            self._scan_envelope()
+        items = []
+        if self._state == DATA:
+            self._decode_items(items)
+        if self._state == DONE:
+            self._tail += self._text[self._pos :]
+        if self._state != ENVELOPE:
+            self._text = self._text[self._pos :] if self._state == DATA else ""
+            self._pos = 0
+        return items
+
+    def _scan_envelope(self):
+        text = self._text
+        for match in SPECIAL.finditer(text, self._pos):
+            i = match.start()
+            if i < self._skip:
+                continue
+            char = text[i]
+            if self._in_string:
+                if char == "\\":
+                    self._skip = i + 2
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = text[self._string_start + 1 : i]
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                if char == "[" and self._data_key:
+                    self.envelope = json.loads(text[:i] + "null}")
+                    del self.envelope["data"]
+                    self._state = DATA
+                    self._pos = i + 1
+                    return
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+            self._data_key = (
+                char == ":" and self._depth == 1 and self._last_string == "data"
+            )
+        self._pos = len(text)
+
+    def _decode_items(self, items):
+        text = self._text
+        while True:
+            pos = SEPARATORS.match(text, self._pos).end()
+            if pos >= len(text):
+                return
+            if text[pos] == "]":
+                self._state = DONE
+                self._pos = pos + 1
+                return
+            try:
+                item, end = self._json.raw_decode(text, pos)
+            except json.decoder.JSONDecodeError:
+                return
+            if isinstance(item, (int, float)) and not isinstance(item, bool):
+                # A number may continue in the next bytes, as in "1." then "0",
+                # so it is complete only once a separator or the end follows.
+                following = WHITESPACE.match(text, end).end()
+                if following >= len(text) or text[following] not in ",]":
+                    return
+            items.append(item)
+            self._pos = end
+
+    def close(self):
+        """
+        :return: List with the whole document if the body had no data array.
+        """
+        self._text += self._decoder.decode(b"", final=True)
+        if self._state == ENVELOPE:
+            return [json.loads(self._text)]
+        if self._state == DATA:
+            raise json.decoder.JSONDecodeError(
+                "Unterminated data array", self._text, self._pos
+            )
+        self.trailer.update(json.loads('{"data":null' + self._tail))
+        del self.trailer["data"]
+        return []
+
+
+def iter_records(chunks, parser=None):
+    """
+    :param chunks: Iterable of the bytes of a response body.
+    :param parser: DataArrayParser, to read the envelope of the response from.
+    :return: Iterator over the items of the data array, or over the whole
+        document if the body has no data array.
+    """
+    parser = parser or DataArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,275 @@
+"""
+Response output.
+"""
+
+import json
+import sys
+
+from . import codec
+from .columnar import write_table
+from .select import compile_selector
+from .settings import settings
+
+CHUNK_SIZE = 64 * 1024
+COLUMNAR_FORMATS = ("csv", "parquet", "arrow")
+RECORD_FORMATS = ("ndjson",) + COLUMNAR_FORMATS
+
+
+def output_stream():
+    """
+    :return: The file passed with --output, or stdout.
+    """
+    return settings.output or sys.stdout
+
+
+def indent_for(stream):
+    """
+    JSON is indented for people reading a terminal and compact for programs
+    reading a pipe or a file, unless --pretty or --compact is passed.
+    :param stream: File the JSON is written to.
+    :return: int or None
+    """
+    pretty = settings.pretty
+    if pretty is None:
+        pretty = stream.isatty()
+    return 4 if pretty else None
+
+
+def write_json(data, stream=None):
+    """
+    Encodes JSON to a file in chunks, without building the whole document in
+    memory first. Compact JSON is encoded by the codec, one record of the data
+    array at a time; indented JSON is encoded incrementally by the standard
+    library. Either way, text is written as UTF-8 rather than escaped.
+    :param data: Decoded JSON.
+    :param stream: File to write to, defaults to output_stream().
+    :return: None
+    """
+    stream = stream or output_stream()
+    indent = indent_for(stream)
+    if indent is None:
+        chunks = iter_compact(data)
+    else:
+        chunks = json.JSONEncoder(indent=indent, ensure_ascii=False).iterencode(data)
+    write_chunks(chunks, stream)
+    stream.write("\n")
+
+
+def iter_compact(data):
+    """
+    :param data: Decoded JSON.
+    :return: Iterator over the chunks of the compact encoding of data, with the
+        items of the data array of list and search responses encoded one by one.
+    """
+    if not (isinstance(data, dict) and isinstance(data.get("data"), list)):
+        yield codec.dumps(data)
+        return
+    separator = "{"
+    for key, value in data.items():
+        if key == "data":
+            yield separator + '"data":['
+            for index, record in enumerate(value):
+                yield codec.dumps(record) if index == 0 else "," + codec.dumps(record)
+            yield "]"
+        else:
+            yield f"{separator}{codec.dumps(key)}:{codec.dumps(value)}"
+        separator = ","
+    yield "}"
+
+
+def write_chunks(chunks, stream):
+    """
+    Writes chunks of text in writes of about CHUNK_SIZE characters.
+    :param chunks: Iterable of str.
+    :param stream: File to write to.
+    :return: None
+    """
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= CHUNK_SIZE:
+            stream.write("".join(buffer))
+            buffer = []
+            size = 0
+    stream.write("".join(buffer))
+
+
+def records(data):
+    """
+    :param data: Decoded JSON.
+    :return: The items of the data array of list and search responses, and of
+        each result of bulk searches, or the whole document for other responses.
+    """
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        return data["data"]
+    if is_bulk(data):
+        return [record for result in data["results"] for record in records(result)]
+    return [data]
+
+
+def is_bulk(data):
+    """
+    :param data: Decoded JSON.
+    :return: Whether data is a bulk search response, with one search per result.
+    """
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("results"), list)
+        and all(
+            isinstance(result, dict) and isinstance(result.get("data"), list)
+            for result in data["results"]
+        )
+    )
+
+
+def select(data):
+    """
+    Keeps only the fields chosen with --select in each record of a response.
+    :param data: Decoded JSON.
+    :return: Decoded JSON.
+    """
+    if not settings.select:
+        return data
+    return project_response(data, compile_selector(settings.select))
+
+
+def project_response(data, project):
+    """
+    :param data: Decoded JSON.
+    :param project: Function that projects a record.
+    :return: Decoded JSON, with each record projected and the envelopes of list,
+        search and bulk search responses kept.
+    """
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        return {**data, "data": [project(record) for record in data["data"]]}
+    if is_bulk(data):
+        return {
+            **data,
+            "results": [
+                project_response(result, project) for result in data["results"]
+            ],
+        }
+    return project(data)
+
+
+def write_ndjson(data, stream=None):
+    """
+    Writes one compact JSON document per line for each record of a response.
+    :param data: Decoded JSON.
+    :param stream: File to write to, defaults to output_stream().
+    :return: None
+    """
+    write_records(records(data), stream)
+
+
+def write_records(items, stream=None, url=""):
+    """
+    Writes records as they are produced, as one compact JSON document per line
+    or as rows of the columnar format chosen with --format.
+    :param items: Iterable of decoded records.
+    :param stream: File to write to, defaults to output_stream().
+    :param url: URL of the endpoint, used to pick the columns of columnar formats.
+    :return: None
+    """
+    stream = stream or output_stream()
+    if settings.format in COLUMNAR_FORMATS:
+        write_table(items, url, stream, settings.format, settings.select)
+        return
+    if settings.select:
+        items = map(compile_selector(settings.select), items)
+    lines = []
+    size = 0
+    for record in items:
+        line = codec.dumps(record)
+        lines.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            stream.write("\n".join(lines) + "\n")
+            lines = []
+            size = 0
+    if lines:
+        stream.write("\n".join(lines) + "\n")
+
+
+def write_document(items, summary, stream=None, envelope=None):
+    """
+    Writes records as they are produced, as the data array of a single JSON
+    document between the fields of envelope and those of summary.
+    :param items: Iterable of decoded records.
+    :param summary: Dict of the fields that follow the data array. It is read
+        after the last record, so it can be filled in while items are produced.
+    :param stream: File to write to, defaults to output_stream().
+    :param envelope: Dict of the fields that precede the data array.
+    :return: None
+    """
+    stream = stream or output_stream()
+    indent = indent_for(stream)
+    if settings.select:
+        items = map(compile_selector(settings.select), items)
+    write_chunks(iter_document(items, summary, indent, envelope or {}), stream)
+
+
+def iter_document(items, summary, indent=None, envelope=None):
+    """
+    :param items: Iterable of decoded records.
+    :param summary: Dict of the fields that follow the data array.
+    :param indent: Number of spaces per level, or None for compact JSON.
+    :param envelope: Dict of the fields that precede the data array.
+    :return: Iterator over the chunks of the document.
+    """
+    margin = "" if indent is None else "\n" + " " * indent
+    separator = "{"
+    for key, value in (envelope or {}).items():
+        yield separator + encode_field(key, value, indent)
+        separator = ","
+    yield separator + margin + ('"data":[' if indent is None else '"data": [')
+    empty = True
+    for record in items:
+        yield ("" if empty else ",") + encode_item(record, indent)
+        empty = False
+    yield "]" if empty or indent is None else margin + "]"
+    for key, value in summary.items():
+        yield "," + encode_field(key, value, indent)
+    yield "}\n" if indent is None else "\n}\n"
+
+
+def encode_field(key, value, indent=None):
+    """
+    :param key: Key of a field of the envelope of a document.
+    :param value: Decoded value of the field.
+    :param indent: Number of spaces per level, or None for compact JSON.
+    :return: str, the field encoded as a member of the document.
+    """
+    if indent is None:
+        return f"{codec.dumps(key)}:{codec.dumps(value)}"
+    margin = "\n" + " " * indent
+    encoded = codec.dumps(value, indent=indent).replace("\n", margin)
+    return f"{margin}{codec.dumps(key)}: {encoded}"
+
+
+def encode_item(record, indent=None):
+    """
+    :param record: Decoded record.
+    :param indent: Number of spaces per level, or None for compact JSON.
+    :return: str, the record encoded as an item of the data array of a document.
+    """
+    if indent is None:
+        return codec.dumps(record)
+    margin = "\n" + " " * indent * 2
+    return margin + codec.dumps(record, indent=indent).replace("\n", margin)
+
+
+def write(data, stream=None, url=""):
+    """
+    Writes a response in the format chosen with --format.
+    :param data: Decoded JSON.
+    :param stream: File to write to, defaults to output_stream().
+    :param url: URL of the endpoint, used to pick the columns of columnar formats.
+    :return: None
+    """
+    if settings.format in RECORD_FORMATS:
+        write_records(records(data), stream, url)
+    else:
+        write_json(select(data), stream)
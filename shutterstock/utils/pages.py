@@ -0,0 +1,350 @@
+"""
+Paged searches.
+
+Fetches every page of a search and writes its results as one stream, in
+order and without the duplicates that appear when results shift between
+pages while they are fetched. Feeds of updated media can also be split into
+time windows whose pages are fetched in parallel.
+"""
+
+import collections
+import concurrent.futures
+import datetime
+import functools
+import itertools
+import math
+import os
+
+import click
+
+from . import codec
+from .output import RECORD_FORMATS, output_stream, write_document, write_records
+from .request import max_in_flight, request
+from .settings import settings
+
+MIN_WINDOW = datetime.timedelta(minutes=5)
+
+
+def fetch_page(url, params):
+    """
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :return: Decoded page.
+    """
+    res = request("GET", url, params)
+    if res.status_code != 200:
+        raise click.ClickException(
+            f"Request for {url} failed with status {res.status_code}: {res.text}"
+        )
+    return codec.decode(res)
+
+
+def later_pages(first, start=1, max_results=None):
+    """
+    :param first: Decoded first page.
+    :param start: Number of the first page.
+    :param max_results: Number of results after which to stop.
+    :return: range of the numbers of the pages that follow the first page.
+    """
+    per_page = first.get("per_page") or len(first.get("data") or [])
+    if not per_page:
+        return range(0)
+    wanted = first.get("total_count", 0) - (start - 1) * per_page
+    if max_results:
+        wanted = min(wanted, max_results)
+    return range(start + 1, start + math.ceil(wanted / per_page))
+
+
+def iter_fetched(pool, requests):
+    """
+    Fetches pages concurrently, keeping at most SHUTTERSTOCK_CLI_MAX_IN_FLIGHT
+    requests in flight, and yields them in order. Requests that have not
+    started are cancelled when the iterator is closed.
+    :param pool: concurrent.futures.ThreadPoolExecutor
+    :param requests: Iterable of (url, params) tuples.
+    :return: Iterator over decoded pages.
+    """
+    window = max_in_flight()
+    pending = collections.deque()
+    try:
+        for url, params in requests:
+            pending.append(pool.submit(fetch_page, url, params))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def iter_numbered_pages(url, params, summary, max_results=None):
+    """
+    Fetches the first page, reads total_count from it, then fetches the other
+    pages concurrently and yields them in order.
+    :param url: URL of the endpoint.
+    :param params: Request parameters; paging starts at their page, if any.
+    :param summary: Dict that receives the total_count of the search.
+    :param max_results: Number of results after which to stop.
+    :return: Iterator over decoded pages.
+    """
+    start = params.get("page") or 1
+    first = fetch_page(url, {**params, "page": start})
+    summary["total_count"] = first.get("total_count", 0)
+    yield first
+    requests = (
+        (url, {**params, "page": page})
+        for page in later_pages(first, start, max_results)
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_in_flight()) as pool:
+        yield from iter_fetched(pool, requests)
+
+
+def parse_date(value, name):
+    """
+    :param value: Date, or date and time, in ISO 8601 format.
+    :param name: Name of the option, for error messages.
+    :return: datetime.datetime in UTC, without time zone.
+    """
+    try:
+        date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as error:
+        raise click.BadParameter(
+            f"{value!r} is not a valid date", param_hint=name
+        ) from error
+    if date.tzinfo:
+        date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return date
+
+
+def shard_windows(start_date, end_date, shards):
+    """
+    Splits a time range into consecutive windows of equal length that are at
+    least as long as the 5 minutes the API requires.
+    :param start_date: Start of the range, inclusive.
+    :param end_date: End of the range, exclusive.
+    :param shards: Maximum number of windows.
+    :return: List of (start date, end date) tuples in ISO 8601 format.
+    """
+    if not start_date or not end_date:
+        raise click.UsageError("--shards requires --start-date and --end-date")
+    start = parse_date(start_date, "--start-date")
+    span = int((parse_date(end_date, "--end-date") - start).total_seconds())
+    if span < MIN_WINDOW.total_seconds():
+        raise click.UsageError(
+            "--end-date must be at least 5 minutes after --start-date"
+        )
+    count = min(shards, span // int(MIN_WINDOW.total_seconds()))
+    bounds = [
+        (start + datetime.timedelta(seconds=span * index // count)).isoformat()
+        for index in range(count + 1)
+    ]
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_sharded_pages(url, params, windows, summary):
+    """
+    Fetches the first page of every time window, then the other pages of all
+    windows, concurrently and within the same limit of requests in flight, and
+    yields the pages of each window in order, window after window.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param windows: List of (start date, end date) tuples.
+    :param summary: Dict that receives the total_count of all windows.
+    :return: Iterator over decoded pages.
+    """
+    window_params = [
+        {**params, "start_date": start, "end_date": end, "page": 1}
+        for start, end in windows
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_in_flight()) as pool:
+        firsts = list(pool.map(functools.partial(fetch_page, url), window_params))
+        summary["total_count"] = sum(first.get("total_count", 0) for first in firsts)
+        requests = (
+            (url, {**first_params, "page": page})
+            for first_params, first in zip(window_params, firsts)
+            for page in later_pages(first)
+        )
+        fetched = iter_fetched(pool, requests)
+        try:
+            for first in firsts:
+                yield first
+                yield from itertools.islice(fetched, len(later_pages(first)))
+        finally:
+            fetched.close()
+
+
+def iter_cursor_pages(url, params, summary):
+    """
+    Follows the next cursor of each page until the last page. The next page is
+    requested before the current one is yielded, so it downloads while the
+    current one is written.
+    :param url: URL of the endpoint.
+    :param params: Request parameters; paging starts at their cursor, if any.
+    :param summary: Dict that receives the total_count of the search.
+    :return: Iterator over decoded pages.
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(1)
+    future = None
+    try:
+        future = pool.submit(fetch_page, url, params)
+        while future:
+            page = future.result()
+            summary.setdefault("total_count", page.get("total_count", 0))
+            future = None
+            if page.get("next") and page.get("data"):
+                next_params = {**params, "cursor": page["next"]}
+                future = pool.submit(fetch_page, url, next_params)
+            yield page
+    finally:
+        if future:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def record_id(record):
+    """
+    :param record: Decoded record.
+    :return: The id of the record, or None if it has none.
+    """
+    return record.get("id") if isinstance(record, dict) else None
+
+
+def update_id(record):
+    """
+    :param record: Decoded record of a feed of updated media.
+    :return: The id and update time of the record, or None if it has no id.
+    """
+    if not isinstance(record, dict) or record.get("id") is None:
+        return None
+    return record["id"], record.get("updated_time")
+
+
+def iter_results(pages, max_results=None, key=record_id):
+    """
+    :param pages: Iterable of decoded pages.
+    :param max_results: Number of results after which to stop.
+    :param key: Function that returns the identity of a record, or None.
+    :return: Iterator over the results of the pages, each identity only once.
+    """
+    seen = set()
+    count = 0
+    for page in pages:
+        for record in page.get("data") or []:
+            identity = key(record)
+            if identity is not None:
+                if identity in seen:
+                    continue
+                seen.add(identity)
+            yield record
+            count += 1
+            if max_results and count >= max_results:
+                return
+
+
+def print_pages(url, params, cursor=False, max_results=None, shards=None):
+    """
+    Writes the results of every page of a search as they arrive, as records in
+    the ndjson and columnar formats, or as a single response otherwise.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param cursor: Whether the endpoint is paged by cursor instead of page number.
+    :param max_results: Number of results after which to stop.
+    :param shards: Number of time windows in which to split the range between
+        the start_date and end_date parameters.
+    :return: None
+    """
+    summary = {}
+    key = record_id
+    if shards:
+        windows = shard_windows(
+            params.get("start_date"), params.get("end_date"), shards
+        )
+        pages = iter_sharded_pages(url, params, windows, summary)
+        key = update_id
+    elif cursor:
+        pages = iter_cursor_pages(url, params, summary)
+    else:
+        pages = iter_numbered_pages(url, params, summary, max_results)
+    results = iter_results(pages, max_results, key)
+    try:
+        if settings.format in RECORD_FORMATS:
+            write_records(results, url=url)
+        else:
+            write_document(results, summary)
+    finally:
+        pages.close()
+
+
+def load_checkpoint(path, url):
+    """
+    :param path: Checkpoint file.
+    :param url: URL of the endpoint.
+    :return: The cursor saved in the checkpoint, or None if there is none.
+    """
+    try:
+        with open(path, encoding="UTF-8") as checkpoint_file:
+            checkpoint = codec.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+    except codec.JSONDecodeError as error:
+        raise click.ClickException(f"Checkpoint {path} is not valid JSON") from error
+    if checkpoint.get("url") != url:
+        raise click.ClickException(
+            f"Checkpoint {path} was saved by a crawl of {checkpoint.get('url')}"
+        )
+    return checkpoint.get("cursor")
+
+
+def save_checkpoint(path, url, cursor):
+    """
+    Writes the cursor of the next page to the checkpoint atomically.
+    :param path: Checkpoint file.
+    :param url: URL of the endpoint.
+    :param cursor: Cursor of the next page.
+    :return: None
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="UTF-8") as checkpoint_file:
+        checkpoint_file.write(codec.dumps({"url": url, "cursor": cursor}))
+    os.replace(tmp_path, path)
+
+
+def print_checkpointed(url, params, path, max_results=None):
+    """
+    Writes the records of every page of a cursor feed, saving the cursor of
+    the next page to a checkpoint once a page has been written and flushed, so
+    an interrupted crawl resumes where it stopped. Records are written at least
+    once: those of a page that was interrupted are written again on resume.
+    The checkpoint is deleted when the last page has been written.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param path: Checkpoint file.
+    :param max_results: Number of results after which to stop.
+    :return: None
+    """
+    if settings.format != "ndjson":
+        raise click.UsageError("--checkpoint requires --format ndjson")
+    cursor = load_checkpoint(path, url)
+    if cursor:
+        params = {**params, "cursor": cursor}
+    stream = output_stream()
+    pages = iter_cursor_pages(url, params, {})
+    count = 0
+    try:
+        for page in pages:
+            data = page.get("data") or []
+            if max_results:
+                data = data[: max_results - count]
+            write_records(data, stream)
+            stream.flush()
+            count += len(data)
+            if max_results and count >= max_results:
+                return
+            if not (page.get("next") and page.get("data")):
+                break
+            save_checkpoint(path, url, page["next"])
+    finally:
+        pages.close()
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,26 @@
+"""
+Local file locations.
+"""
+
+import os
+
+# File of the response cache that maps each reference data endpoint to the key
+# of its latest response, so readers such as shell completion find them
+# without reading every entry. It is rewritten only when reference data is.
+REFERENCE_INDEX = "reference.keys"
+
+
+def cache_dir(*parts):
+    """
+    Returns a directory under the CLI cache, creating it if needed.
+    The base directory can be set with the SHUTTERSTOCK_CLI_CACHE_DIR environment variable.
+    :param parts: Path components below the cache directory.
+    :return: str
+    """
+    base = os.getenv("SHUTTERSTOCK_CLI_CACHE_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "shutterstock-cli",
+    )
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -3,23 +3,126 @@ Pretty printing.
 """
 
 import json
+import sys
+from json.encoder import encode_basestring_ascii
 
-from pygments import formatters
-from pygments import highlight
-from pygments import lexers
+CHUNK_SIZE = 64 * 1024
 
+# ANSI colors of the terminal formatter of pygments for JSON tokens.
+KEY = "\x1b[94m"
+STRING = "\x1b[33m"
+LITERAL = "\x1b[34m"
+RESET = "\x1b[39;49;00m"
 
-def pretty_print(data):
+
+def float_repr(value):
     """
-    Pretty prints JSON data.
-    :param data: Dict
+    :param value: float
+    :return: The JSON representation of the float, as written by json.dumps.
+    """
+    if value != value:  # pylint: disable=comparison-with-itself
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def colorize(data, stream, indent=4):
+    """
+    Writes JSON with sorted keys and ANSI colors in a single pass, encoding and
+    coloring each token as it is serialized instead of lexing a finished dump.
+    :param data: Decoded JSON.
+    :param stream: File to write to.
+    :param indent: Number of spaces per level.
     :return: None
     """
+    parts = []
+    size = [0]
+
+    def emit(part):
+        parts.append(part)
+        size[0] += len(part)
+        if size[0] >= CHUNK_SIZE:
+            stream.write("".join(parts))
+            parts.clear()
+            size[0] = 0
+
+    def encode(value, level):
+        if isinstance(value, str):
+            emit(STRING + encode_basestring_ascii(value) + RESET)
+        elif value is None:
+            emit(LITERAL + "null" + RESET)
+        elif value is True:
+            emit(LITERAL + "true" + RESET)
+        elif value is False:
+            emit(LITERAL + "false" + RESET)
+        elif isinstance(value, int):
+            emit(LITERAL + int.__repr__(value) + RESET)
+        elif isinstance(value, float):
+            emit(LITERAL + float_repr(value) + RESET)
+        elif isinstance(value, dict):
+            if not value:
+                emit("{}")
+                return
+            inner = "\n" + " " * (indent * (level + 1))
+            separator = "{"
+            for key in sorted(value):
+                emit(separator + inner + KEY + encode_basestring_ascii(str(key)) + RESET + ": ")
+                encode(value[key], level + 1)
+                separator = ","
+            emit("\n" + " " * (indent * level) + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                emit("[]")
+                return
+            inner = "\n" + " " * (indent * (level + 1))
+            separator = "["
+            for item in value:
+                emit(separator + inner)
+                encode(item, level + 1)
+                separator = ","
+            emit("\n" + " " * (indent * level) + "]")
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    encode(data, 0)
+    parts.append("\n")
+    stream.write("".join(parts))
+
+
+def highlight_with_pygments(data, stream):
+    """
+    Writes JSON colored by the JSON lexer of pygments, which is imported only
+    when this highlighter is chosen.
+    :param data: Decoded JSON.
+    :param stream: File to write to.
+    :return: None
+    """
+    # pylint: disable=import-outside-toplevel
+    from pygments import formatters
+    from pygments import highlight
+    from pygments import lexers
+
     formatted_json = json.dumps(data, sort_keys=True, indent=4)
-    print(
+    stream.write(
         highlight(
             str(formatted_json).encode("utf-8"),
             lexers.JsonLexer(),
             formatters.TerminalFormatter(),
         )
     )
+
+
+def pretty_print(data, highlighter="builtin", stream=None):
+    """
+    Pretty prints JSON data.
+    :param data: Dict
+    :param highlighter: "builtin" or "pygments".
+    :param stream: File to write to, defaults to stdout.
+    :return: None
+    """
+    stream = stream or sys.stdout
+    if highlighter == "pygments":
+        highlight_with_pygments(data, stream)
+    else:
+        colorize(data, stream)
@@ -0,0 +1,150 @@
+"""
+Client-side rate limiting.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+from .paths import cache_dir
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock, limit per process only
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    Token bucket whose state lives in a lock-protected file, so every process
+    on the host that uses the same credentials draws from one budget. The rate
+    learnt from rate limit headers can only lower the configured rate, and only
+    until the API's window resets.
+    """
+
+    def __init__(self, path, rate, capacity=None):
+        """
+        :param path: State file shared by all processes.
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens, defaults to one second of budget.
+        """
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _state(self):
+        with self._lock, open(self.path, "a+", encoding="UTF-8") as state_file:
+            if fcntl:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                try:
+                    state = json.load(state_file)
+                except json.decoder.JSONDecodeError:
+                    state = {}
+                now = time.time()
+                if state.get("configured") != [self.rate, self.capacity]:
+                    state["configured"] = [self.rate, self.capacity]
+                    state["capacity"] = self.capacity
+                    state.pop("adapted", None)
+                if now >= state.get("adapted_until", 0):
+                    state.pop("adapted", None)
+                state["rate"] = min(self.rate, state.get("adapted", self.rate))
+                state.setdefault("tokens", state["capacity"])
+                state.setdefault("updated", now)
+                state.setdefault("blocked_until", 0)
+                elapsed = max(0.0, now - state["updated"])
+                state["tokens"] = min(
+                    state["capacity"], state["tokens"] + elapsed * state["rate"]
+                )
+                state["updated"] = now
+                yield state
+                state_file.seek(0)
+                state_file.truncate()
+                json.dump(state, state_file)
+                state_file.flush()
+            finally:
+                if fcntl:
+                    fcntl.flock(state_file, fcntl.LOCK_UN)
+
+    def try_acquire(self):
+        """
+        Takes a token if one is available.
+        :return: 0 if a token was taken, otherwise the number of seconds to wait.
+        """
+        with self._state() as state:
+            blocked = state["blocked_until"] - state["updated"]
+            if blocked > 0:
+                return blocked
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0
+            return (1 - state["tokens"]) / state["rate"]
+
+    def acquire(self):
+        """
+        Blocks until a token is available.
+        :return: None
+        """
+        wait = self.try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire()
+
+    def update(self, status_code, headers):
+        """
+        Adapts the budget to the rate limit headers of a response.
+        :param status_code: HTTP status of the response.
+        :param headers: Response headers.
+        :return: None
+        """
+        remaining = _number(headers.get("X-RateLimit-Remaining"))
+        reset = _number(headers.get("X-RateLimit-Reset"))
+        retry_after = _number(headers.get("Retry-After"))
+        if status_code != 429 and remaining is None:
+            return
+        with self._state() as state:
+            now = state["updated"]
+            if reset is not None and reset > 1e9:
+                reset -= now
+            if remaining is not None:
+                state["tokens"] = min(state["tokens"], remaining)
+                if reset and reset > 0:
+                    if remaining < 1:
+                        state["blocked_until"] = now + reset
+                    else:
+                        state["adapted"] = remaining / reset
+                        state["adapted_until"] = now + reset
+                        state["rate"] = min(self.rate, state["adapted"])
+            if status_code == 429:
+                state["tokens"] = 0
+                delay = retry_after or reset or 1 / state["rate"]
+                state["blocked_until"] = now + delay
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_rate_limiter(identity):
+    """
+    Returns the limiter for a credential, or None when rate limiting is disabled.
+    Rate limiting is enabled by setting SHUTTERSTOCK_CLI_RATE_LIMIT to the number of
+    requests per minute allowed for the credential.
+    :param identity: Credential identity, see RequestHelper.identity.
+    :return: TokenBucket or None
+    """
+    per_minute = os.getenv("SHUTTERSTOCK_CLI_RATE_LIMIT")
+    if not per_minute:
+        return None
+    path = os.path.join(cache_dir("ratelimit"), f"{identity}.json")
+    return TokenBucket(path, rate=float(per_minute) / 60)
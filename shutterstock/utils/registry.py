@@ -0,0 +1,153 @@
+"""
+Endpoint registry.
+
+Builds the click commands of the endpoint table on demand, so a command group
+costs one dictionary lookup until one of its commands is invoked.
+"""
+
+import functools
+
+import click
+
+from . import codec
+from .pages import print_checkpointed, print_pages
+from .request import delete, get, patch, post, put
+
+TYPES = {"str": click.STRING, "int": click.INT, "float": click.FLOAT}
+REQUESTS = {"GET": get, "POST": post, "DELETE": delete, "PUT": put, "PATCH": patch}
+IDEMPOTENCY_KEY_HELP = (
+    "Client-generated unique key for this request, sent as the Idempotency-Key"
+    " header; when set, the request is retried after network errors and server"
+    " errors, and the key is refused if a request already used it"
+)
+ALL_PAGES_HELP = (
+    "Fetch every page of results and write them as one response, in order and"
+    " without duplicates"
+)
+MAX_RESULTS_HELP = "Stop after this many results; implies --all-pages"
+CHECKPOINT_HELP = (
+    "File in which to save the cursor of the next page, to resume an interrupted"
+    " crawl; implies --all-pages and requires --format ndjson"
+)
+SHARDS_HELP = (
+    "Split the range between --start-date and --end-date into this many time"
+    " windows of at least 5 minutes, and fetch their pages in parallel; implies"
+    " --all-pages"
+)
+PAGED_FLAGS = ("pages", "cursor")
+
+
+@functools.lru_cache(maxsize=None)
+def index():
+    """
+    :return: Dict of group name -> dict of command name -> Endpoint.
+    """
+    from ..endpoints import ENDPOINTS  # pylint: disable=import-outside-toplevel
+
+    return {
+        group: {endpoint.name: endpoint for endpoint in endpoints}
+        for group, endpoints in ENDPOINTS.items()
+    }
+
+
+def call(endpoint, kwargs):
+    """
+    Sends the request of an endpoint with the arguments of its command.
+    :param endpoint: Endpoint
+    :param kwargs: Arguments and options of the command.
+    :return: None
+    """
+    url = endpoint.path.format(**kwargs)
+    send = REQUESTS[endpoint.method]
+    extra = {}
+    if "idempotency" in endpoint.flags:
+        extra["idempotency_key"] = kwargs.pop("idempotency_key")
+    if any(flag in endpoint.flags for flag in PAGED_FLAGS):
+        all_pages = kwargs.pop("all_pages")
+        max_results = kwargs.pop("max_results")
+        checkpoint = kwargs.pop("checkpoint", None)
+        shards = kwargs.pop("shards", None)
+        if shards:
+            print_pages(url, kwargs, max_results=max_results, shards=shards)
+            return
+        if checkpoint:
+            print_checkpointed(url, kwargs, checkpoint, max_results)
+            return
+        if all_pages or max_results:
+            print_pages(url, kwargs, "cursor" in endpoint.flags, max_results)
+            return
+    json_data = None
+    if "data" in endpoint.arguments:
+        try:
+            with open(kwargs["data"], encoding="UTF-8") as input_data:
+                json_data = codec.load(input_data)
+        except codec.JSONDecodeError:
+            print(
+                "Error loading JSON file. Please pass a valid JSON file as an argument."
+                " (Check API reference for more information)"
+            )
+            return
+    send(url=url, params=kwargs, json_data=json_data, **extra)
+
+
+def build_command(endpoint):
+    """
+    :param endpoint: Endpoint
+    :return: click.Command
+    """
+    params = [click.Argument([name]) for name in endpoint.arguments]
+    params += [
+        click.Option([name], type=TYPES[kind], multiple=multiple, help=text)
+        for name, kind, multiple, text in endpoint.options
+    ]
+    if "idempotency" in endpoint.flags:
+        params.append(
+            click.Option(["--idempotency-key"], type=str, help=IDEMPOTENCY_KEY_HELP)
+        )
+    if any(flag in endpoint.flags for flag in PAGED_FLAGS):
+        params.append(click.Option(["--all-pages"], is_flag=True, help=ALL_PAGES_HELP))
+        params.append(
+            click.Option(
+                ["--max-results"], type=click.IntRange(min=1), help=MAX_RESULTS_HELP
+            )
+        )
+    if "shards" in endpoint.flags:
+        params.append(
+            click.Option(["--shards"], type=click.IntRange(min=1), help=SHARDS_HELP)
+        )
+    if "checkpoint" in endpoint.flags:
+        params.append(
+            click.Option(
+                ["--checkpoint"], type=click.Path(dir_okay=False), help=CHECKPOINT_HELP
+            )
+        )
+    return click.Command(
+        endpoint.name,
+        callback=lambda **kwargs: call(endpoint, kwargs),
+        params=params,
+        help=endpoint.help,
+    )
+
+
+class EndpointGroup(click.Group):
+    """
+    Click group whose commands are built from the endpoint table when they are
+    first looked up.
+    """
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(index()[self.name]))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in index()[self.name]:
+            self.add_command(build_command(index()[self.name][cmd_name]))
+        return super().get_command(ctx, cmd_name)
+
+
+def endpoint_group(name, help_text):
+    """
+    :param name: Name of the group in the endpoint table.
+    :param help_text: Help text of the group.
+    :return: EndpointGroup
+    """
+    return EndpointGroup(name, help=help_text)
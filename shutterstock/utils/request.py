@@ -2,64 +2,430 @@
 HTTP functions.
 """
 
-import json
+import functools
+import itertools
 import os
 
-import requests
-
+from .cache import (
+    REVALIDATED,
+    TTLS,
+    ResponseCache,
+    conditional_headers,
+    get_cache,
+    has_validator,
+    is_fresh,
+    to_response,
+)
+from . import http2
+from .codec import JSONDecodeError, decode
+from .hedge import get_hedger
+from .idempotency import get_journal
+from .jsonstream import DataArrayParser, iter_records
+from .output import RECORD_FORMATS, select, write, write_document, write_records
 from .prettyprint import pretty_print
+from .ratelimit import get_rate_limiter
 from .request_helper import RequestHelper
+from .retry import get_retry_policy
+from .select import fields_parameter
+from .settings import settings
+from .singleflight import SingleFlight
+from .stats import increment
 
-COLORIZE_OUTPUT = os.getenv("SHUTTERSTOCK_CLI_COLORIZE_OUTPUT")
 
+DEFAULT_POOL_SIZE = 10
 
-def get(url, params, json_data=None):
+DEFAULT_MAX_IN_FLIGHT = 10
+
+DEFAULT_CONNECT_TIMEOUT = 10
+
+DEFAULT_READ_TIMEOUT = 60
+
+CHUNK_SIZE = 64 * 1024
+
+_flights = SingleFlight()
+
+_reserved = {"connections": 0}
+
+
+def get_session():
+    """
+    Returns the pooled session shared by every command, so consecutive requests
+    reuse open connections instead of paying a new TCP and TLS handshake each time.
+    The pool size can be set with the SHUTTERSTOCK_CLI_POOL_SIZE environment variable
+    and never falls below SHUTTERSTOCK_CLI_MAX_IN_FLIGHT or the connections
+    reserved with reserve_connections().
+    :return: requests.Session
+    """
+    return sized_session(pool_size())
+
+
+@functools.lru_cache(maxsize=None)
+def sized_session(size):
+    """
+    :param size: Number of connections kept open per host.
+    :return: requests.Session, the same one for every call with the same size.
+    """
+    return create_session(size)
+
+
+def reserve_connections(count):
+    """
+    Grows the pool of the shared session to at least count connections per
+    host, for callers that keep more requests in flight than the pool holds.
+    The session is replaced once when the pool grows, and never shrinks.
+    :param count: Number of concurrent requests.
+    :return: None
+    """
+    _reserved["connections"] = max(_reserved["connections"], count)
+
+
+def pool_size():
+    """
+    :return: int, the number of connections kept open per host.
+    """
+    size = int(os.getenv("SHUTTERSTOCK_CLI_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+    return max(size, max_in_flight(), _reserved["connections"])
+
+
+def max_in_flight():
+    """
+    :return: int, the number of concurrent requests allowed by fan-out commands.
+    """
+    return int(
+        os.getenv("SHUTTERSTOCK_CLI_MAX_IN_FLIGHT", str(DEFAULT_MAX_IN_FLIGHT))
+    )
+
+
+def create_session(size):
+    """
+    Creates a keep-alive session with pooled adapters mounted for HTTP and HTTPS,
+    which accepts every compression that urllib3 can decode in this environment
+    (gzip and deflate, and brotli and zstd when their packages are installed).
+    :param size: Maximum number of connections kept open per host.
+    :return: requests.Session
+    """
+    # The network stack is imported here rather than at module load, so help,
+    # completion and argument errors return without paying for it.
+    # pylint: disable=import-outside-toplevel
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"Connection": "keep-alive", "Accept-Encoding": ACCEPT_ENCODING}
+    )
+    return session
+
+
+def record_bytes(res, decoded=None):
+    """
+    Counts the bytes of a response as received on the wire and once decoded,
+    to measure the bandwidth saved by compression.
+    :param res: requests.Response or httpx.Response
+    :param decoded: Size of the decoded body, if it was streamed.
+    :return: None
+    """
+    wire = getattr(res, "num_bytes_downloaded", None)
+    if wire is None and getattr(res, "raw", None) is not None:
+        wire = res.raw.tell()
+    if not isinstance(wire, int):
+        return
+    increment("bytes.wire", wire)
+    increment("bytes.decoded", len(res.content) if decoded is None else decoded)
+    encoding = res.headers.get("Content-Encoding", "identity")
+    increment(f"bytes.wire.{encoding}", wire)
+
+
+def timeout():
     """
-    Get resource.
+    Connect and read timeouts, in seconds. They can be set with the
+    SHUTTERSTOCK_CLI_CONNECT_TIMEOUT and SHUTTERSTOCK_CLI_READ_TIMEOUT environment variables.
+    :return: Tuple
+    """
+    return (
+        float(
+            os.getenv("SHUTTERSTOCK_CLI_CONNECT_TIMEOUT", str(DEFAULT_CONNECT_TIMEOUT))
+        ),
+        float(os.getenv("SHUTTERSTOCK_CLI_READ_TIMEOUT", str(DEFAULT_READ_TIMEOUT))),
+    )
+
+
+def request(
+    method, url, params, json_data=None, idempotency_key=None, stream=False
+):  # pylint: disable=too-many-arguments
+    """
+    Sends a request through the shared session, retrying it when that is safe.
+    Reference data is served from the response cache while it is fresh, and
+    cached resources that can change are revalidated with a conditional request.
+    Identical GET requests made concurrently share one network call, unless
+    their body is streamed. Fields chosen with --select are requested with the
+    fields parameter of endpoints that have one.
+    :param method: HTTP method.
     :param url: URL of the endpoint.
     :param params: Request parameters.
     :param json_data: Request body.
-    :return: None
+    :param idempotency_key: Client-generated key that lets a POST be retried; a
+        key can only be sent once, see send_once().
+    :param stream: Whether to return before the body is read, see iter_body().
+    :return: requests.Response
     """
     req = RequestHelper()
-    res = requests.get(
-        url=f"{req.base_endpoint}{url}",
-        params=params,
-        headers=req.headers,
-        auth=req.auth,
-    )
+    if settings.select and params and "fields" in params and not params["fields"]:
+        params = {**params, "fields": fields_parameter(settings.select, url)}
+    if idempotency_key:
+        return send_once(req, method, url, params, json_data, idempotency_key)
+    if method != "GET" or stream:
+        return _request(req, method, url, params, json_data, idempotency_key, stream)
+    key = request_key(req, method, url, params)
+    return _flights.do(key, lambda: _request(req, method, url, params, json_data))
+
+
+def send_once(
+    req, method, url, params, json_data, idempotency_key
+):  # pylint: disable=too-many-arguments
+    """
+    Sends a request whose idempotency key has not been used before, and keeps the
+    key in the journal unless the API refused the request with a client error, so
+    that the request is not sent again, even if the API does not deduplicate it.
+    :param req: RequestHelper
+    :param method: HTTP method.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param json_data: Request body.
+    :param idempotency_key: Client-generated key of the request.
+    :return: requests.Response
+    """
+    journal = get_journal()
+    journal.reserve(req.identity, idempotency_key, url)
+    res = _request(req, method, url, params, json_data, idempotency_key)
+    if 400 <= res.status_code < 500:
+        journal.release(req.identity, idempotency_key)
+    else:
+        journal.record(req.identity, idempotency_key, url, res.status_code)
+    return res
+
+
+def request_key(req, method, url, params):
+    """
+    :param req: RequestHelper
+    :param method: HTTP method.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :return: str, the canonical key of a request, shared by identical requests.
+    """
+    return ResponseCache.key(method, f"{req.base_endpoint}{url}", params, req.identity)
+
+
+def _request(
+    req, method, url, params, json_data=None, idempotency_key=None, stream=False
+):  # pylint: disable=too-many-arguments
+    cacheable = method == "GET" and settings.cache
+    ttl = TTLS.get(url) if cacheable else None
+    revalidate = cacheable and REVALIDATED.match(url) is not None
+    entry = None
+    if ttl or revalidate:
+        cache = get_cache()
+        key = request_key(req, method, url, params)
+        entry = None if settings.refresh else cache.get(key)
+        if entry and ttl and is_fresh(entry, ttl):
+            increment("cache.hits")
+            return to_response(entry)
+        increment("cache.misses")
+
+    headers = conditional_headers(entry) if entry else None
+    res = send(req, method, url, params, json_data, idempotency_key, headers, stream)
+    if entry and res.status_code == 304:
+        increment("cache.revalidated")
+        cache.revalidated(key, entry, res)
+        return to_response(entry)
+    if res.status_code == 200 and (ttl or (revalidate and has_validator(res))):
+        cache.set(key, url, res)
+    return res
+
+
+def send(
+    req,
+    method,
+    url,
+    params,
+    json_data=None,
+    idempotency_key=None,
+    headers=None,
+    stream=False,
+):  # pylint: disable=too-many-arguments
+    """
+    Sends a request over the network, subject to rate limiting, timeouts and
+    retries. GET requests are hedged when hedging is enabled.
+    :param req: RequestHelper
+    :param method: HTTP method.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param json_data: Request body.
+    :param idempotency_key: Client-generated key that lets a POST be retried.
+    :param headers: Headers to send in addition to the authentication headers.
+    :param stream: Whether to return before the body is read.
+    :return: requests.Response
+    """
+    headers = {**req.headers, **(headers or {})}
+    if idempotency_key:
+        headers["Idempotency-Key"] = idempotency_key
+    limiter = get_rate_limiter(req.identity)
+    hedger = get_hedger() if method == "GET" else None
+
+    def attempt():
+        if limiter:
+            limiter.acquire()
+        if settings.http2:
+            res = http2.request(
+                method,
+                f"{req.base_endpoint}{url}",
+                params,
+                json_data,
+                headers,
+                req.auth,
+                timeout(),
+                pool_size(),
+                stream,
+            )
+        else:
+            res = get_session().request(
+                method,
+                url=f"{req.base_endpoint}{url}",
+                params=params,
+                json=json_data,
+                headers=headers,
+                auth=req.auth,
+                timeout=timeout(),
+                stream=stream,
+            )
+        if not stream:
+            record_bytes(res)
+        if limiter:
+            limiter.update(res.status_code, res.headers)
+        return res
+
+    if hedger:
+        return get_retry_policy().call(method, lambda: hedger.call(attempt))
+    return get_retry_policy().call(method, attempt, idempotency_key)
+
+
+def iter_body(res):
+    """
+    Reads the body of a streamed response in chunks, decompressing as it goes.
+    :param res: requests.Response or httpx.Response
+    :return: Iterator over the decoded bytes.
+    """
+    if hasattr(res, "iter_bytes"):
+        chunks = res.iter_bytes(CHUNK_SIZE)
+    else:
+        chunks = res.iter_content(CHUNK_SIZE)
+    decoded = 0
+    try:
+        for chunk in chunks:
+            decoded += len(chunk)
+            yield chunk
+    finally:
+        res.close()
+    record_bytes(res, decoded)
+
+
+def parse_response(res):
+    """
+    Parses the body of a response.
+    :param res: requests.Response
+    :return: Decoded JSON, or the raw content if the body is not JSON.
+    """
     try:
-        if not COLORIZE_OUTPUT:
-            print(json.dumps(res.json(), indent=4))
+        return decode(res)
+    except JSONDecodeError:
+        return res.content
+
+
+def print_response(res, url=""):
+    """
+    Prints the body of a response.
+    :param res: requests.Response
+    :param url: URL of the endpoint, used to pick the columns of columnar formats.
+    :return: None
+    """
+    try:
+        colorize = os.getenv("SHUTTERSTOCK_CLI_COLORIZE_OUTPUT")
+        if not colorize or settings.output or settings.format != "json":
+            write(decode(res), url=url)
             return
-        pretty_print(res.json())
-    except json.decoder.JSONDecodeError:
+        highlighter = "pygments" if colorize == "pygments" else "builtin"
+        pretty_print(select(decode(res)), highlighter)
+    except JSONDecodeError:
         print(res.content)
 
 
-def post(url, params, json_data):
+def print_records(res, url=""):
+    """
+    Prints the records of a streamed response as they are parsed.
+    :param res: requests.Response
+    :param url: URL of the endpoint, used to pick the columns of columnar formats.
+    :return: None
+    """
+    try:
+        write_records(iter_records(iter_body(res)), url=url)
+    except JSONDecodeError as error:
+        print(error.doc)
+
+
+def print_document(res):
+    """
+    Prints a JSON response while it is parsed. The items of the data array of
+    list and search responses are written as they arrive, between the other
+    fields of the response; other responses are written once they are read.
+    :param res: requests.Response
+    :return: None
+    """
+    parser = DataArrayParser()
+    items = iter_records(iter_body(res), parser)
+    try:
+        first = next(items, None)
+        if parser.envelope is None:
+            write(first)
+            return
+        if first is not None:
+            items = itertools.chain([first], items)
+        write_document(items, parser.trailer, envelope=parser.envelope)
+    except JSONDecodeError as error:
+        print(error.doc)
+
+
+def get(url, params, json_data=None):
+    """
+    Get resource. Responses are written while they arrive instead of after they
+    have been read, unless they are colorized.
+    :param url: URL of the endpoint.
+    :param params: Request parameters.
+    :param json_data: Request body.
+    :return: None
+    """
+    if settings.format in RECORD_FORMATS:
+        print_records(request("GET", url, params, json_data, stream=True), url)
+        return
+    if os.getenv("SHUTTERSTOCK_CLI_COLORIZE_OUTPUT") and not settings.output:
+        print_response(request("GET", url, params, json_data))
+        return
+    print_document(request("GET", url, params, json_data, stream=True))
+
+
+def post(url, params, json_data, idempotency_key=None):
     """
     Post resource.
     :param url: URL of the endpoint.
     :param params: Request parameters.
     :param json_data: Request body.
+    :param idempotency_key: Client-generated key that lets the request be retried.
     :return: None
     """
-    req = RequestHelper()
-    res = requests.post(
-        url=f"{req.base_endpoint}{url}",
-        params=params,
-        json=json_data,
-        headers=req.headers,
-        auth=req.auth,
-    )
-    try:
-        if not COLORIZE_OUTPUT:
-            print(json.dumps(res.json(), indent=4))
-            return
-        pretty_print(res.json())
-    except json.decoder.JSONDecodeError:
-        print(res.content)
+    print_response(request("POST", url, params, json_data, idempotency_key), url)
 
 
 def delete(url, params, json_data):
@@ -70,21 +436,7 @@ def delete(url, params, json_data):
     :param json_data: Request body.
     :return: None
     """
-    req = RequestHelper()
-    res = requests.delete(
-        url=f"{req.base_endpoint}{url}",
-        params=params,
-        json=json_data,
-        headers=req.headers,
-        auth=req.auth,
-    )
-    try:
-        if not COLORIZE_OUTPUT:
-            print(json.dumps(res.json(), indent=4))
-            return
-        pretty_print(res.json())
-    except json.decoder.JSONDecodeError:
-        print(res.content)
+    print_response(request("DELETE", url, params, json_data), url)
 
 
 def put(url, params, json_data):
@@ -95,21 +447,7 @@ def put(url, params, json_data):
     :param json_data: Request body.
     :return: None
     """
-    req = RequestHelper()
-    res = requests.put(
-        url=f"{req.base_endpoint}{url}",
-        params=params,
-        json=json_data,
-        headers=req.headers,
-        auth=req.auth,
-    )
-    try:
-        if not COLORIZE_OUTPUT:
-            print(json.dumps(res.json(), indent=4))
-            return
-        pretty_print(res.json())
-    except json.decoder.JSONDecodeError:
-        print(res.content)
+    print_response(request("PUT", url, params, json_data), url)
 
 
 def patch(url, params, json_data):
@@ -120,18 +458,4 @@ def patch(url, params, json_data):
     :param json_data: Request body.
     :return: None
     """
-    req = RequestHelper()
-    res = requests.patch(
-        url=f"{req.base_endpoint}{url}",
-        params=params,
-        json=json_data,
-        headers=req.headers,
-        auth=req.auth,
-    )
-    try:
-        if not COLORIZE_OUTPUT:
-            print(json.dumps(res.json(), indent=4))
-            return
-        pretty_print(res.json())
-    except json.decoder.JSONDecodeError:
-        print(res.content)
+    print_response(request("PATCH", url, params, json_data), url)
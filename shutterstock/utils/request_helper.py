@@ -2,10 +2,9 @@
 Request Helper.
 """
 
+import hashlib
 import os
 
-from requests.auth import HTTPBasicAuth
-
 
 class RequestHelper:
     """
@@ -32,6 +31,9 @@ class RequestHelper:
             self._headers.update({"Authorization": f"Bearer {self.token}"})
 
         elif self.key and self.secret:
+            # pylint: disable=import-outside-toplevel
+            from requests.auth import HTTPBasicAuth
+
             self._auth = HTTPBasicAuth(self.key, self.secret)
 
     @property
@@ -48,6 +50,14 @@ class RequestHelper:
         """
         return self._auth
 
+    @property
+    def identity(self):
+        """
+        :return: str, a stable digest of the credentials that does not reveal them.
+        """
+        credential = self.token or f"{self.key}:{self.secret}"
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+
     @property
     def base_endpoint(self):
         """
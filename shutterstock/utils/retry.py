@@ -0,0 +1,127 @@
+"""
+Retry policy.
+"""
+
+import functools
+import os
+import random
+import threading
+import time
+
+
+from .stats import increment
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+DEFAULT_RETRIES = 3
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with exponential backoff and full jitter.
+
+    Idempotent methods are retried freely. Other methods, such as the POST
+    requests that license media, are retried only when they carry a
+    client-generated idempotency key. Every request adds `budget_ratio` to a
+    retry budget capped at `max_budget` and every retry spends one from it,
+    so a failing API is not flooded with retries.
+    """
+
+    def __init__(
+        self,
+        retries=DEFAULT_RETRIES,
+        backoff=0.5,
+        max_backoff=30.0,
+        budget_ratio=0.2,
+        max_budget=10,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget_ratio = budget_ratio
+        self.max_budget = max_budget
+        self._budget = float(max_budget)
+        self._lock = threading.Lock()
+
+    def _spend(self):
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            return True
+
+    def _deposit(self):
+        with self._lock:
+            self._budget = min(self._budget + self.budget_ratio, self.max_budget)
+
+    def delay(self, attempt, res=None):
+        """
+        :param attempt: Number of the retry, starting at 1.
+        :param res: Failed response, if any.
+        :return: Seconds to wait before the retry.
+        """
+        retry_after = res.headers.get("Retry-After") if res is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+            import email.utils  # pylint: disable=import-outside-toplevel
+
+            try:
+                date = email.utils.parsedate_to_datetime(retry_after)
+                return min(max(0.0, date.timestamp() - time.time()), self.max_backoff)
+            except (TypeError, ValueError):
+                # Neither seconds nor an HTTP date: back off as if it were absent.
+                pass
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def call(self, method, send, idempotency_key=None):
+        """
+        Sends a request, retrying it when that is safe.
+        :param method: HTTP method.
+        :param send: Function that sends the request and returns the response.
+        :param idempotency_key: Key that lets a non-idempotent request be retried.
+        :return: requests.Response
+        """
+        import requests  # pylint: disable=import-outside-toplevel
+
+        safe = method in IDEMPOTENT_METHODS or idempotency_key is not None
+        self._deposit()
+        attempt = 0
+        while True:
+            increment("retry.attempts")
+            try:
+                res = send()
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not (safe and attempt < self.retries and self._spend()):
+                    increment("retry.giveups")
+                    raise
+                res = None
+                reason = type(error).__name__
+            else:
+                if res.status_code not in RETRY_STATUSES:
+                    return res
+                if not (safe and attempt < self.retries and self._spend()):
+                    increment("retry.giveups")
+                    return res
+                reason = str(res.status_code)
+            if res is not None:
+                res.close()
+            attempt += 1
+            increment("retry.retries")
+            increment(f"retry.reason.{reason}")
+            time.sleep(self.delay(attempt, res))
+
+
+@functools.lru_cache(maxsize=None)
+def get_retry_policy():
+    """
+    Returns the retry policy shared by every command.
+    The number of retries can be set with the SHUTTERSTOCK_CLI_RETRIES environment variable.
+    :return: RetryPolicy
+    """
+    retries = os.getenv("SHUTTERSTOCK_CLI_RETRIES", str(DEFAULT_RETRIES))
+    return RetryPolicy(retries=int(retries))
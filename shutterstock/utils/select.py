@@ -0,0 +1,63 @@
+"""
+Field selection.
+"""
+
+import functools
+
+BULK_SEARCH = "/v2/bulk_search/"
+
+
+def parse_paths(expression):
+    """
+    :param expression: Comma-separated dotted paths, such as "id,assets.preview.url".
+    :return: List of paths, each a list of keys.
+    """
+    return [path.strip().split(".") for path in expression.split(",") if path.strip()]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(expression):
+    """
+    Compiles a selection into a function that keeps only the selected fields of a
+    record. Lists along a path are projected element by element.
+    :param expression: Comma-separated dotted paths, such as "id,assets.preview.url".
+    :return: Function that takes a record and returns its projection.
+    """
+    tree = {}
+    for path in parse_paths(expression):
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+            if node is None:
+                break
+        else:
+            node[path[-1]] = None
+
+    def project(value, node):
+        if isinstance(value, list):
+            return [project(item, node) for item in value]
+        if not isinstance(value, dict):
+            return value
+        return {
+            key: value[key] if child is None else project(value[key], child)
+            for key, child in node.items()
+            if key in value
+        }
+
+    return lambda record: project(record, tree)
+
+
+def fields_parameter(expression, url=""):
+    """
+    Translates a selection into the fields parameter of the API, which uses
+    slashes between keys and applies to the items of the data array, or to the
+    items of the data array of each result of bulk searches.
+    :param expression: Comma-separated dotted paths, such as "id,assets.preview.url".
+    :param url: URL of the endpoint.
+    :return: str, such as "data(id,assets/preview/url),page,per_page,total_count".
+    """
+    paths = ",".join("/".join(path) for path in parse_paths(expression))
+    fields = f"data({paths}),page,per_page,total_count,search_id"
+    if url.startswith(BULK_SEARCH):
+        return f"results({fields})"
+    return fields
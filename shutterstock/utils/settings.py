@@ -0,0 +1,31 @@
+"""
+Runtime settings.
+"""
+
+import os
+
+
+class Settings:
+    """
+    Options that apply to every command, set from the environment and from the
+    options of the top-level shutterstock command.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Sets every option back to its default, read again from the environment.
+        :return: None
+        """
+        self.cache = os.getenv("SHUTTERSTOCK_CLI_CACHE") != "false"
+        self.refresh = False
+        self.http2 = os.getenv("SHUTTERSTOCK_CLI_HTTP2") == "true"
+        self.output = None
+        self.pretty = None
+        self.format = "json"
+        self.select = None
+
+
+settings = Settings()
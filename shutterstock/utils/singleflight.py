@@ -0,0 +1,44 @@
+"""
+Request coalescing.
+"""
+
+import threading
+from concurrent.futures import Future
+
+from .stats import increment
+
+
+class SingleFlight:
+    """
+    Runs a function at most once per key at a time. Callers that ask for a key
+    that is already in flight wait for it and share its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        """
+        :param key: Key of the call, such as a canonical request key.
+        :param function: Function to run if no call with the same key is in flight.
+        :return: The result of the call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            increment("singleflight.coalesced")
+            return future.result()
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+        future.set_result(result)
+        return result
@@ -0,0 +1,51 @@
+"""
+Run statistics.
+"""
+
+import atexit
+import collections
+import os
+import sys
+import threading
+
+STATS = collections.Counter()
+
+_lock = threading.Lock()
+
+
+def increment(name, value=1):
+    """
+    Adds to a counter.
+    :param name: Counter name, such as "retry.attempts".
+    :param value: Amount to add.
+    :return: None
+    """
+    with _lock:
+        STATS[name] += value
+
+
+def report(stream=None):
+    """
+    Writes every counter to stderr.
+    :param stream: File to write to instead of stderr.
+    :return: None
+    """
+    stream = stream or sys.stderr
+    with _lock:
+        for name, value in sorted(STATS.items()):
+            stream.write(f"{name}: {value}\n")
+
+
+def reset():
+    """
+    Clears every counter.
+    :return: None
+    """
+    with _lock:
+        STATS.clear()
+
+
+@atexit.register
+def _report_on_exit():
+    if os.getenv("SHUTTERSTOCK_CLI_STATS") == "true" and STATS:
+        report()
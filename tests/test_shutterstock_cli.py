@@ -1,11 +1,87 @@
+import asyncio
+import contextlib
+import gzip
+import http.server
+import io
+import json
 import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import click
+import requests
+from click.testing import CliRunner
 from requests.auth import HTTPBasicAuth
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+from shutterstock.utils.async_request import AsyncClient
+from shutterstock import client, complete
+from shutterstock.cli import GROUPS, cli
+from shutterstock.serve import listen, run_workers, serve_forever
+from shutterstock.utils import codec
+from shutterstock.utils.cache import ResponseCache, is_fresh
+from shutterstock.utils.columnar import schema_for
+from shutterstock.utils.registry import build_command, index
+from shutterstock.utils.hedge import Hedger
+from shutterstock.utils.jsonstream import DataArrayParser, iter_records
+from shutterstock.utils.output import write, write_json
+from shutterstock.utils.pages import iter_cursor_pages, shard_windows
 from shutterstock.utils.prettyprint import pretty_print
-from shutterstock.utils.request import get, put, post, delete
+from shutterstock.utils.ratelimit import TokenBucket
+from shutterstock.utils.request import create_session, get, get_session, put, post, delete, request
 from shutterstock.utils.request_helper import RequestHelper
+from shutterstock.utils.retry import RetryPolicy
+from shutterstock.utils.select import compile_selector, fields_parameter
+from shutterstock.utils.settings import settings
+from shutterstock.utils.singleflight import SingleFlight
+from shutterstock.utils.stats import STATS
+
+
+def setUpModule():
+    """
+    Keeps the response cache of the tests out of the user's cache directory.
+    """
+    global CACHE_DIR
+    CACHE_DIR = tempfile.TemporaryDirectory()
+    os.environ["SHUTTERSTOCK_CLI_CACHE_DIR"] = CACHE_DIR.name
+
+
+def tearDownModule():
+    del os.environ["SHUTTERSTOCK_CLI_CACHE_DIR"]
+    CACHE_DIR.cleanup()
+
+
+def make_response(status_code=200, content=b"{}", headers=None):
+    """
+    Builds a real response object without touching the network.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
 
 
 class UtilTests(unittest.TestCase):
@@ -19,6 +95,29 @@ class UtilTests(unittest.TestCase):
         data = {"a": 1, "b": 2}
         self.assertLogs(pretty_print(data))
 
+    def test_colorize_matches_json_dumps(self):
+        """
+        Asserts the built-in colorizer writes the same JSON as json.dumps, with colors.
+        """
+        data = {"b": [1, 2.5, "x\u00e9\n", True, None, {}], "a": {"c": [], "d": False}, "e": -1e100}
+        stream = io.StringIO()
+        pretty_print(data, stream=stream)
+        self.assertIn("\x1b[94m\"a\"\x1b[39;49;00m", stream.getvalue())
+        plain = re.sub("\x1b\\[[0-9;]*m", "", stream.getvalue())
+        self.assertEqual(plain, json.dumps(data, sort_keys=True, indent=4) + "\n")
+
+    def test_pygments_is_imported_on_demand(self):
+        """
+        Asserts pygments is not imported until the pygments highlighter is used.
+        """
+        code = (
+            "import sys;"
+            "from shutterstock.utils.prettyprint import pretty_print;"
+            "pretty_print({'a': 1}); assert 'pygments' not in sys.modules;"
+            "pretty_print({'a': 1}, 'pygments'); assert 'pygments' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+
 
 class RequestHelperTests(unittest.TestCase):
     """
@@ -85,106 +184,1779 @@ class RequestTests(unittest.TestCase):
         self.response_data = {"a": 1, "b": 2}
         self.base_endpoint = "https://api.shutterstock.com"
 
-    @patch("requests.get")
-    def test_sandbox_enabled(self, mock_get):
+    @patch("requests.Session.request")
+    def test_sandbox_enabled(self, mock_request):
         os.environ["SHUTTERSTOCK_SANDBOX"] = "true"
-        mock_get.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         get(url, params)
-        mock_get.assert_called_with(
+        mock_request.assert_called_with(
+            "GET",
             url=f"https://api-sandbox.shutterstock.com{url}",
             params=params,
+            json=None,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=True,
         )
         self.assertLogs(pretty_print(self.response_data))
 
-    @patch("requests.get")
-    def test_sandbox_set_to_false(self, mock_get):
+    @patch("requests.Session.request")
+    def test_sandbox_set_to_false(self, mock_request):
         os.environ["SHUTTERSTOCK_SANDBOX"] = "false"
-        mock_get.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         get(url, params)
-        mock_get.assert_called_with(
+        mock_request.assert_called_with(
+            "GET",
             url=f"{self.base_endpoint}{url}",
             params=params,
+            json=None,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=True,
         )
         self.assertLogs(pretty_print(self.response_data))
 
-    @patch("requests.get")
-    def test_get(self, mock_get):
+    @patch("requests.Session.request")
+    def test_get(self, mock_request):
         """
         Asserts we are calling the GET function properly.
         """
-        mock_get.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         get(url, params)
-        mock_get.assert_called_with(
+        mock_request.assert_called_with(
+            "GET",
             url=f"{self.base_endpoint}{url}",
             params=params,
+            json=None,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=True,
         )
         self.assertLogs(pretty_print(self.response_data))
 
-    @patch("requests.post")
-    def test_post(self, mock_post):
+    @patch("requests.Session.request")
+    def test_post(self, mock_request):
         """
         Asserts we are calling the POST function properly.
         """
-        mock_post.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         data = {"a": 1, "b": 2}
         post(url, params, data)
-        mock_post.assert_called_with(
+        mock_request.assert_called_with(
+            "POST",
             url=f"{self.base_endpoint}{url}",
             json=data,
             params=params,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=False,
         )
         self.assertLogs(pretty_print(self.response_data))
 
-    @patch("requests.put")
-    def test_put(self, mock_put):
+    @patch("requests.Session.request")
+    def test_put(self, mock_request):
         """
         Asserts we are calling the PUT function properly.
         """
-        mock_put.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         data = {"a": 1, "b": 2}
         put(url, params, data)
-        mock_put.assert_called_with(
+        mock_request.assert_called_with(
+            "PUT",
             url=f"{self.base_endpoint}{url}",
             params=params,
             json=data,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=False,
         )
         self.assertLogs(pretty_print(self.response_data))
 
-    @patch("requests.delete")
-    def test_delete(self, mock_delete):
+    @patch("requests.Session.request")
+    def test_delete(self, mock_request):
         """
         Asserts we are calling the DELETE function properly.
         """
-        mock_delete.return_value.json.return_value = self.response_data
+        mock_request.return_value.json.return_value = self.response_data
         url = "/v2/images/search"
         params = {"query": "poland"}
         data = {"a": 1, "b": 2}
         delete(url, params, data)
-        mock_delete.assert_called_with(
+        mock_request.assert_called_with(
+            "DELETE",
             url=f"{self.base_endpoint}{url}",
             params=params,
             json=data,
             headers=self.headers,
             auth=None,
+            timeout=(10.0, 60.0),
+            stream=False,
         )
         self.assertLogs(pretty_print(self.response_data))
+
+
+class SessionTests(unittest.TestCase):
+    """
+    Pooled Session Tests
+    """
+
+    def test_session_is_shared(self):
+        """
+        Asserts every request goes through the same pooled session.
+        """
+        self.assertIs(get_session(), get_session())
+
+    def test_create_session_mounts_pooled_adapters(self):
+        """
+        Asserts the session mounts adapters with the configured pool size.
+        """
+        session = create_session(25)
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(f"{prefix}api.shutterstock.com")
+            self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+
+class AsyncClientTests(unittest.TestCase):
+    """
+    Async Client Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def fake_request(self, method, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return make_response(content=json.dumps({"url": url}).encode())
+
+    @patch("requests.Session.request")
+    def test_gather_respects_limit(self, mock_request):
+        """
+        Asserts no more than the configured number of requests are in flight.
+        """
+        mock_request.side_effect = self.fake_request
+
+        async def run():
+            async with AsyncClient(limit=3) as client:
+                return await client.gather(
+                    client.get(f"/v2/images/{i}", params={}) for i in range(12)
+                )
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[5], {"url": "https://api.shutterstock.com/v2/images/5"})
+        self.assertLessEqual(self.peak, 3)
+        self.assertGreater(self.peak, 1)
+
+    def test_limit_sizes_pool(self):
+        """
+        Asserts the shared session keeps a connection open for each request in flight.
+        """
+        AsyncClient(limit=50).close()
+        adapter = get_session().get_adapter("https://api.shutterstock.com")
+        self.assertGreaterEqual(adapter._pool_maxsize, 50)
+
+
+class TokenBucketTests(unittest.TestCase):
+    """
+    Token Bucket Tests
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "bucket.json")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_buckets_share_state_file(self):
+        """
+        Asserts two limiters on the same file draw from one budget, as separate processes would.
+        """
+        first = TokenBucket(self.path, rate=0.5, capacity=2)
+        second = TokenBucket(self.path, rate=0.5, capacity=2)
+        self.assertEqual(first.try_acquire(), 0)
+        self.assertEqual(second.try_acquire(), 0)
+        self.assertGreater(first.try_acquire(), 0)
+
+    def test_update_from_headers(self):
+        """
+        Asserts an exhausted quota blocks until the reset time.
+        """
+        bucket = TokenBucket(self.path, rate=10)
+        bucket.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+        self.assertGreater(bucket.try_acquire(), 25)
+
+    def test_update_on_too_many_requests(self):
+        """
+        Asserts a 429 response honors Retry-After.
+        """
+        bucket = TokenBucket(self.path, rate=10)
+        bucket.update(429, {"Retry-After": "5"})
+        self.assertGreater(bucket.try_acquire(), 4)
+
+    def test_configured_rate_replaces_stored_rate(self):
+        """
+        Asserts a new configured rate takes effect on an existing state file.
+        """
+        slow = TokenBucket(self.path, rate=0.5, capacity=1)
+        self.assertEqual(slow.try_acquire(), 0)
+        self.assertGreater(slow.try_acquire(), 1)
+        fast = TokenBucket(self.path, rate=100)
+        with fast._state() as state:  # pylint: disable=protected-access
+            self.assertEqual(state["rate"], 100)
+            self.assertEqual(state["capacity"], 100)
+
+    @patch("time.time")
+    def test_adapted_rate_expires_at_reset(self, mock_time):
+        """
+        Asserts the rate learnt from headers never exceeds the configured rate and
+        lasts until the rate limit window resets.
+        """
+        mock_time.return_value = 1000.0
+        bucket = TokenBucket(self.path, rate=10)
+        bucket.update(200, {"X-RateLimit-Remaining": "1000", "X-RateLimit-Reset": "10"})
+        with bucket._state() as state:  # pylint: disable=protected-access
+            self.assertEqual(state["rate"], 10)
+        bucket.update(200, {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"})
+        with bucket._state() as state:  # pylint: disable=protected-access
+            self.assertEqual(state["rate"], 2)
+        mock_time.return_value = 1011.0
+        with bucket._state() as state:  # pylint: disable=protected-access
+            self.assertEqual(state["rate"], 10)
+
+
+@patch("time.sleep")
+class RetryPolicyTests(unittest.TestCase):
+    """
+    Retry Policy Tests
+    """
+
+    def test_retries_idempotent_request(self, mock_sleep):
+        """
+        Asserts a GET is retried after a server error.
+        """
+        responses = [make_response(502), make_response(200)]
+        retries = STATS["retry.retries"]
+        res = RetryPolicy().call("GET", lambda: responses.pop(0))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(STATS["retry.retries"], retries + 1)
+        mock_sleep.assert_called_once()
+
+    def test_does_not_retry_post_without_key(self, mock_sleep):
+        """
+        Asserts a POST without an idempotency key is sent once.
+        """
+        responses = [make_response(503), make_response(200)]
+        res = RetryPolicy().call("POST", lambda: responses.pop(0))
+        self.assertEqual(res.status_code, 503)
+        mock_sleep.assert_not_called()
+
+    def test_retries_post_with_key(self, mock_sleep):
+        """
+        Asserts a POST with an idempotency key is retried after a connection error.
+        """
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                raise requests.ConnectionError()
+            return make_response(200)
+
+        res = RetryPolicy().call("POST", send, idempotency_key="abc")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(calls), 2)
+
+    def test_honors_retry_after(self, mock_sleep):
+        """
+        Asserts the Retry-After header sets the delay.
+        """
+        responses = [make_response(429, headers={"Retry-After": "7"}), make_response(200)]
+        RetryPolicy().call("GET", lambda: responses.pop(0))
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_invalid_retry_after(self, mock_sleep):
+        """
+        Asserts a Retry-After header that is neither seconds nor a date falls back to backoff.
+        """
+        responses = [make_response(503, headers={"Retry-After": "soon"}), make_response(200)]
+        res = RetryPolicy(backoff=0.5).call("GET", lambda: responses.pop(0))
+        self.assertEqual(res.status_code, 200)
+        self.assertLessEqual(mock_sleep.call_args.args[0], 1.0)
+
+    def test_gives_up_when_budget_is_spent(self, mock_sleep):
+        """
+        Asserts retries stop once the retry budget is spent.
+        """
+        policy = RetryPolicy(retries=5, max_budget=2)
+        res = policy.call("GET", lambda: make_response(500))
+        self.assertEqual(res.status_code, 500)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    """
+    Response Cache Tests
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        os.environ["SHUTTERSTOCK_CLI_CACHE_DIR"] = self.tmp.name
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        settings.cache = True
+        settings.refresh = False
+
+    def tearDown(self) -> None:
+        os.environ["SHUTTERSTOCK_CLI_CACHE_DIR"] = CACHE_DIR.name
+        settings.refresh = False
+        self.tmp.cleanup()
+
+    @patch("requests.Session.request")
+    def test_reference_data_is_cached(self, mock_request):
+        """
+        Asserts reference data is fetched once and then served from the cache.
+        """
+        mock_request.return_value = make_response(content=b'{"data": [{"id": "1"}]}')
+        get("/v2/images/categories", {"language": "en"})
+        get("/v2/images/categories", {"language": "en"})
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("requests.Session.request")
+    def test_refresh_bypasses_cache(self, mock_request):
+        """
+        Asserts --refresh fetches a fresh response.
+        """
+        mock_request.return_value = make_response(content=b'{"data": []}')
+        get("/v2/audio/genres", {"language": "en"})
+        settings.refresh = True
+        get("/v2/audio/genres", {"language": "en"})
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.request")
+    def test_other_endpoints_are_not_cached(self, mock_request):
+        """
+        Asserts search results are always fetched.
+        """
+        mock_request.return_value = make_response(content=b'{"data": []}')
+        get("/v2/images/search", {"query": "boats"})
+        get("/v2/images/search", {"query": "boats"})
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_key_ignores_unset_params(self):
+        """
+        Asserts unset parameters do not change the cache key.
+        """
+        self.assertEqual(
+            ResponseCache.key("GET", "/v2/audio/moods", {"language": None, "id": ()}, "x"),
+            ResponseCache.key("GET", "/v2/audio/moods", {}, "x"),
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """
+        Asserts the cache evicts its oldest entries when it grows too big.
+        """
+        cache = ResponseCache(self.tmp.name)
+        for index in range(5):
+            cache.set(str(index), "/v2/audio/moods", make_response(content=b"x" * 100))
+            os.utime(os.path.join(self.tmp.name, f"{index}.json"), (index, index))
+        cache.get("0")
+        cache.max_bytes = 3 * os.path.getsize(os.path.join(self.tmp.name, "0.json"))
+        cache.evict()
+        self.assertIsNotNone(cache.get("0"))
+        self.assertIsNone(cache.get("1"))
+        self.assertIsNotNone(cache.get("4"))
+
+    def test_store_scans_only_when_over_budget(self):
+        """
+        Asserts storing a response only scans the cache directory once the running
+        total of its size exceeds the limit.
+        """
+        cache = ResponseCache(self.tmp.name)
+        cache.set("0", "/v2/audio/moods", make_response(content=b"x" * 100))
+        size = os.path.getsize(os.path.join(self.tmp.name, "0.json"))
+        cache.max_bytes = 3 * size + 10
+        with patch("os.scandir", wraps=os.scandir) as scandir:
+            cache.set("1", "/v2/audio/moods", make_response(content=b"x" * 100))
+            cache.set("1", "/v2/audio/moods", make_response(content=b"x" * 100))
+            cache.set("2", "/v2/audio/moods", make_response(content=b"x" * 100))
+            scandir.assert_not_called()
+            cache.set("3", "/v2/audio/moods", make_response(content=b"x" * 100))
+            scandir.assert_called_once()
+        sizes = [
+            os.path.getsize(os.path.join(self.tmp.name, name))
+            for name in os.listdir(self.tmp.name)
+            if name.endswith(".json")
+        ]
+        self.assertEqual(len(sizes), 2)
+        self.assertEqual(cache.usage(), sum(sizes))
+
+    @patch("requests.Session.request")
+    def test_not_modified_reuses_cached_body(self, mock_request):
+        """
+        Asserts assets are revalidated with their ETag and a 304 reuses the cached body.
+        """
+        mock_request.side_effect = [
+            make_response(content=b'{"id": "123"}', headers={"ETag": '"v1"'}),
+            make_response(304),
+        ]
+        get("/v2/images/123", {"view": "full"})
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            get("/v2/images/123", {"view": "full"})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(json.loads(output.getvalue()), {"id": "123"})
+
+
+    def test_not_modified_refreshes_entry_without_rewriting(self):
+        """
+        Asserts a 304 with the same validators only refreshes the entry's
+        modification time, and new validators are written.
+        """
+        cache = ResponseCache(self.tmp.name)
+        cache.set(
+            "0",
+            "/v2/images/categories",
+            make_response(content=b'{"data": []}', headers={"ETag": '"v1"'}),
+        )
+        path = os.path.join(self.tmp.name, "0.json")
+        os.utime(path, (0, 0))
+        with patch.object(ResponseCache, "store") as store:
+            cache.revalidated("0", cache.get("0"), make_response(304))
+            cache.revalidated(
+                "0", cache.get("0"), make_response(304, headers={"ETag": '"v1"'})
+            )
+        store.assert_not_called()
+        self.assertTrue(is_fresh(cache.get("0"), 60))
+        cache.revalidated(
+            "0", cache.get("0"), make_response(304, headers={"ETag": '"v2"'})
+        )
+        self.assertEqual(cache.get("0")["headers"]["ETag"], '"v2"')
+
+    @patch("requests.Session.request")
+    def test_responses_without_validators_are_not_stored(self, mock_request):
+        """
+        Asserts assets that cannot be revalidated are not written to the cache.
+        """
+        mock_request.return_value = make_response(content=b'{"id": "124"}')
+        with patch.object(ResponseCache, "store") as store:
+            get("/v2/images/124", {"view": "full"})
+        store.assert_not_called()
+        self.assertNotIn("If-None-Match", mock_request.call_args.kwargs["headers"])
+
+class SingleFlightTests(unittest.TestCase):
+    """
+    Single Flight Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+
+    @patch("requests.Session.request")
+    def test_identical_gets_are_coalesced(self, mock_request):
+        """
+        Asserts concurrent identical GET requests make one network call and share the response.
+        """
+        def slow_response(*args, **kwargs):
+            time.sleep(0.05)
+            return make_response(content=b'{"id": "1"}')
+
+        mock_request.side_effect = slow_response
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(request("GET", "/v2/images/search", {"query": "boats"})))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_errors_are_shared(self):
+        """
+        Asserts an error in the call is raised and the key is released.
+        """
+        flights = SingleFlight()
+        with self.assertRaises(ValueError):
+            flights.do("key", lambda: int("x"))
+        self.assertEqual(flights.do("key", lambda: 1), 1)
+
+
+class HedgerTests(unittest.TestCase):
+    """
+    Hedged Request Tests
+    """
+
+    def test_fast_request_is_not_hedged(self):
+        """
+        Asserts a request that answers before the delay is sent once.
+        """
+        calls = []
+        hedger = Hedger(delay=1)
+        self.assertEqual(hedger.call(lambda: calls.append(1) or "ok"), "ok")
+        self.assertEqual(len(calls), 1)
+
+    def test_slow_request_is_hedged(self):
+        """
+        Asserts a stalled request is raced by a second copy, which wins.
+        """
+        calls = []
+
+        def attempt():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return "slow"
+            return "fast"
+
+        won = STATS["hedge.won"]
+        self.assertEqual(Hedger(delay=0.05).call(attempt), "fast")
+        self.assertEqual(STATS["hedge.won"], won + 1)
+
+    def test_losing_response_is_closed(self):
+        """
+        Asserts the streamed response that loses the race is closed, releasing
+        its connection, while the winner is left open for its caller.
+        """
+        responses = []
+
+        def attempt():
+            res = requests.Response()
+            res.status_code = 200
+            res.raw = MagicMock()
+            responses.append(res)
+            if len(responses) == 1:
+                time.sleep(0.2)
+            return res
+
+        hedger = Hedger(delay=0.05)
+        winner = hedger.call(attempt)
+        hedger._executor.shutdown(wait=True)
+        self.assertIs(winner, responses[1])
+        responses[0].raw.close.assert_called_once()
+        winner.raw.close.assert_not_called()
+
+    def test_delay_follows_observed_latency(self):
+        """
+        Asserts the hedge delay becomes the 95th percentile of observed latencies.
+        """
+        hedger = Hedger(delay=5, min_samples=20)
+        for latency in range(1, 101):
+            hedger._record(latency / 1000)
+        self.assertAlmostEqual(hedger.delay(), 0.096)
+
+
+class H2StandIn(threading.Thread):
+    """
+    Minimal HTTP/2 server that answers every request with a JSON echo of its headers.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.url = "http://127.0.0.1:%d" % self.sock.getsockname()[1]
+
+    def run(self):
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.serve, args=(client,), daemon=True).start()
+
+    def serve(self, client):
+        config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        conn = h2.connection.H2Connection(config=config)
+        conn.initiate_connection()
+        client.sendall(conn.data_to_send())
+        requests_by_stream = {}
+        while True:
+            data = client.recv(65535)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    requests_by_stream[event.stream_id] = dict(event.headers)
+                elif isinstance(event, h2.events.StreamEnded):
+                    body = json.dumps(requests_by_stream.pop(event.stream_id)).encode()
+                    conn.send_headers(
+                        event.stream_id,
+                        [(":status", "200"), ("content-type", "application/json")],
+                    )
+                    conn.send_data(event.stream_id, body, end_stream=True)
+            client.sendall(conn.data_to_send())
+
+    def stop(self):
+        self.sock.close()
+
+
+@unittest.skipIf(httpx is None, "httpx[http2] is not installed")
+class Http2Tests(unittest.TestCase):
+    """
+    HTTP/2 Transport Tests
+    """
+
+    def setUp(self) -> None:
+        self.server = H2StandIn()
+        self.server.start()
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ["SHUTTERSTOCK_CUSTOM_URL"] = self.server.url
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        settings.http2 = True
+
+    def tearDown(self) -> None:
+        settings.http2 = False
+        del os.environ["SHUTTERSTOCK_CUSTOM_URL"]
+        self.server.stop()
+
+    def test_request_over_http2(self):
+        """
+        Asserts requests keep their authentication and parameters over HTTP/2.
+        """
+        res = request("GET", "/v2/images/search", {"query": "boats", "page": None, "id": ()})
+        self.assertEqual(res.http_version, "HTTP/2")
+        echoed = res.json()
+        self.assertEqual(echoed[":path"], "/v2/images/search?query=boats")
+        self.assertEqual(echoed["authorization"], "Bearer a")
+        self.assertEqual(echoed["x-shutterstock-application"], "CLI")
+
+
+class GzipHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers every request with a large gzip-compressed JSON body.
+    """
+
+    def do_GET(self):
+        body = json.dumps({"data": [{"id": str(i), "description": "boat"} for i in range(500)]})
+        compressed = gzip.compress(body.encode())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(compressed)))
+        self.end_headers()
+        self.wfile.write(compressed)
+
+    def log_message(self, *args):
+        pass
+
+
+class CompressionTests(unittest.TestCase):
+    """
+    Compression Tests
+    """
+
+    def setUp(self) -> None:
+        self.server = http.server.HTTPServer(("127.0.0.1", 0), GzipHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ["SHUTTERSTOCK_CUSTOM_URL"] = "http://127.0.0.1:%d" % self.server.server_port
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+
+    def tearDown(self) -> None:
+        del os.environ["SHUTTERSTOCK_CUSTOM_URL"]
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_compressed_bytes_are_counted(self):
+        """
+        Asserts compression is negotiated and wire and decoded bytes are both counted.
+        """
+        wire, decoded = STATS["bytes.wire"], STATS["bytes.decoded"]
+        res = request("GET", "/v2/images/search", {"query": "boats", "view": "full"})
+        self.assertEqual(len(res.json()["data"]), 500)
+        self.assertIn("gzip", res.request.headers["Accept-Encoding"])
+        self.assertEqual(STATS["bytes.decoded"] - decoded, len(res.content))
+        self.assertLess(STATS["bytes.wire"] - wire, (STATS["bytes.decoded"] - decoded) / 5)
+
+    def test_streamed_records(self):
+        """
+        Asserts ndjson output is written from the streamed body, and its bytes are counted.
+        """
+        decoded = STATS["bytes.decoded"]
+        output = io.StringIO()
+        settings.format = "ndjson"
+        settings.output = output
+        try:
+            get("/v2/images/search", {"query": "boats"})
+        finally:
+            settings.format = "json"
+            settings.output = None
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 500)
+        self.assertEqual(json.loads(lines[499]), {"id": "499", "description": "boat"})
+        self.assertGreater(STATS["bytes.decoded"], decoded)
+
+
+class OutputTests(unittest.TestCase):
+    """
+    Output Writer Tests
+    """
+
+    def tearDown(self) -> None:
+        settings.pretty = None
+        settings.format = "json"
+
+    def test_compact_when_not_a_terminal(self):
+        """
+        Asserts JSON written to a pipe or file is compact.
+        """
+        stream = io.StringIO()
+        write_json({"data": [{"id": "1"}]}, stream)
+        self.assertEqual(stream.getvalue(), '{"data":[{"id":"1"}]}\n')
+
+    def test_pretty(self):
+        """
+        Asserts --pretty indents the JSON.
+        """
+        settings.pretty = True
+        stream = io.StringIO()
+        write_json({"a": 1}, stream)
+        self.assertEqual(stream.getvalue(), '{\n    "a": 1\n}\n')
+
+    def test_large_document_is_written_in_chunks(self):
+        """
+        Asserts large documents are written in several chunks that add up to the document.
+        """
+        data = {"data": [{"id": str(i), "description": "x" * 100} for i in range(2000)]}
+        stream = MagicMock()
+        stream.isatty.return_value = False
+        write_json(data, stream)
+        self.assertGreater(stream.write.call_count, 2)
+        written = "".join(call.args[0] for call in stream.write.call_args_list)
+        self.assertEqual(json.loads(written), data)
+
+    def test_compact_document_is_encoded_per_record(self):
+        """
+        Asserts compact JSON encodes the data array one record at a time, keeping the key order.
+        """
+        data = {"page": 1, "data": [{"id": "1"}, {"id": "2"}], "total_count": 2}
+        stream = io.StringIO()
+        with patch.object(codec, "dumps", wraps=codec.dumps) as dumps:
+            write_json(data, stream)
+        self.assertNotIn(data, [call.args[0] for call in dumps.call_args_list])
+        self.assertEqual(stream.getvalue(), json.dumps(data, separators=(",", ":")) + "\n")
+
+    def test_non_ascii_text_is_not_escaped(self):
+        """
+        Asserts compact and indented JSON both write text as UTF-8.
+        """
+        stream = io.StringIO()
+        write_json({"data": [{"description": "Bateau à voile"}]}, stream)
+        self.assertIn("Bateau à voile", stream.getvalue())
+        settings.pretty = True
+        stream = io.StringIO()
+        write_json({"description": "Bateau à voile"}, stream)
+        self.assertIn("Bateau à voile", stream.getvalue())
+
+    @patch("requests.Session.request")
+    def test_get_streams_json(self, mock_request):
+        """
+        Asserts JSON responses are written from the streamed body with their fields in order.
+        """
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        body = {"page": 1, "per_page": 2, "data": [{"id": "1"}, {"id": "2"}], "total_count": 2}
+        response = make_response(content=json.dumps(body).encode())
+        response.iter_content = lambda size: iter([response.content[:30], response.content[30:]])
+        mock_request.return_value = response
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            get("/v2/images/search", {"query": "boat"})
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        self.assertEqual(output.getvalue(), json.dumps(body, separators=(",", ":")) + "\n")
+
+        mock_request.return_value = make_response(content=b'{"id": "1", "assets": {}}')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            get("/v2/images/1", {})
+        self.assertEqual(output.getvalue(), '{"id":"1","assets":{}}\n')
+
+    def test_ndjson_writes_one_record_per_line(self):
+        """
+        Asserts --format ndjson writes each item of the data array on its own line.
+        """
+        settings.format = "ndjson"
+        stream = io.StringIO()
+        write({"data": [{"id": "1"}, {"id": "2"}], "total_count": 2}, stream)
+        self.assertEqual(stream.getvalue(), '{"id":"1"}\n{"id":"2"}\n')
+
+    def test_ndjson_without_data_array(self):
+        """
+        Asserts responses without a data array are written as a single line.
+        """
+        settings.format = "ndjson"
+        stream = io.StringIO()
+        write({"id": "1", "assets": {}}, stream)
+        self.assertEqual(stream.getvalue(), '{"id":"1","assets":{}}\n')
+
+
+class JsonStreamTests(unittest.TestCase):
+    """
+    Incremental Parser Tests
+    """
+
+    def setUp(self) -> None:
+        self.document = {
+            "data": [
+                {"id": "1", "description": 'a "quoted" \\ , ] } [ { é', "keywords": ["a", "b"]},
+                {"id": "2", "data": [3, {"data": []}]},
+                12345,
+                "text",
+            ],
+            "total_count": 4,
+        }
+        self.body = json.dumps(self.document, indent=2, ensure_ascii=False).encode()
+
+    def test_items_split_across_chunks(self):
+        """
+        Asserts items are parsed whatever the chunk boundaries, including inside UTF-8 characters.
+        """
+        for size in (1, 3, 64, len(self.body)):
+            chunks = [self.body[i : i + size] for i in range(0, len(self.body), size)]
+            self.assertEqual(list(iter_records(chunks)), self.document["data"])
+
+    def test_numbers_split_across_chunks(self):
+        """
+        Asserts numbers are parsed whole when a chunk ends inside them, as after "1." or "1e".
+        """
+        body = b'{"data":[12345678901234567890, 1.0, 2e5,-3.5E-2 ,7]}'
+        for i in range(1, len(body)):
+            self.assertEqual(
+                list(iter_records([body[:i], body[i:]])),
+                [12345678901234567890, 1.0, 2e5, -3.5e-2, 7],
+            )
+
+    def test_envelope_fields(self):
+        """
+        Asserts the fields around the data array are kept, whatever the chunk boundaries.
+        """
+        document = {"page": 1, "search_id": "s", "data": [{"id": "1"}], "total_count": 1, "x": {"a": []}}
+        body = json.dumps(document, indent=2).encode()
+        for size in (1, 7, len(body)):
+            parser = DataArrayParser()
+            chunks = [body[i : i + size] for i in range(0, len(body), size)]
+            self.assertEqual(list(iter_records(chunks, parser)), [{"id": "1"}])
+            self.assertEqual(parser.envelope, {"page": 1, "search_id": "s"})
+            self.assertEqual(parser.trailer, {"total_count": 1, "x": {"a": []}})
+
+    def test_document_without_data_array(self):
+        """
+        Asserts a response without a data array is returned whole.
+        """
+        document = {"errors": [{"data": "x"}], "message": "Not found"}
+        body = json.dumps(document).encode()
+        self.assertEqual(list(iter_records([body[:10], body[10:]])), [document])
+
+    def test_memory_is_bounded_by_one_record(self):
+        """
+        Asserts the parser only keeps the record that is being received.
+        """
+        record = json.dumps({"id": "1", "description": "x" * 100})
+        parser = DataArrayParser()
+        parser.feed(b'{"data": [')
+        for _ in range(1000):
+            self.assertEqual(len(parser.feed(f"{record},".encode())), 1)
+            self.assertLess(len(parser._text), 2 * len(record))
+        parser.feed(f"{record}]}}".encode())
+        self.assertEqual(parser.close(), [])
+
+    def test_truncated_body(self):
+        """
+        Asserts a body that ends inside the data array is an error.
+        """
+        with self.assertRaises(json.decoder.JSONDecodeError):
+            list(iter_records([b'{"data": [{"id": "1"}, {"id"']))
+
+
+class SelectTests(unittest.TestCase):
+    """
+    Field Selection Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.record = {
+            "id": "1",
+            "description": "Boat",
+            "assets": {"preview": {"url": "p.jpg", "width": 450}, "huge_thumb": {}},
+            "keywords": [{"name": "boat", "score": 1}],
+        }
+
+    def tearDown(self) -> None:
+        settings.select = None
+        settings.format = "json"
+
+    def test_projection(self):
+        """
+        Asserts only the selected fields are kept, including inside lists.
+        """
+        project = compile_selector("id, assets.preview.url,keywords.name,missing.key")
+        self.assertEqual(
+            project(self.record),
+            {"id": "1", "assets": {"preview": {"url": "p.jpg"}}, "keywords": [{"name": "boat"}]},
+        )
+
+    def test_fields_parameter(self):
+        """
+        Asserts a selection is translated into the API fields parameter.
+        """
+        self.assertEqual(
+            fields_parameter("id,assets.preview.url"),
+            "data(id,assets/preview/url),page,per_page,total_count,search_id",
+        )
+
+    @patch("requests.Session.request")
+    def test_select_uses_fields_parameter(self, mock_request):
+        """
+        Asserts --select sets the fields parameter of commands that have one and projects the output.
+        """
+        mock_request.return_value = make_response(
+            content=json.dumps({"data": [self.record], "total_count": 1}).encode()
+        )
+        settings.select = "id,description"
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            get("/v2/images/search", {"query": "boats", "fields": None})
+        self.assertEqual(
+            mock_request.call_args.kwargs["params"]["fields"],
+            "data(id,description),page,per_page,total_count,search_id",
+        )
+        self.assertEqual(
+            json.loads(output.getvalue()),
+            {"data": [{"id": "1", "description": "Boat"}], "total_count": 1},
+        )
+
+    @patch("requests.Session.request")
+    def test_select_without_fields_parameter(self, mock_request):
+        """
+        Asserts commands without a fields parameter are projected on the client only.
+        """
+        mock_request.return_value = make_response(content=json.dumps(self.record).encode())
+        settings.select = "id"
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            get("/v2/images/search/suggestions", {"query": "boat"})
+        self.assertNotIn("fields", mock_request.call_args.kwargs["params"])
+        self.assertEqual(json.loads(output.getvalue()), {"id": "1"})
+
+
+    @patch("requests.Session.request")
+    def test_select_bulk_search(self, mock_request):
+        """
+        Asserts --select applies to the data array of each bulk search result.
+        """
+        mock_request.return_value = make_response(
+            content=json.dumps(
+                {"results": [{"data": [self.record], "total_count": 1}, {"data": [], "total_count": 0}]}
+            ).encode()
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            payload = os.path.join(directory, "queries.json")
+            with open(payload, "w", encoding="UTF-8") as queries:
+                queries.write('{"queries": [{"query": "boat"}, {"query": "ship"}]}')
+            runner = CliRunner()
+            result = runner.invoke(cli, ["--select", "id", "bulk-search", "bulk-search-images", payload])
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(
+                json.loads(result.output),
+                {"results": [{"data": [{"id": "1"}], "total_count": 1}, {"data": [], "total_count": 0}]},
+            )
+            self.assertEqual(
+                mock_request.call_args.kwargs["params"]["fields"],
+                "results(data(id),page,per_page,total_count,search_id)",
+            )
+            result = runner.invoke(
+                cli, ["--select", "id", "--format", "ndjson", "bulk-search", "bulk-search-images", payload]
+            )
+            self.assertEqual(result.output, '{"id":"1"}\n')
+
+class ColumnarTests(unittest.TestCase):
+    """
+    Columnar Export Tests
+    """
+
+    def setUp(self) -> None:
+        self.data = {
+            "data": [
+                {
+                    "id": str(i),
+                    "aspect": 1.5,
+                    "description": "Boat",
+                    "is_editorial": False,
+                    "assets": {"preview": {"url": f"https://example.com/{i}.jpg", "width": 450}},
+                    "keywords": ["boat", "sea"],
+                }
+                for i in range(3)
+            ]
+        }
+
+    def tearDown(self) -> None:
+        settings.format = "json"
+        settings.select = None
+
+    def test_schema_for_endpoint(self):
+        """
+        Asserts the columns are picked from the asset type of the endpoint.
+        """
+        self.assertIn(("aspect", "float"), schema_for("/v2/images/search"))
+        self.assertIn(("duration", "float"), schema_for("/v2/videos/search"))
+        self.assertIn(("bpm", "int"), schema_for("/v2/audio/search"))
+        self.assertIn(("license", "string"), schema_for("/v2/images/licenses"))
+        self.assertEqual(schema_for("/v2/unknown", {"a": 1, "b": 2}), [("a", "string"), ("b", "string")])
+        self.assertIn(("updated_time", "string"), schema_for("/v2/images/updated"))
+        self.assertIn(("name", "string"), schema_for("/v2/videos/collections/12"))
+        self.assertIn(("added_time", "string"), schema_for("/v2/audio/collections/12/items"))
+        self.assertIn(("aspect", "float"), schema_for("/v2/images/123/similar"))
+        self.assertIn(("aspect", "float"), schema_for("/v2/bulk_search/images"))
+        self.assertEqual(
+            schema_for("/v2/images/categories", {"id": "1", "name": "Animals"}),
+            [("id", "string"), ("name", "string")],
+        )
+
+    def test_csv(self):
+        """
+        Asserts --format csv writes a header and one row per record, with nested
+        fields flattened and lists encoded as JSON.
+        """
+        settings.format = "csv"
+        stream = io.StringIO()
+        write(self.data, stream, "/v2/images/search")
+        rows = stream.getvalue().splitlines()
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(rows[0].startswith("id,description,image_type,media_type,aspect"))
+        self.assertIn('https://example.com/0.jpg,450,,"[""boat"",""sea""]"', rows[1])
+
+    def test_csv_select(self):
+        """
+        Asserts --select chooses the columns.
+        """
+        settings.format = "csv"
+        settings.select = "id,assets.preview.url"
+        stream = io.StringIO()
+        write(self.data, stream, "/v2/images/search")
+        self.assertEqual(stream.getvalue().splitlines()[:2], ["id,assets.preview.url", "0,https://example.com/0.jpg"])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        """
+        Asserts --format parquet writes typed columns in row groups.
+        """
+        settings.format = "parquet"
+        stream = io.BytesIO()
+        with patch("shutterstock.utils.columnar.BATCH_SIZE", 2):
+            write(self.data, stream, "/v2/images/search")
+        stream.seek(0)
+        parquet = pyarrow.parquet.ParquetFile(stream)
+        self.assertEqual(parquet.metadata.num_rows, 3)
+        self.assertEqual(parquet.num_row_groups, 2)
+        table = parquet.read()
+        self.assertEqual(table.schema.field("aspect").type, pyarrow.float64())
+        self.assertEqual(table.column("assets.preview.width").to_pylist(), [450, 450, 450])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow(self):
+        """
+        Asserts --format arrow writes an Arrow IPC stream.
+        """
+        settings.format = "arrow"
+        stream = io.BytesIO()
+        write(self.data, stream, "/v2/images/search")
+        table = pyarrow.ipc.open_stream(stream.getvalue()).read_all()
+        self.assertEqual(table.column("id").to_pylist(), ["0", "1", "2"])
+        self.assertEqual(table.schema.field("is_editorial").type, pyarrow.bool_())
+
+
+class CodecTests(unittest.TestCase):
+    """
+    JSON Codec Tests
+    """
+
+    data = {"id": "1", "description": "Bateau à voile", "aspect": 1.5, "keywords": ["boat"], "big": 2**70}
+
+    def check(self):
+        self.assertEqual(codec.loads(json.dumps(self.data).encode()), self.data)
+        self.assertEqual(codec.load(io.StringIO(json.dumps(self.data))), self.data)
+        self.assertEqual(json.loads(codec.dumps(self.data)), self.data)
+        self.assertIn("à", codec.dumps(self.data))
+        self.assertNotIn(" ", codec.dumps({"a": [1, 2]}))
+        self.assertEqual(codec.dumps({"b": 1, "a": 2}, sort_keys=True), '{"a":2,"b":1}')
+        self.assertEqual(codec.dumps({"a": 1}, indent=4), '{\n    "a": 1\n}')
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads(b"{")
+
+    def test_standard_library(self):
+        """
+        Asserts the codec works without orjson.
+        """
+        with patch("shutterstock.utils.codec.orjson", None):
+            self.check()
+
+    @unittest.skipIf(codec.orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        """
+        Asserts the codec gives the same results with orjson.
+        """
+        self.check()
+
+
+class LazyGroupTests(unittest.TestCase):
+    """
+    Lazy Command Group Tests
+    """
+
+    def loaded_groups(self, *args):
+        """
+        Runs the CLI in a fresh interpreter.
+        :return: Names of the command group modules that were imported.
+        """
+        code = (
+            "import sys; from shutterstock.cli import GROUPS, cli\n"
+            "try:\n"
+            f"    cli({list(args)!r})\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(','.join(n for n in GROUPS if GROUPS[n][0].split(':')[0] in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        )
+        return result.stdout.splitlines()[-1]
+
+    def test_help_imports_no_group(self):
+        """
+        Asserts --help lists every group without importing them.
+        """
+        self.assertEqual(self.loaded_groups("--help"), "")
+
+    def test_command_imports_only_its_group(self):
+        """
+        Asserts a command imports only the module of its group.
+        """
+        self.assertEqual(self.loaded_groups("images", "get-image", "--help"), "images")
+
+    def test_every_group_resolves(self):
+        """
+        Asserts every lazy group name resolves to a click group.
+        """
+        context = click.Context(cli)
+        for name in GROUPS:
+            self.assertIsInstance(cli.get_command(context, name), click.Group)
+
+
+class ImportTimeTests(unittest.TestCase):
+    """
+    Import Time Budget Tests
+    """
+
+    budget_ms = float(os.getenv("SHUTTERSTOCK_CLI_IMPORT_BUDGET_MS", "300"))
+    heavy = ("requests", "urllib3", "httpx", "pyarrow", "pygments")
+
+    def run_cli(self, *args):
+        """
+        Runs the CLI with -X importtime in a fresh interpreter.
+        :return: Tuple of (names of imported modules, total import time in
+            milliseconds).
+        """
+        code = f"from shutterstock.cli import cli; cli({list(args)!r})"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        modules = set()
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            modules.add(name.strip())
+            if not name.startswith("  "):
+                total += int(cumulative)
+        return modules, total / 1000
+
+    def check(self, *args):
+        modules, total = self.run_cli(*args)
+        self.assertFalse({m.split(".")[0] for m in modules} & set(self.heavy))
+        self.assertLess(total, self.budget_ms)
+
+    def test_help(self):
+        """
+        Asserts --help does not import the network stack and stays within budget.
+        """
+        self.check("--help")
+        self.check("images", "get-image", "--help")
+
+    def test_argument_error(self):
+        """
+        Asserts argument errors do not import the network stack and stay within budget.
+        """
+        self.check("images", "get-image")
+
+
+class RegistryTests(unittest.TestCase):
+    """
+    Endpoint Registry Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.runner = CliRunner()
+        self.directory = tempfile.TemporaryDirectory()
+        self.payload = os.path.join(self.directory.name, "payload.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_path_arguments_are_declared(self):
+        """
+        Asserts every argument in a path is an argument of its command.
+        """
+        for endpoints in index().values():
+            for endpoint in endpoints.values():
+                names = {argument.replace("-", "_") for argument in endpoint.arguments}
+                for field in re.findall("{(\\w+)}", endpoint.path):
+                    self.assertIn(field, names, endpoint.name)
+
+    @patch("requests.Session.request")
+    def test_command_with_path_argument(self, mock_request):
+        """
+        Asserts path arguments are filled in and options are sent as parameters.
+        """
+        mock_request.return_value = make_response()
+        command = build_command(index()["images"]["list-similar-images"])
+        result = self.runner.invoke(command, ["123", "--language", "fr"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            mock_request.call_args.kwargs["url"],
+            "https://api.shutterstock.com/v2/images/123/similar",
+        )
+        self.assertEqual(mock_request.call_args.kwargs["params"]["language"], "fr")
+
+    @patch("requests.Session.request")
+    def test_command_with_data_file(self, mock_request):
+        """
+        Asserts data files are sent as the body, with the idempotency key as a header.
+        """
+        mock_request.return_value = make_response()
+        command = build_command(index()["videos"]["license-videos"])
+        with open(self.payload, "w", encoding="UTF-8") as payload:
+            payload.write('{"videos": [{"video_id": "1"}]}')
+        result = self.runner.invoke(command, [self.payload, "--idempotency-key", "abc"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(mock_request.call_args.args[0], "POST")
+        self.assertEqual(mock_request.call_args.kwargs["json"], {"videos": [{"video_id": "1"}]})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Idempotency-Key"], "abc")
+        self.assertNotIn("idempotency_key", mock_request.call_args.kwargs["params"])
+
+    @patch("requests.Session.request")
+    def test_idempotency_key_is_sent_once(self, mock_request):
+        """
+        Asserts a key that got a response is refused without sending a request,
+        unless the API rejected its request with a client error.
+        """
+        command = build_command(index()["images"]["license-images"])
+        with open(self.payload, "w", encoding="UTF-8") as payload:
+            payload.write('{"images": [{"image_id": "1"}]}')
+        args = [self.payload, "--idempotency-key", "batch-1"]
+        with patch.dict(os.environ, {"SHUTTERSTOCK_CLI_CACHE_DIR": self.directory.name}):
+            mock_request.return_value = make_response(400)
+            self.runner.invoke(command, args)
+            mock_request.return_value = make_response()
+            self.assertEqual(self.runner.invoke(command, args).exit_code, 0)
+            result = self.runner.invoke(command, args)
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("batch-1 was already sent", result.output)
+        self.assertIn("got a 200 response", result.output)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.request")
+    def test_invalid_data_file(self, mock_request):
+        """
+        Asserts an invalid data file is reported without sending a request.
+        """
+        command = build_command(index()["ai-audio"]["create-audio-renders"])
+        with open(self.payload, "w", encoding="UTF-8") as payload:
+            payload.write("{")
+        result = self.runner.invoke(command, [self.payload])
+        self.assertIn("Error loading JSON file", result.output)
+        mock_request.assert_not_called()
+
+
+class PageTests(unittest.TestCase):
+    """
+    Paged Search Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.runner = CliRunner()
+
+    def tearDown(self) -> None:
+        settings.format = "json"
+
+    @staticmethod
+    def serve_pages(pages):
+        """
+        Answers each page after a delay that makes later pages finish first.
+        """
+
+        def request(method, url, params, **kwargs):
+            number = params.get("page") or 1
+            time.sleep(0.01 * (len(pages) - number))
+            body = {"page": number, "per_page": 2, "total_count": 6, "data": pages[number - 1]}
+            return make_response(content=json.dumps(body).encode())
+
+        return request
+
+    @patch("requests.Session.request")
+    def test_all_pages(self, mock_request):
+        """
+        Asserts every page is fetched and written in order, without duplicates.
+        """
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "2"}, {"id": "3"}], [{"id": "4"}, {"id": "5"}]]
+        mock_request.side_effect = self.serve_pages(pages)
+        command = build_command(index()["images"]["search-images"])
+        result = self.runner.invoke(command, ["--query", "boat", "--per-page", "2", "--all-pages"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            json.loads(result.output),
+            {"data": [{"id": str(number)} for number in range(1, 6)], "total_count": 6},
+        )
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_request.call_args.kwargs["params"]["query"], "boat")
+
+    @patch("requests.Session.request")
+    def test_max_results(self, mock_request):
+        """
+        Asserts --max-results stops fetching pages once it has enough results.
+        """
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}, {"id": "4"}], [{"id": "5"}, {"id": "6"}]]
+        mock_request.side_effect = self.serve_pages(pages)
+        settings.format = "ndjson"
+        command = build_command(index()["videos"]["search-videos"])
+        result = self.runner.invoke(command, ["--max-results", "3"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output, '{"id":"1"}\n{"id":"2"}\n{"id":"3"}\n')
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.request")
+    def test_cursor_pages(self, mock_request):
+        """
+        Asserts cursor searches follow the next cursor until the last page.
+        """
+        bodies = {
+            None: {"total_count": 3, "next": "b", "data": [{"id": "1"}, {"id": "2"}]},
+            "b": {"total_count": 3, "next": "c", "data": [{"id": "3"}]},
+            "c": {"total_count": 3, "data": []},
+        }
+        mock_request.side_effect = lambda method, url, params, **kwargs: make_response(
+            content=json.dumps(bodies[params.get("cursor")]).encode()
+        )
+        command = build_command(index()["editorial"]["search-editorial-images"])
+        result = self.runner.invoke(command, ["--query", "boat", "--all-pages"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            json.loads(result.output),
+            {"data": [{"id": "1"}, {"id": "2"}, {"id": "3"}], "total_count": 3},
+        )
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request")
+    def test_failed_page(self, mock_request):
+        """
+        Asserts a failed page ends the command with an error.
+        """
+        mock_request.return_value = make_response(status_code=403, content=b'{"message": "no"}')
+        command = build_command(index()["audio"]["search-tracks"])
+        result = self.runner.invoke(command, ["--all-pages"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("403", result.output)
+
+
+class CursorFeedTests(unittest.TestCase):
+    """
+    Cursor Feed Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.runner = CliRunner()
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, "crawl.json")
+        self.bodies = {
+            None: {"total_count": 3, "next": "b", "data": [{"id": "1"}]},
+            "b": {"total_count": 3, "next": "c", "data": [{"id": "2"}]},
+            "c": {"total_count": 3, "next": "d", "data": [{"id": "3"}]},
+            "d": {"total_count": 3, "data": []},
+        }
+        self.failing = set()
+
+    def tearDown(self) -> None:
+        settings.format = "json"
+        self.directory.cleanup()
+
+    def serve(self, method, url, params, **kwargs):
+        """
+        Answers the page of a cursor, or 403 for the cursors in self.failing.
+        """
+        cursor = params.get("cursor")
+        if cursor in self.failing:
+            return make_response(status_code=403, content=b"{}")
+        return make_response(content=json.dumps(self.bodies[cursor]).encode())
+
+    @patch("requests.Session.request")
+    def test_next_page_is_prefetched(self, mock_request):
+        """
+        Asserts the next page is requested before the current one is consumed.
+        """
+        requested = threading.Event()
+
+        def serve(method, url, params, **kwargs):
+            if params.get("cursor") == "b":
+                requested.set()
+            return self.serve(method, url, params, **kwargs)
+
+        mock_request.side_effect = serve
+        pages = iter_cursor_pages("/v2/editorial/images/updated", {}, {})
+        self.assertEqual(next(pages)["data"], [{"id": "1"}])
+        self.assertTrue(requested.wait(5))
+        self.assertEqual([page["data"] for page in pages], [[{"id": "2"}], [{"id": "3"}], []])
+
+    @patch("requests.Session.request")
+    def test_checkpoint_resumes_crawl(self, mock_request):
+        """
+        Asserts an interrupted crawl resumes from the cursor saved in its checkpoint.
+        """
+        mock_request.side_effect = self.serve
+        settings.format = "ndjson"
+        command = build_command(index()["editorial"]["get-updated-editorial-images"])
+        arguments = ["--type", "edit", "--checkpoint", self.checkpoint]
+        self.failing = {"c"}
+        result = self.runner.invoke(command, arguments)
+        self.assertEqual(result.exit_code, 1)
+        self.assertTrue(result.output.startswith('{"id":"1"}\n{"id":"2"}\n'))
+        with open(self.checkpoint, encoding="UTF-8") as checkpoint:
+            self.assertEqual(json.load(checkpoint)["cursor"], "c")
+
+        self.failing = set()
+        result = self.runner.invoke(command, arguments)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output, '{"id":"3"}\n')
+        self.assertEqual(mock_request.call_args.kwargs["params"]["type"], "edit")
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_checkpoint_requires_ndjson(self):
+        """
+        Asserts checkpoints are refused for formats that cannot be appended to.
+        """
+        command = build_command(index()["editorial"]["get-updated-editorial-images"])
+        result = self.runner.invoke(command, ["--checkpoint", self.checkpoint])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("--format ndjson", result.output)
+
+
+class ShardTests(unittest.TestCase):
+    """
+    Time Window Sharding Tests
+    """
+
+    def setUp(self) -> None:
+        os.environ["SHUTTERSTOCK_API_TOKEN"] = "a"
+        os.environ.pop("SHUTTERSTOCK_SANDBOX", None)
+        self.runner = CliRunner()
+
+    def tearDown(self) -> None:
+        settings.format = "json"
+
+    def test_windows(self):
+        """
+        Asserts a range is split into consecutive windows of at least 5 minutes.
+        """
+        self.assertEqual(
+            shard_windows("2024-01-01T00:00:00Z", "2024-01-01T00:12:00", 10),
+            [
+                ("2024-01-01T00:00:00", "2024-01-01T00:06:00"),
+                ("2024-01-01T00:06:00", "2024-01-01T00:12:00"),
+            ],
+        )
+        windows = shard_windows("2024-01-01", "2024-01-08", 7)
+        self.assertEqual([start for start, _ in windows][1:], [end for _, end in windows][:-1])
+        self.assertEqual(windows[3], ("2024-01-04T00:00:00", "2024-01-05T00:00:00"))
+
+    @patch("requests.Session.request")
+    def test_sharded_feed(self, mock_request):
+        """
+        Asserts every page of every window is fetched, and records are merged in
+        window order without duplicate ids and update times.
+        """
+        windows = {
+            "2024-01-01T00:00:00": [
+                [{"id": "1", "updated_time": "a"}],
+                [{"id": "2", "updated_time": "a"}],
+            ],
+            "2024-01-01T00:05:00": [
+                [{"id": "2", "updated_time": "a"}],
+                [{"id": "2", "updated_time": "b"}],
+            ],
+        }
+
+        def serve(method, url, params, **kwargs):
+            pages = windows[params["start_date"]]
+            body = {"per_page": 1, "total_count": len(pages), "data": pages[params["page"] - 1]}
+            return make_response(content=json.dumps(body).encode())
+
+        mock_request.side_effect = serve
+        settings.format = "ndjson"
+        command = build_command(index()["images"]["get-updated-images"])
+        result = self.runner.invoke(
+            command,
+            ["--start-date", "2024-01-01", "--end-date", "2024-01-01T00:10:00", "--shards", "4"],
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            [json.loads(line) for line in result.output.splitlines()],
+            [
+                {"id": "1", "updated_time": "a"},
+                {"id": "2", "updated_time": "a"},
+                {"id": "2", "updated_time": "b"},
+            ],
+        )
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_shards_require_dates(self):
+        """
+        Asserts sharding is refused without a range or with a range under 5 minutes.
+        """
+        command = build_command(index()["videos"]["get-updated-videos"])
+        result = self.runner.invoke(command, ["--shards", "4"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("--start-date", result.output)
+        result = self.runner.invoke(
+            command,
+            ["--start-date", "2024-01-01T00:00:00", "--end-date", "2024-01-01T00:04:00", "--shards", "2"],
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("5 minutes", result.output)
+
+
+class ServeTests(unittest.TestCase):
+    """
+    Daemon Tests
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "serve.sock")
+        self.server = listen(self.path)
+        self.thread = threading.Thread(target=serve_forever, args=(self.server,))
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown(socket.SHUT_RDWR)
+        self.server.close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def run_client(self, argv, environ=None):
+        """
+        :return: Tuple of (exit code, stdout, stderr).
+        """
+        stdout = io.BytesIO()
+        stderr = io.BytesIO()
+        with client.connect(self.path) as conn:
+            code = client.run(conn, argv, environ or {}, None, stdout, stderr)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_help(self):
+        """
+        Asserts the output and exit code of a command are sent back.
+        """
+        code, stdout, _ = self.run_client(["images", "get-image", "--help"])
+        self.assertEqual(code, 0)
+        self.assertIn(b"Usage: shutterstock images get-image", stdout)
+
+    def test_usage_error(self):
+        """
+        Asserts errors are written to stderr with the exit code of click.
+        """
+        code, _, stderr = self.run_client(["images", "no-such-command"])
+        self.assertEqual(code, 2)
+        self.assertIn(b"No such command", stderr)
+
+    def test_malformed_request(self):
+        """
+        Asserts a malformed request is refused and the daemon keeps serving.
+        """
+        for payload in (b"abc", b'{"argv": []}', b'{"argv": [1], "cwd": "/", "env": {}, "tty": {}}'):
+            with client.connect(self.path) as conn:
+                client.send_frame(conn, client.REQUEST, payload)
+                frames = [client.recv_frame(conn), client.recv_frame(conn)]
+            self.assertEqual(frames[0][0], client.STDERR)
+            self.assertEqual(frames[1], (client.EXIT, b"2"))
+        code, _, _ = self.run_client(["images", "--help"])
+        self.assertEqual(code, 0)
+
+    @patch("requests.Session.request")
+    def test_stats_are_reported_per_command(self, mock_request):
+        """
+        Asserts a client that sets SHUTTERSTOCK_CLI_STATS gets the counters of its
+        own command, which are then reset.
+        """
+        mock_request.return_value = make_response(content=b'{"id": "1"}')
+        environ = {"SHUTTERSTOCK_API_TOKEN": "a", "SHUTTERSTOCK_CLI_STATS": "true"}
+        _, _, first = self.run_client(["images", "get-image", "1"], environ)
+        _, _, second = self.run_client(["images", "get-image", "1"], environ)
+        self.assertIn(b"retry.attempts: 1\n", first)
+        self.assertEqual(first, second)
+        self.assertFalse(STATS)
+
+    def test_workers_answer_clients_concurrently(self):
+        """
+        Asserts a client holding one worker does not hold up the others.
+        """
+        path = os.path.join(self.directory.name, "workers.sock")
+        server = listen(path)
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+            try:
+                run_workers(server, 2)
+            finally:
+                os._exit(0)
+        server.close()
+        try:
+            with client.connect(path) as idle, client.connect(path) as conn:
+                conn.settimeout(5)
+                stdout = io.BytesIO()
+                code = client.run(conn, ["images", "--help"], {}, None, stdout, stdout)
+                self.assertIsNotNone(idle)
+            self.assertEqual(code, 0)
+            self.assertIn(b"Usage: shutterstock images", stdout.getvalue())
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+
+    @patch("requests.Session.request")
+    def test_credentials_are_forwarded(self, mock_request):
+        """
+        Asserts each command runs with the credentials of its client, and the
+        environment of the daemon is restored afterwards.
+        """
+        mock_request.return_value = make_response(content=b'{"id": "1"}')
+        token = os.environ.get("SHUTTERSTOCK_API_TOKEN")
+        code, stdout, _ = self.run_client(
+            ["images", "get-image", "1"], {"SHUTTERSTOCK_API_TOKEN": "client-token"}
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(stdout), {"id": "1"})
+        self.assertEqual(
+            mock_request.call_args.kwargs["headers"]["Authorization"], "Bearer client-token"
+        )
+        self.assertEqual(os.environ.get("SHUTTERSTOCK_API_TOKEN"), token)
+
+    def test_no_daemon(self):
+        """
+        Asserts connecting without a daemon returns None.
+        """
+        self.assertIsNone(client.connect(os.path.join(self.directory.name, "none.sock")))
+
+
+class CompletionTests(unittest.TestCase):
+    """
+    Shell Completion Tests
+    """
+
+    def setUp(self) -> None:
+        self.index = complete.refresh_choices(complete.build_index())
+
+    def tearDown(self) -> None:
+        for name in os.listdir(complete.cache_dir("responses")):
+            os.remove(os.path.join(complete.cache_dir("responses"), name))
+
+    def test_commands_and_options(self):
+        """
+        Asserts groups, commands, options and choices are completed.
+        """
+        self.assertEqual(complete.complete(self.index, [], "vid"), ["videos"])
+        self.assertIn("get-image", complete.complete(self.index, ["images"], "get-im"))
+        self.assertEqual(complete.complete(self.index, ["images", "search-images"], "--per-p"), ["--per-page"])
+        self.assertEqual(complete.complete(self.index, ["--format"], "nd"), ["ndjson"])
+        self.assertIn("images", complete.complete(self.index, ["--format", "csv"], ""))
+
+    def test_cached_names(self):
+        """
+        Asserts option values are completed with names from the response cache.
+        """
+        cache = ResponseCache(complete.cache_dir("responses"), 10**6)
+        res = make_response(content=b'{"data": [{"id": "1", "name": "Animals/Wildlife"}, {"id": "2", "name": "Arts"}]}')
+        cache.set("key", "/v2/images/categories", res)
+        index = complete.refresh_choices(self.index)
+        self.assertEqual(
+            complete.complete(index, ["images", "search-images", "--category"], "A"),
+            ["Animals/Wildlife", "Arts"],
+        )
+
+    def test_other_responses_do_not_refresh_names(self):
+        """
+        Asserts caching responses other than reference data leaves the completion stamp unchanged.
+        """
+        cache = ResponseCache(complete.cache_dir("responses"), 10**6)
+        cache.set("key", "/v2/images/categories", make_response(content=b'{"data": [{"name": "Arts"}]}'))
+        stamp = complete.responses_stamp()
+        self.assertNotEqual(stamp, 0)
+        cache.set("other", "/v2/images/1", make_response(content=b'{"id": "1"}'))
+        self.assertEqual(complete.responses_stamp(), stamp)
+        with patch.object(ResponseCache, "get", wraps=cache.get) as get:
+            self.assertEqual(complete.cached_names(), {"/v2/images/categories": ["Arts"]})
+        self.assertEqual([call.args[-1] for call in get.call_args_list], ["key"])
+
+    def test_completion_does_not_import_click(self):
+        """
+        Asserts completing from an up-to-date index imports neither click nor the commands.
+        """
+        complete.store(self.index)
+        code = (
+            "import sys; from shutterstock import complete; complete.main();"
+            "assert 'click' not in sys.modules and 'shutterstock.cli' not in sys.modules"
+        )
+        env = dict(os.environ, COMP_WORDS="shutterstock images get-im", COMP_CWORD="2")
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True
+        )
+        self.assertIn("get-image\n", result.stdout)